@@ -82,10 +82,7 @@ class ParticleDescriptor(object) :
         return self.to_string()
 
     def conjugate(self) :
-        if self.particle.charge != 0 :
-            conjid = -1 * self.particle.pdgid
-        else :
-            conjid = self.particle.pdgid
+        conjid = particledb.find_cc(self.particle).pdgid
         return ParticleDescriptor(conjid, cc = self.cc,
                                    daughters = tuple(daughter.conjugate() for daughter \
                                                          in self.daughters))
@@ -1,15 +1,48 @@
 '''Annoyingly there seems to be no way to access the particle database
 in the LHCb software without starting an LHCbApp and accessing the
-particleSvc through it, so this packages it in a more portable format.'''
+particleSvc through it, so this packages it in a more portable format.
 
-try :
-    from ParticleList import particlelist
-except ImportError :
-    # In case the particle list hasn't been made yet.
-    particlelist = []
-import os, pprint
+The particles are stored in ParticleList.csv, which is only read the first
+time a particle is looked up.'''
+
+from AnalysisUtils.DecayDescriptors.ParticleInfo import ParticleInfo
+import os, csv
+
+def particle_list_file_name() :
+    '''Get the name of the file containing the particle list.'''
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ParticleList.csv')
+
+# Types of the columns in the particle list file.
+_columntypes = {'name' : str, 'geantid' : int, 'pdgid' : int, 'charge' : float, 'mass' : float,
+                'lifetime' : float, 'evtgenname' : str, 'pythiaid' : int, 'maxwidth' : float}
+
+def write_particle_list(particles, fname = None) :
+    '''Write a list of ParticleInfos to the particle list file. Floats are written with repr
+    so they're read back exactly.'''
+    if not fname :
+        fname = particle_list_file_name()
+    with open(fname, 'w') as f :
+        writer = csv.writer(f, lineterminator = '\n')
+        writer.writerow(ParticleInfo.__slots__)
+        for part in particles :
+            vals = [getattr(part, attr) for attr in ParticleInfo.__slots__]
+            writer.writerow([repr(val) if isinstance(val, float) else str(val) for val in vals])
+
+def read_particle_list(fname = None) :
+    '''Read the list of ParticleInfos from the particle list file. Raises an IOError if the
+    file doesn't exist, rather than giving an empty list, as then no particles would be found.'''
+    if not fname :
+        fname = particle_list_file_name()
+    if not os.path.exists(fname) :
+        raise IOError('Particle list file {0!r} doesn\'t exist! Check it\'s installed, or make it '
+                      'with update_particle_list.'.format(fname))
+    with open(fname) as f :
+        return [ParticleInfo(**{attr : _columntypes[attr](val) for attr, val in row.iteritems()}) \
+                    for row in csv.DictReader(f)]
 
 def update_particle_list() :
+    '''Make the particle list file from the LHCb particle property service. This doesn't read
+    the existing file, so it can be used to make it for the first time.'''
     import PartProp.PartPropAlg
     import PartProp.Service
     from   GaudiPython.Bindings import AppMgr
@@ -19,26 +52,65 @@ def update_particle_list() :
     pps   = gaudi.ppSvc()
     particles = [from_lhcb_property(part) for part in pps.all()]
 
-    with open(os.path.join(os.environ['ANALYSISUTILSROOT'], 'python',
-                           'AnalysisUtils', 'DecayDescriptors', 'ParticleList.py'), 'w') as f :
-        f.write('from AnalysisUtils.DecayDescriptors.ParticleInfo import ParticleInfo\n')
-        f.write('particlelist = \\\n' + pprint.pformat(particles) + '\n')
-        
+    write_particle_list(particles, os.path.join(os.environ['ANALYSISUTILSROOT'], 'python',
+                                                'AnalysisUtils', 'DecayDescriptors', 'ParticleList.csv'))
+    particledb.reset()
+
 class ParticleDB(object) :
-    __slots__ = ('particlelist',)
+    '''Particle properties indexed by name and PDG id. If no particle list is given,
+    it's read from the particle list file on first use.'''
+    __slots__ = ('fname', '_particlelist', '_byname', '_bypdgid')
 
-    def __init__(self, particlelist) :
-        self.particlelist = list(particlelist)
+    def __init__(self, particlelist = None, fname = None) :
+        self.fname = fname
+        self.reset(particlelist)
+
+    def reset(self, particlelist = None) :
+        '''Set the particle list, or, if None, clear it so it's reloaded from the file
+        on next use.'''
+        self._particlelist = None
+        self._byname = None
+        self._bypdgid = None
+        if particlelist is not None :
+            self._build(list(particlelist))
+
+    def _build(self, particlelist) :
+        '''Build the indices. If names or PDG ids are repeated the first particle is used.'''
+        self._particlelist = particlelist
+        self._byname = {}
+        self._bypdgid = {}
+        for part in particlelist :
+            self._byname.setdefault(part.name, part)
+            self._bypdgid.setdefault(part.pdgid, part)
+
+    def _load(self) :
+        '''Load the particle list from the file if it's not loaded already.'''
+        if self._particlelist is None :
+            self._build(read_particle_list(self.fname))
+
+    @property
+    def particlelist(self) :
+        '''The list of ParticleInfos.'''
+        self._load()
+        return self._particlelist
 
     def find_particle(self, partid) :
-        if isinstance(partid, int) :
-            matches = filter(lambda part : (part.pdgid == partid), 
-                             self.particlelist)
-        else :
-            matches = filter(lambda part : (part.name == partid),
-                             self.particlelist)
-        if matches :
-            return matches[0]
-        return None
-
-particledb = ParticleDB(particlelist)
+        '''Find a particle by PDG id (if partid is an int) or name. Returns None if
+        it's not found.'''
+        self._load()
+        if isinstance(partid, (int, long)) :
+            return self._bypdgid.get(partid, None)
+        return self._byname.get(partid, None)
+
+    def find_cc(self, partid) :
+        '''Find the charge conjugate of a particle, by PDG id, name or ParticleInfo. Particles
+        that are their own antiparticle are returned as is. Returns None if the particle
+        isn't found.'''
+        if not isinstance(partid, ParticleInfo) :
+            partid = self.find_particle(partid)
+            if not partid :
+                return None
+        self._load()
+        return self._bypdgid.get(-partid.pdgid, partid)
+
+particledb = ParticleDB()
@@ -1,964 +0,0 @@
-from AnalysisUtils.DecayDescriptors.ParticleInfo import ParticleInfo
-particlelist = \
-[ParticleInfo(name = 'anti-d', geantid = -1, pdgid = -1, charge = 0.3, mass = 9.9, lifetime = 0.0, evtgenname = 'anti-d', pythiaid = -1, maxwidth = 0.0),
- ParticleInfo(name = 'd', geantid = 1, pdgid = 1, charge = -0.3, mass = 9.9, lifetime = 0.0, evtgenname = 'd', pythiaid = 1, maxwidth = 0.0),
- ParticleInfo(name = 'anti-u', geantid = -2, pdgid = -2, charge = -0.7, mass = 5.6, lifetime = 0.0, evtgenname = 'anti-u', pythiaid = -2, maxwidth = 0.0),
- ParticleInfo(name = 'u', geantid = 2, pdgid = 2, charge = 0.7, mass = 5.6, lifetime = 0.0, evtgenname = 'u', pythiaid = 2, maxwidth = 0.0),
- ParticleInfo(name = 'anti-s', geantid = -3, pdgid = -3, charge = 0.3, mass = 199.0, lifetime = 0.0, evtgenname = 'anti-s', pythiaid = -3, maxwidth = 0.0),
- ParticleInfo(name = 's', geantid = 3, pdgid = 3, charge = -0.3, mass = 199.0, lifetime = 0.0, evtgenname = 's', pythiaid = 3, maxwidth = 0.0),
- ParticleInfo(name = 'anti-c', geantid = -4, pdgid = -4, charge = -0.7, mass = 1350.0, lifetime = 0.0, evtgenname = 'anti-c', pythiaid = -4, maxwidth = 0.0),
- ParticleInfo(name = 'c', geantid = 4, pdgid = 4, charge = 0.7, mass = 1350.0, lifetime = 0.0, evtgenname = 'c', pythiaid = 4, maxwidth = 0.0),
- ParticleInfo(name = 'anti-b', geantid = -5, pdgid = -5, charge = 0.3, mass = 5000.0, lifetime = 0.0, evtgenname = 'anti-b', pythiaid = -5, maxwidth = 0.0),
- ParticleInfo(name = 'b', geantid = 5, pdgid = 5, charge = -0.3, mass = 5000.0, lifetime = 0.0, evtgenname = 'b', pythiaid = 5, maxwidth = 0.0),
- ParticleInfo(name = 'anti-t', geantid = -6, pdgid = -6, charge = -0.7, mass = 173500.0, lifetime = 3.2910610000000004e-25, evtgenname = 'anti-t', pythiaid = -6, maxwidth = 0.0),
- ParticleInfo(name = 't', geantid = 6, pdgid = 6, charge = 0.7, mass = 173500.0, lifetime = 3.2910610000000004e-25, evtgenname = 't', pythiaid = 6, maxwidth = 0.0),
- ParticleInfo(name = "anti-b'", geantid = -7, pdgid = -7, charge = 0.3, mass = 400000.0, lifetime = 0.0, evtgenname = "anti-b'", pythiaid = -7, maxwidth = 0.0),
- ParticleInfo(name = "b'", geantid = 7, pdgid = 7, charge = -0.3, mass = 400000.0, lifetime = 0.0, evtgenname = "b'", pythiaid = 7, maxwidth = 0.0),
- ParticleInfo(name = "anti-t'", geantid = -8, pdgid = -8, charge = -0.7, mass = 500000.0, lifetime = 0.0, evtgenname = "anti-t'", pythiaid = -8, maxwidth = 0.0),
- ParticleInfo(name = "t'", geantid = 8, pdgid = 8, charge = 0.7, mass = 500000.0, lifetime = 0.0, evtgenname = "t'", pythiaid = 8, maxwidth = 0.0),
- ParticleInfo(name = 'e+', geantid = -11, pdgid = -11, charge = 1.0, mass = 0.5109999999999999, lifetime = 1.0000000000000002e+16, evtgenname = 'e+', pythiaid = -11, maxwidth = 0.0),
- ParticleInfo(name = 'e-', geantid = 11, pdgid = 11, charge = -1.0, mass = 0.5109999999999999, lifetime = 1.0000000000000002e+16, evtgenname = 'e-', pythiaid = 11, maxwidth = 0.0),
- ParticleInfo(name = 'nu_e~', geantid = -12, pdgid = -12, charge = 0.0, mass = 0.0, lifetime = 1.0000000000000002e+16, evtgenname = 'anti-nu_e', pythiaid = -12, maxwidth = 0.0),
- ParticleInfo(name = 'nu_e', geantid = 12, pdgid = 12, charge = 0.0, mass = 0.0, lifetime = 1.0000000000000002e+16, evtgenname = 'nu_e', pythiaid = 12, maxwidth = 0.0),
- ParticleInfo(name = 'mu+', geantid = -13, pdgid = -13, charge = 1.0, mass = 105.65837, lifetime = 2.1969810000000004e-06, evtgenname = 'mu+', pythiaid = -13, maxwidth = 0.0),
- ParticleInfo(name = 'mu-', geantid = 13, pdgid = 13, charge = -1.0, mass = 105.65837, lifetime = 2.1969810000000004e-06, evtgenname = 'mu-', pythiaid = 13, maxwidth = 0.0),
- ParticleInfo(name = 'nu_mu~', geantid = -14, pdgid = -14, charge = 0.0, mass = 0.0, lifetime = 1.0000000000000002e+16, evtgenname = 'anti-nu_mu', pythiaid = -14, maxwidth = 0.0),
- ParticleInfo(name = 'nu_mu', geantid = 14, pdgid = 14, charge = 0.0, mass = 0.0, lifetime = 1.0000000000000002e+16, evtgenname = 'nu_mu', pythiaid = 14, maxwidth = 0.0),
- ParticleInfo(name = 'tau+', geantid = -15, pdgid = -15, charge = 1.0, mass = 1776.8200000000002, lifetime = 2.9030000000000004e-13, evtgenname = 'tau+', pythiaid = -15, maxwidth = 0.0),
- ParticleInfo(name = 'tau-', geantid = 15, pdgid = 15, charge = -1.0, mass = 1776.8200000000002, lifetime = 2.9030000000000004e-13, evtgenname = 'tau-', pythiaid = 15, maxwidth = 0.0),
- ParticleInfo(name = 'nu_tau~', geantid = -16, pdgid = -16, charge = 0.0, mass = 0.0, lifetime = 1.0000000000000002e+16, evtgenname = 'anti-nu_tau', pythiaid = -16, maxwidth = 0.0),
- ParticleInfo(name = 'nu_tau', geantid = 16, pdgid = 16, charge = 0.0, mass = 0.0, lifetime = 1.0000000000000002e+16, evtgenname = 'nu_tau', pythiaid = 16, maxwidth = 0.0),
- ParticleInfo(name = 'L+', geantid = -17, pdgid = -17, charge = 1.0, mass = 400000.0, lifetime = 0.0, evtgenname = 'L+', pythiaid = -17, maxwidth = 0.0),
- ParticleInfo(name = 'L-', geantid = 17, pdgid = 17, charge = -1.0, mass = 400000.0, lifetime = 0.0, evtgenname = 'L-', pythiaid = 17, maxwidth = 0.0),
- ParticleInfo(name = 'anti-nu_L', geantid = -18, pdgid = -18, charge = 0.0, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-nu_L', pythiaid = -18, maxwidth = 0.0),
- ParticleInfo(name = 'nu_L', geantid = 18, pdgid = 18, charge = 0.0, mass = 0.0, lifetime = 0.0, evtgenname = 'nu_L', pythiaid = 18, maxwidth = 0.0),
- ParticleInfo(name = 'g', geantid = 21, pdgid = 21, charge = 0.0, mass = 0.0, lifetime = 1.0000000000000002e+16, evtgenname = 'g', pythiaid = 21, maxwidth = 0.0),
- ParticleInfo(name = 'gamma', geantid = 22, pdgid = 22, charge = 0.0, mass = 0.0, lifetime = 1.0000000000000002e+16, evtgenname = 'gamma', pythiaid = 22, maxwidth = 0.0),
- ParticleInfo(name = 'Z0', geantid = 23, pdgid = 23, charge = 0.0, mass = 91187.6, lifetime = 2.637914e-25, evtgenname = 'Z0', pythiaid = 23, maxwidth = 0.0),
- ParticleInfo(name = 'W-', geantid = -24, pdgid = -24, charge = -1.0, mass = 80385.0, lifetime = 3.156893e-25, evtgenname = 'W-', pythiaid = -24, maxwidth = 0.0),
- ParticleInfo(name = 'W+', geantid = 24, pdgid = 24, charge = 1.0, mass = 80385.0, lifetime = 3.156893e-25, evtgenname = 'W+', pythiaid = 24, maxwidth = 0.0),
- ParticleInfo(name = 'H_10', geantid = 25, pdgid = 25, charge = 0.0, mass = 125700.0, lifetime = 9.400000000000001e-26, evtgenname = 'Higgs0', pythiaid = 25, maxwidth = 0.0),
- ParticleInfo(name = "Z'0", geantid = 32, pdgid = 32, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = "Z'0", pythiaid = 32, maxwidth = 0.0),
- ParticleInfo(name = "Z''0", geantid = 33, pdgid = 33, charge = 0.0, mass = 900000.0, lifetime = 0.0, evtgenname = "Z''0", pythiaid = 33, maxwidth = 0.0),
- ParticleInfo(name = "W'-", geantid = -34, pdgid = -34, charge = -1.0, mass = 500000.0, lifetime = 0.0, evtgenname = "W'-", pythiaid = -34, maxwidth = 0.0),
- ParticleInfo(name = "W'+", geantid = 34, pdgid = 34, charge = 1.0, mass = 500000.0, lifetime = 0.0, evtgenname = "W'+", pythiaid = 34, maxwidth = 0.0),
- ParticleInfo(name = 'H_20', geantid = 35, pdgid = 35, charge = 0.0, mass = 310000.0, lifetime = 9.400000000000001e-26, evtgenname = "Higgs'0", pythiaid = 35, maxwidth = 0.0),
- ParticleInfo(name = 'H_30', geantid = 36, pdgid = 36, charge = 0.0, mass = 310000.0, lifetime = 9.400000000000001e-26, evtgenname = 'A0', pythiaid = 36, maxwidth = 0.0),
- ParticleInfo(name = 'H-', geantid = -37, pdgid = -37, charge = -1.0, mass = 310000.0, lifetime = 9.400000000000001e-26, evtgenname = 'Higgs-', pythiaid = -37, maxwidth = 0.0),
- ParticleInfo(name = 'H+', geantid = 37, pdgid = 37, charge = 1.0, mass = 310000.0, lifetime = 9.400000000000001e-26, evtgenname = 'Higgs+', pythiaid = 37, maxwidth = 0.0),
- ParticleInfo(name = 'Graviton', geantid = 39, pdgid = 39, charge = 0.0, mass = 0.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 39, maxwidth = 0.0),
- ParticleInfo(name = 'anti-R0', geantid = -41, pdgid = -41, charge = 0.0, mass = 5000000.0, lifetime = 0.0, evtgenname = 'anti-R0', pythiaid = -41, maxwidth = 0.0),
- ParticleInfo(name = 'R0', geantid = 41, pdgid = 41, charge = 0.0, mass = 5000000.0, lifetime = 0.0, evtgenname = 'R0', pythiaid = 41, maxwidth = 0.0),
- ParticleInfo(name = 'LQ_uebar', geantid = -42, pdgid = -42, charge = 0.3, mass = 200000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -42, maxwidth = 0.0),
- ParticleInfo(name = 'LQ_ue', geantid = 42, pdgid = 42, charge = -0.3, mass = 200000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 42, maxwidth = 0.0),
- ParticleInfo(name = 'Xu0', geantid = 43, pdgid = 43, charge = 0.0, mass = 1000.0, lifetime = 0.0, evtgenname = 'Xu0', pythiaid = 43, maxwidth = 0.0),
- ParticleInfo(name = 'Xu-', geantid = -44, pdgid = -44, charge = -1.0, mass = 1000.0, lifetime = 0.0, evtgenname = 'Xu-', pythiaid = -44, maxwidth = 0.0),
- ParticleInfo(name = 'Xu+', geantid = 44, pdgid = 44, charge = 1.0, mass = 1000.0, lifetime = 0.0, evtgenname = 'Xu+', pythiaid = 44, maxwidth = 0.0),
- ParticleInfo(name = 'specflav', geantid = 81, pdgid = 81, charge = 0.0, mass = 0.0, lifetime = 0.0, evtgenname = 'specflav', pythiaid = 81, maxwidth = 0.0),
- ParticleInfo(name = 'anti-rndmflav', geantid = -82, pdgid = -82, charge = 0.0, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-rndmflav', pythiaid = -82, maxwidth = 0.0),
- ParticleInfo(name = 'rndmflav', geantid = 82, pdgid = 82, charge = 0.0, mass = 0.0, lifetime = 0.0, evtgenname = 'rndmflav', pythiaid = 82, maxwidth = 0.0),
- ParticleInfo(name = 'phasespa', geantid = 83, pdgid = 83, charge = 0.0, mass = 1000.0, lifetime = 0.0, evtgenname = 'phasespa', pythiaid = 83, maxwidth = 0.0),
- ParticleInfo(name = 'anti-c-hadron', geantid = -84, pdgid = -84, charge = -0.7, mass = 2000.0, lifetime = 3.335641e-13, evtgenname = 'anti-c-hadron', pythiaid = -84, maxwidth = 0.0),
- ParticleInfo(name = 'c-hadron', geantid = 84, pdgid = 84, charge = 0.7, mass = 2000.0, lifetime = 3.335641e-13, evtgenname = 'c-hadron', pythiaid = 84, maxwidth = 0.0),
- ParticleInfo(name = 'anti-b-hadron', geantid = -85, pdgid = -85, charge = 0.3, mass = 5000.0, lifetime = 1.290893e-12, evtgenname = 'anti-b-hadron', pythiaid = -85, maxwidth = 0.0),
- ParticleInfo(name = 'b-hadron', geantid = 85, pdgid = 85, charge = -0.3, mass = 5000.0, lifetime = 1.290893e-12, evtgenname = 'b-hadron', pythiaid = 85, maxwidth = 0.0),
- ParticleInfo(name = 'anti-t-hadron', geantid = -86, pdgid = -86, charge = -0.7, mass = 175000.0, lifetime = 0.0, evtgenname = 'anti-t-hadron', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 't-hadron', geantid = 86, pdgid = 86, charge = 0.7, mass = 175000.0, lifetime = 0.0, evtgenname = 't-hadron', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = "anti-b'-hadron", geantid = -87, pdgid = -87, charge = 0.3, mass = 400000.0, lifetime = 0.0, evtgenname = "anti-b'-hadron", pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = "b'-hadron", geantid = 87, pdgid = 87, charge = -0.3, mass = 400000.0, lifetime = 0.0, evtgenname = "b'-hadron", pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'junction', geantid = 88, pdgid = 88, charge = 0.0, mass = 0.0, lifetime = 0.0, evtgenname = 'junction', pythiaid = 88, maxwidth = 0.0),
- ParticleInfo(name = 'system', geantid = 90, pdgid = 90, charge = 0.0, mass = 0.0, lifetime = 0.0, evtgenname = 'system', pythiaid = 90, maxwidth = 0.0),
- ParticleInfo(name = 'cluster', geantid = 91, pdgid = 91, charge = 0.0, mass = 0.0, lifetime = 0.0, evtgenname = 'cluster', pythiaid = 91, maxwidth = 0.0),
- ParticleInfo(name = 'string', geantid = 92, pdgid = 92, charge = 0.0, mass = 0.0, lifetime = 0.0, evtgenname = 'string', pythiaid = 92, maxwidth = 0.0),
- ParticleInfo(name = 'indep', geantid = 93, pdgid = 93, charge = 0.0, mass = 0.0, lifetime = 0.0, evtgenname = 'indep', pythiaid = 93, maxwidth = 0.0),
- ParticleInfo(name = 'CMshower', geantid = 94, pdgid = 94, charge = 0.0, mass = 0.0, lifetime = 0.0, evtgenname = 'CMshower', pythiaid = 94, maxwidth = 0.0),
- ParticleInfo(name = 'SPHEaxis', geantid = 95, pdgid = 95, charge = 0.0, mass = 0.0, lifetime = 0.0, evtgenname = 'SPHEaxis', pythiaid = 95, maxwidth = 0.0),
- ParticleInfo(name = 'THRUaxis', geantid = 96, pdgid = 96, charge = 0.0, mass = 0.0, lifetime = 0.0, evtgenname = 'THRUaxis', pythiaid = 96, maxwidth = 0.0),
- ParticleInfo(name = 'CLUSjet', geantid = 97, pdgid = 97, charge = 0.0, mass = 0.0, lifetime = 0.0, evtgenname = 'CLUSjet', pythiaid = 97, maxwidth = 0.0),
- ParticleInfo(name = 'CELLjet', geantid = 98, pdgid = 98, charge = 0.0, mass = 0.0, lifetime = 0.0, evtgenname = 'CELLjet', pythiaid = 98, maxwidth = 0.0),
- ParticleInfo(name = 'table', geantid = 99, pdgid = 99, charge = 0.0, mass = 0.0, lifetime = 0.0, evtgenname = 'table', pythiaid = 99, maxwidth = 0.0),
- ParticleInfo(name = 'pi0', geantid = 111, pdgid = 111, charge = 0.0, mass = 134.9766, lifetime = 8.52e-17, evtgenname = 'pi0', pythiaid = 111, maxwidth = 0.0),
- ParticleInfo(name = 'rho(770)0', geantid = 113, pdgid = 113, charge = 0.0, mass = 775.26, lifetime = 4.414569000000001e-24, evtgenname = 'rho0', pythiaid = 113, maxwidth = 0.0),
- ParticleInfo(name = 'a_2(1320)0', geantid = 115, pdgid = 115, charge = 0.0, mass = 1318.3, lifetime = 6.151516e-24, evtgenname = 'a_20', pythiaid = 115, maxwidth = 0.0),
- ParticleInfo(name = 'rho_3(1690)0', geantid = 117, pdgid = 117, charge = 0.0, mass = 1688.8000000000002, lifetime = 4.088274e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'a_4(2040)0', geantid = 119, pdgid = 119, charge = 0.0, mass = 1996.0, lifetime = 2.5812240000000005e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'KL0', geantid = 130, pdgid = 130, charge = 0.0, mass = 497.614, lifetime = 5.116000000000001e-08, evtgenname = 'K_L0', pythiaid = 130, maxwidth = 0.0),
- ParticleInfo(name = 'B0L', geantid = 150, pdgid = 150, charge = 0.0, mass = 5279.58, lifetime = 1.5190000000000003e-12, evtgenname = 'B0L', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'pi-', geantid = -211, pdgid = -211, charge = -1.0, mass = 139.57018, lifetime = 2.6033e-08, evtgenname = 'pi-', pythiaid = -211, maxwidth = 0.0),
- ParticleInfo(name = 'pi+', geantid = 211, pdgid = 211, charge = 1.0, mass = 139.57018, lifetime = 2.6033e-08, evtgenname = 'pi+', pythiaid = 211, maxwidth = 0.0),
- ParticleInfo(name = 'rho(770)-', geantid = -213, pdgid = -213, charge = -1.0, mass = 775.26, lifetime = 4.414569000000001e-24, evtgenname = 'rho-', pythiaid = -213, maxwidth = 0.0),
- ParticleInfo(name = 'rho(770)+', geantid = 213, pdgid = 213, charge = 1.0, mass = 775.26, lifetime = 4.414569000000001e-24, evtgenname = 'rho+', pythiaid = 213, maxwidth = 0.0),
- ParticleInfo(name = 'a_2(1320)-', geantid = -215, pdgid = -215, charge = -1.0, mass = 1318.3, lifetime = 6.151516e-24, evtgenname = 'a_2-', pythiaid = -215, maxwidth = 0.0),
- ParticleInfo(name = 'a_2(1320)+', geantid = 215, pdgid = 215, charge = 1.0, mass = 1318.3, lifetime = 6.151516e-24, evtgenname = 'a_2+', pythiaid = 215, maxwidth = 0.0),
- ParticleInfo(name = 'rho_3(1690)-', geantid = -217, pdgid = -217, charge = -1.0, mass = 1688.8000000000002, lifetime = 4.088274e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'rho_3(1690)+', geantid = 217, pdgid = 217, charge = 1.0, mass = 1688.8000000000002, lifetime = 4.088274e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'a_4(2040)-', geantid = -219, pdgid = -219, charge = -1.0, mass = 1996.0, lifetime = 2.5812240000000005e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'a_4(2040)+', geantid = 219, pdgid = 219, charge = 1.0, mass = 1996.0, lifetime = 2.5812240000000005e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'eta', geantid = 221, pdgid = 221, charge = 0.0, mass = 547.862, lifetime = 5.063171e-19, evtgenname = 'eta', pythiaid = 221, maxwidth = 0.0),
- ParticleInfo(name = 'omega(782)', geantid = 223, pdgid = 223, charge = 0.0, mass = 782.65, lifetime = 7.752794e-23, evtgenname = 'omega', pythiaid = 223, maxwidth = 0.0),
- ParticleInfo(name = 'f_2(1270)', geantid = 225, pdgid = 225, charge = 0.0, mass = 1275.1, lifetime = 3.555982e-24, evtgenname = 'f_2', pythiaid = 225, maxwidth = 0.0),
- ParticleInfo(name = 'omega_3(1670)', geantid = 227, pdgid = 227, charge = 0.0, mass = 1667.0, lifetime = 3.91793e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'f_4(2050)', geantid = 229, pdgid = 229, charge = 0.0, mass = 2017.9999999999998, lifetime = 2.7772670000000004e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'KS0', geantid = 310, pdgid = 310, charge = 0.0, mass = 497.614, lifetime = 8.9564e-11, evtgenname = 'K_S0', pythiaid = 310, maxwidth = 0.0),
- ParticleInfo(name = 'K~0', geantid = -311, pdgid = -311, charge = 0.0, mass = 497.614, lifetime = 0.0, evtgenname = 'anti-K0', pythiaid = -311, maxwidth = 0.0),
- ParticleInfo(name = 'K0', geantid = 311, pdgid = 311, charge = 0.0, mass = 497.614, lifetime = 0.0, evtgenname = 'K0', pythiaid = 311, maxwidth = 0.0),
- ParticleInfo(name = 'K*(892)~0', geantid = -313, pdgid = -313, charge = 0.0, mass = 895.81, lifetime = 1.388633e-23, evtgenname = 'anti-K*0', pythiaid = -313, maxwidth = 0.0),
- ParticleInfo(name = 'K*(892)0', geantid = 313, pdgid = 313, charge = 0.0, mass = 895.81, lifetime = 1.388633e-23, evtgenname = 'K*0', pythiaid = 313, maxwidth = 0.0),
- ParticleInfo(name = 'K*_2(1430)~0', geantid = -315, pdgid = -315, charge = 0.0, mass = 1432.3999999999999, lifetime = 6.038644000000001e-24, evtgenname = 'anti-K_2*0', pythiaid = -315, maxwidth = 0.0),
- ParticleInfo(name = 'K*_2(1430)0', geantid = 315, pdgid = 315, charge = 0.0, mass = 1432.3999999999999, lifetime = 6.038644000000001e-24, evtgenname = 'K_2*0', pythiaid = 315, maxwidth = 0.0),
- ParticleInfo(name = 'K*_3(1780)~0', geantid = -317, pdgid = -317, charge = 0.0, mass = 1776.0, lifetime = 4.139699e-24, evtgenname = 'anti-K_3*0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K*_3(1780)0', geantid = 317, pdgid = 317, charge = 0.0, mass = 1776.0, lifetime = 4.139699e-24, evtgenname = 'K_3*0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K*_4(2045)~0', geantid = -319, pdgid = -319, charge = 0.0, mass = 2045.0, lifetime = 3.324304e-24, evtgenname = 'anti-K_4*0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K*_4(2045)0', geantid = 319, pdgid = 319, charge = 0.0, mass = 2045.0, lifetime = 3.324304e-24, evtgenname = 'K_4*0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K-', geantid = -321, pdgid = -321, charge = -1.0, mass = 493.67699999999996, lifetime = 1.2380000000000002e-08, evtgenname = 'K-', pythiaid = -321, maxwidth = 0.0),
- ParticleInfo(name = 'K+', geantid = 321, pdgid = 321, charge = 1.0, mass = 493.67699999999996, lifetime = 1.2380000000000002e-08, evtgenname = 'K+', pythiaid = 321, maxwidth = 0.0),
- ParticleInfo(name = 'K*(892)-', geantid = -323, pdgid = -323, charge = -1.0, mass = 891.66, lifetime = 1.2956930000000001e-23, evtgenname = 'K*-', pythiaid = -323, maxwidth = 0.0),
- ParticleInfo(name = 'K*(892)+', geantid = 323, pdgid = 323, charge = 1.0, mass = 891.66, lifetime = 1.2956930000000001e-23, evtgenname = 'K*+', pythiaid = 323, maxwidth = 0.0),
- ParticleInfo(name = 'K*_2(1430)-', geantid = -325, pdgid = -325, charge = -1.0, mass = 1425.6, lifetime = 6.682357e-24, evtgenname = 'K_2*-', pythiaid = -325, maxwidth = 0.0),
- ParticleInfo(name = 'K*_2(1430)+', geantid = 325, pdgid = 325, charge = 1.0, mass = 1425.6, lifetime = 6.682357e-24, evtgenname = 'K_2*+', pythiaid = 325, maxwidth = 0.0),
- ParticleInfo(name = 'K*_3(1780)-', geantid = -327, pdgid = -327, charge = -1.0, mass = 1776.0, lifetime = 4.139699e-24, evtgenname = 'K_3*-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K*_3(1780)+', geantid = 327, pdgid = 327, charge = 1.0, mass = 1776.0, lifetime = 4.139699e-24, evtgenname = 'K_3*+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K*_4(2045)-', geantid = -329, pdgid = -329, charge = -1.0, mass = 2045.0, lifetime = 3.324304e-24, evtgenname = 'K_4*-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K*_4(2045)+', geantid = 329, pdgid = 329, charge = 1.0, mass = 2045.0, lifetime = 3.324304e-24, evtgenname = 'K_4*+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'eta_prime', geantid = 331, pdgid = 331, charge = 0.0, mass = 957.78, lifetime = 3.3243030000000002e-21, evtgenname = "eta'", pythiaid = 331, maxwidth = 0.0),
- ParticleInfo(name = 'phi(1020)', geantid = 333, pdgid = 333, charge = 0.0, mass = 1019.4609999999999, lifetime = 1.545099e-22, evtgenname = 'phi', pythiaid = 333, maxwidth = 0.0),
- ParticleInfo(name = "f'_2(1525)", geantid = 335, pdgid = 335, charge = 0.0, mass = 1525.0, lifetime = 9.016605e-24, evtgenname = "f'_2", pythiaid = 335, maxwidth = 0.0),
- ParticleInfo(name = 'phi_3(1850)', geantid = 337, pdgid = 337, charge = 0.0, mass = 1854.0, lifetime = 7.565657000000001e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'B_s0L', geantid = 350, pdgid = 350, charge = 0.0, mass = 5366.7699999999995, lifetime = 1.4050000000000002e-12, evtgenname = 'B_s0L', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'D-', geantid = -411, pdgid = -411, charge = -1.0, mass = 1869.61, lifetime = 1.04e-12, evtgenname = 'D-', pythiaid = -411, maxwidth = 0.0),
- ParticleInfo(name = 'D+', geantid = 411, pdgid = 411, charge = 1.0, mass = 1869.61, lifetime = 1.04e-12, evtgenname = 'D+', pythiaid = 411, maxwidth = 0.0),
- ParticleInfo(name = 'D*(2010)-', geantid = -413, pdgid = -413, charge = -1.0, mass = 2010.2600000000002, lifetime = 7.89223e-21, evtgenname = 'D*-', pythiaid = -413, maxwidth = 0.0),
- ParticleInfo(name = 'D*(2010)+', geantid = 413, pdgid = 413, charge = 1.0, mass = 2010.2600000000002, lifetime = 7.89223e-21, evtgenname = 'D*+', pythiaid = 413, maxwidth = 0.0),
- ParticleInfo(name = 'D*_2(2460)-', geantid = -415, pdgid = -415, charge = -1.0, mass = 2464.3, lifetime = 1.7789520000000002e-23, evtgenname = 'D_2*-', pythiaid = -415, maxwidth = 0.0),
- ParticleInfo(name = 'D*_2(2460)+', geantid = 415, pdgid = 415, charge = 1.0, mass = 2464.3, lifetime = 1.7789520000000002e-23, evtgenname = 'D_2*+', pythiaid = 415, maxwidth = 0.0),
- ParticleInfo(name = 'D~0', geantid = -421, pdgid = -421, charge = 0.0, mass = 1864.8400000000001, lifetime = 4.1010000000000004e-13, evtgenname = 'anti-D0', pythiaid = -421, maxwidth = 0.0),
- ParticleInfo(name = 'D0', geantid = 421, pdgid = 421, charge = 0.0, mass = 1864.8400000000001, lifetime = 4.1010000000000004e-13, evtgenname = 'D0', pythiaid = 421, maxwidth = 0.0),
- ParticleInfo(name = 'D*(2007)~0', geantid = -423, pdgid = -423, charge = 0.0, mass = 2006.9599999999998, lifetime = 1.000003e-19, evtgenname = 'anti-D*0', pythiaid = -423, maxwidth = 0.0),
- ParticleInfo(name = 'D*(2007)0', geantid = 423, pdgid = 423, charge = 0.0, mass = 2006.9599999999998, lifetime = 1.000003e-19, evtgenname = 'D*0', pythiaid = 423, maxwidth = 0.0),
- ParticleInfo(name = 'D*_2(2460)~0', geantid = -425, pdgid = -425, charge = 0.0, mass = 2462.6, lifetime = 1.34329e-23, evtgenname = 'anti-D_2*0', pythiaid = -425, maxwidth = 0.0),
- ParticleInfo(name = 'D*_2(2460)0', geantid = 425, pdgid = 425, charge = 0.0, mass = 2462.6, lifetime = 1.34329e-23, evtgenname = 'D_2*0', pythiaid = 425, maxwidth = 0.0),
- ParticleInfo(name = 'D_s-', geantid = -431, pdgid = -431, charge = -1.0, mass = 1968.3, lifetime = 5.000000000000001e-13, evtgenname = 'D_s-', pythiaid = -431, maxwidth = 0.0),
- ParticleInfo(name = 'D_s+', geantid = 431, pdgid = 431, charge = 1.0, mass = 1968.3, lifetime = 5.000000000000001e-13, evtgenname = 'D_s+', pythiaid = 431, maxwidth = 0.0),
- ParticleInfo(name = 'D*_s-', geantid = -433, pdgid = -433, charge = -1.0, mass = 2112.1, lifetime = 1.000003e-19, evtgenname = 'D_s*-', pythiaid = -433, maxwidth = 0.0),
- ParticleInfo(name = 'D*_s+', geantid = 433, pdgid = 433, charge = 1.0, mass = 2112.1, lifetime = 1.000003e-19, evtgenname = 'D_s*+', pythiaid = 433, maxwidth = 0.0),
- ParticleInfo(name = 'D*_s2-', geantid = -435, pdgid = -435, charge = -1.0, mass = 2571.8999999999996, lifetime = 3.871836e-23, evtgenname = 'D_s2*-', pythiaid = -435, maxwidth = 0.0),
- ParticleInfo(name = 'D*_s2+', geantid = 435, pdgid = 435, charge = 1.0, mass = 2571.8999999999996, lifetime = 3.871836e-23, evtgenname = 'D_s2*+', pythiaid = 435, maxwidth = 0.0),
- ParticleInfo(name = 'eta_c(1S)', geantid = 441, pdgid = 441, charge = 0.0, mass = 2983.6, lifetime = 2.2162030000000003e-23, evtgenname = 'eta_c', pythiaid = 441, maxwidth = 0.0),
- ParticleInfo(name = 'J/psi(1S)', geantid = 443, pdgid = 443, charge = 0.0, mass = 3096.9159999999997, lifetime = 7.085169e-21, evtgenname = 'J/psi', pythiaid = 443, maxwidth = 0.0),
- ParticleInfo(name = 'chi_c2(1P)', geantid = 445, pdgid = 445, charge = 0.0, mass = 3556.2, lifetime = 3.410425e-22, evtgenname = 'chi_c2', pythiaid = 445, maxwidth = 0.0),
- ParticleInfo(name = 'B0H', geantid = 510, pdgid = 510, charge = 0.0, mass = 5279.58, lifetime = 1.5190000000000003e-12, evtgenname = 'B0H', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'B~0', geantid = -511, pdgid = -511, charge = 0.0, mass = 5279.58, lifetime = 1.5190000000000003e-12, evtgenname = 'anti-B0', pythiaid = -511, maxwidth = 0.0),
- ParticleInfo(name = 'B0', geantid = 511, pdgid = 511, charge = 0.0, mass = 5279.58, lifetime = 1.5190000000000003e-12, evtgenname = 'B0', pythiaid = 511, maxwidth = 0.0),
- ParticleInfo(name = 'B*~0', geantid = -513, pdgid = -513, charge = 0.0, mass = 5325.2, lifetime = 1.000019e-19, evtgenname = 'anti-B*0', pythiaid = -513, maxwidth = 0.0),
- ParticleInfo(name = 'B*0', geantid = 513, pdgid = 513, charge = 0.0, mass = 5325.2, lifetime = 1.000019e-19, evtgenname = 'B*0', pythiaid = 513, maxwidth = 0.0),
- ParticleInfo(name = 'B*_2~0', geantid = -515, pdgid = -515, charge = 0.0, mass = 5743.0, lifetime = 2.861792000000001e-23, evtgenname = 'anti-B_2*0', pythiaid = -515, maxwidth = 0.0),
- ParticleInfo(name = 'B*_20', geantid = 515, pdgid = 515, charge = 0.0, mass = 5743.0, lifetime = 2.861792000000001e-23, evtgenname = 'B_2*0', pythiaid = 515, maxwidth = 0.0),
- ParticleInfo(name = 'B-', geantid = -521, pdgid = -521, charge = -1.0, mass = 5279.26, lifetime = 1.6380000000000003e-12, evtgenname = 'B-', pythiaid = -521, maxwidth = 0.0),
- ParticleInfo(name = 'B+', geantid = 521, pdgid = 521, charge = 1.0, mass = 5279.26, lifetime = 1.6380000000000003e-12, evtgenname = 'B+', pythiaid = 521, maxwidth = 0.0),
- ParticleInfo(name = 'B*-', geantid = -523, pdgid = -523, charge = -1.0, mass = 5325.2, lifetime = 1.000019e-19, evtgenname = 'B*-', pythiaid = -523, maxwidth = 0.0),
- ParticleInfo(name = 'B*+', geantid = 523, pdgid = 523, charge = 1.0, mass = 5325.2, lifetime = 1.000019e-19, evtgenname = 'B*+', pythiaid = 523, maxwidth = 0.0),
- ParticleInfo(name = 'B*_2-', geantid = -525, pdgid = -525, charge = -1.0, mass = 5743.0, lifetime = 2.861792000000001e-23, evtgenname = 'B_2*-', pythiaid = -525, maxwidth = 0.0),
- ParticleInfo(name = 'B*_2+', geantid = 525, pdgid = 525, charge = 1.0, mass = 5743.0, lifetime = 2.861792000000001e-23, evtgenname = 'B_2*+', pythiaid = 525, maxwidth = 0.0),
- ParticleInfo(name = 'B_s0H', geantid = 530, pdgid = 530, charge = 0.0, mass = 5366.7699999999995, lifetime = 1.6610000000000003e-12, evtgenname = 'B_s0H', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'B_s~0', geantid = -531, pdgid = -531, charge = 0.0, mass = 5366.7699999999995, lifetime = 1.5120000000000002e-12, evtgenname = 'anti-B_s0', pythiaid = -531, maxwidth = 0.0),
- ParticleInfo(name = 'B_s0', geantid = 531, pdgid = 531, charge = 0.0, mass = 5366.7699999999995, lifetime = 1.5120000000000002e-12, evtgenname = 'B_s0', pythiaid = 531, maxwidth = 0.0),
- ParticleInfo(name = 'B*_s~0', geantid = -533, pdgid = -533, charge = 0.0, mass = 5415.4, lifetime = 1.0000000000000001e-19, evtgenname = 'anti-B_s*0', pythiaid = -533, maxwidth = 0.0),
- ParticleInfo(name = 'B*_s0', geantid = 533, pdgid = 533, charge = 0.0, mass = 5415.4, lifetime = 1.0000000000000001e-19, evtgenname = 'B_s*0', pythiaid = 533, maxwidth = 0.0),
- ParticleInfo(name = 'B*_s2~0', geantid = -535, pdgid = -535, charge = 0.0, mass = 5839.96, lifetime = 4.1138250000000003e-22, evtgenname = 'anti-B_s2*0', pythiaid = -535, maxwidth = 0.0),
- ParticleInfo(name = 'B*_s20', geantid = 535, pdgid = 535, charge = 0.0, mass = 5839.96, lifetime = 4.1138250000000003e-22, evtgenname = 'B_s2*0', pythiaid = 535, maxwidth = 0.0),
- ParticleInfo(name = 'B_c-', geantid = -541, pdgid = -541, charge = -1.0, mass = 6273.7, lifetime = 5.07e-13, evtgenname = 'B_c-', pythiaid = -541, maxwidth = 0.0),
- ParticleInfo(name = 'B_c+', geantid = 541, pdgid = 541, charge = 1.0, mass = 6273.7, lifetime = 5.07e-13, evtgenname = 'B_c+', pythiaid = 541, maxwidth = 0.0),
- ParticleInfo(name = 'B_c*-', geantid = -543, pdgid = -543, charge = -1.0, mass = 6602.0, lifetime = 0.0, evtgenname = 'B_c*-', pythiaid = -543, maxwidth = 0.0),
- ParticleInfo(name = 'B_c*+', geantid = 543, pdgid = 543, charge = 1.0, mass = 6602.0, lifetime = 0.0, evtgenname = 'B_c*+', pythiaid = 543, maxwidth = 0.0),
- ParticleInfo(name = 'B_c2*-', geantid = -545, pdgid = -545, charge = -1.0, mass = 7350.0, lifetime = 0.0, evtgenname = 'B_c2*-', pythiaid = -545, maxwidth = 0.0),
- ParticleInfo(name = 'B_c2*+', geantid = 545, pdgid = 545, charge = 1.0, mass = 7350.0, lifetime = 0.0, evtgenname = 'B_c2*+', pythiaid = 545, maxwidth = 0.0),
- ParticleInfo(name = 'eta_b(1S)', geantid = 551, pdgid = 551, charge = 0.0, mass = 9403.0, lifetime = 0.0, evtgenname = 'eta_b', pythiaid = 551, maxwidth = 0.0),
- ParticleInfo(name = 'Upsilon(1S)', geantid = 553, pdgid = 553, charge = 0.0, mass = 9460.3, lifetime = 1.2189110000000002e-20, evtgenname = 'Upsilon', pythiaid = 553, maxwidth = 0.0),
- ParticleInfo(name = 'chi_b2(1P)', geantid = 555, pdgid = 555, charge = 0.0, mass = 9912.21, lifetime = 0.0, evtgenname = 'chi_b2', pythiaid = 555, maxwidth = 0.0),
- ParticleInfo(name = 'Upsilon_3(1D)', geantid = 557, pdgid = 557, charge = 0.0, mass = 10159.9, lifetime = 0.0, evtgenname = 'Upsilon_3(1D)', pythiaid = 557, maxwidth = 0.0),
- ParticleInfo(name = 'anti-dd_1', geantid = -1103, pdgid = -1103, charge = 0.7, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-dd_1', pythiaid = -1103, maxwidth = 0.0),
- ParticleInfo(name = 'dd_1', geantid = 1103, pdgid = 1103, charge = -0.7, mass = 0.0, lifetime = 0.0, evtgenname = 'dd_1', pythiaid = 1103, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1620)~+', geantid = -1112, pdgid = -1112, charge = 1.0, mass = 1630.0, lifetime = 4.701516e-24, evtgenname = 'anti-Delta(1620)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1620)-', geantid = 1112, pdgid = 1112, charge = -1.0, mass = 1630.0, lifetime = 4.701516e-24, evtgenname = 'Delta(1620)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta~+', geantid = -1114, pdgid = -1114, charge = 1.0, mass = 1232.0, lifetime = 5.625745000000001e-24, evtgenname = 'anti-Delta+', pythiaid = -1114, maxwidth = 0.0),
- ParticleInfo(name = 'Delta-', geantid = 1114, pdgid = 1114, charge = -1.0, mass = 1232.0, lifetime = 5.625745000000001e-24, evtgenname = 'Delta-', pythiaid = 1114, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1905)~+', geantid = -1116, pdgid = -1116, charge = 1.0, mass = 1880.0, lifetime = 1.994582e-24, evtgenname = 'anti-Delta(1905)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1905)-', geantid = 1116, pdgid = 1116, charge = -1.0, mass = 1880.0, lifetime = 1.994582e-24, evtgenname = 'Delta(1905)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1950)~+', geantid = -1118, pdgid = -1118, charge = 1.0, mass = 1930.0, lifetime = 2.350758e-24, evtgenname = 'anti-Delta(1950)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1950)-', geantid = 1118, pdgid = 1118, charge = -1.0, mass = 1930.0, lifetime = 2.350758e-24, evtgenname = 'Delta(1950)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1620)~0', geantid = -1212, pdgid = -1212, charge = 0.0, mass = 1630.0, lifetime = 4.701516e-24, evtgenname = 'anti-Delta(1620)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1620)0', geantid = 1212, pdgid = 1212, charge = 0.0, mass = 1630.0, lifetime = 4.701516e-24, evtgenname = 'Delta(1620)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1520)~0', geantid = -1214, pdgid = -1214, charge = 0.0, mass = 1515.0, lifetime = 5.723584000000001e-24, evtgenname = 'anti-N(1520)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1520)0', geantid = 1214, pdgid = 1214, charge = 0.0, mass = 1515.0, lifetime = 5.723584000000001e-24, evtgenname = 'N(1520)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1905)~0', geantid = -1216, pdgid = -1216, charge = 0.0, mass = 1880.0, lifetime = 1.994582e-24, evtgenname = 'anti-Delta(1905)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1905)0', geantid = 1216, pdgid = 1216, charge = 0.0, mass = 1880.0, lifetime = 1.994582e-24, evtgenname = 'Delta(1905)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(2190)~0', geantid = -1218, pdgid = -1218, charge = 0.0, mass = 2190.0, lifetime = 1.3164240000000002e-24, evtgenname = 'anti-N(2190)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(2190)0', geantid = 1218, pdgid = 1218, charge = 0.0, mass = 2190.0, lifetime = 1.3164240000000002e-24, evtgenname = 'N(2190)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'anti-ud_0', geantid = -2101, pdgid = -2101, charge = -0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-ud_0', pythiaid = -2101, maxwidth = 0.0),
- ParticleInfo(name = 'ud_0', geantid = 2101, pdgid = 2101, charge = 0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'ud_0', pythiaid = 2101, maxwidth = 0.0),
- ParticleInfo(name = 'anti-ud_1', geantid = -2103, pdgid = -2103, charge = -0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-ud_1', pythiaid = -2103, maxwidth = 0.0),
- ParticleInfo(name = 'ud_1', geantid = 2103, pdgid = 2103, charge = 0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'ud_1', pythiaid = 2103, maxwidth = 0.0),
- ParticleInfo(name = 'n~0', geantid = -2112, pdgid = -2112, charge = 0.0, mass = 939.56538, lifetime = 880.3000000000001, evtgenname = 'anti-n0', pythiaid = -2112, maxwidth = 0.0),
- ParticleInfo(name = 'n0', geantid = 2112, pdgid = 2112, charge = 0.0, mass = 939.56538, lifetime = 880.3000000000001, evtgenname = 'n0', pythiaid = 2112, maxwidth = 0.0),
- ParticleInfo(name = 'Delta~0', geantid = -2114, pdgid = -2114, charge = 0.0, mass = 1232.0, lifetime = 5.625745000000001e-24, evtgenname = 'anti-Delta0', pythiaid = -2114, maxwidth = 0.0),
- ParticleInfo(name = 'Delta0', geantid = 2114, pdgid = 2114, charge = 0.0, mass = 1232.0, lifetime = 5.625745000000001e-24, evtgenname = 'Delta0', pythiaid = 2114, maxwidth = 0.0),
- ParticleInfo(name = 'N(1675)~0', geantid = -2116, pdgid = -2116, charge = 0.0, mass = 1675.0, lifetime = 4.3880810000000005e-24, evtgenname = 'anti-N(1675)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1675)0', geantid = 2116, pdgid = 2116, charge = 0.0, mass = 1675.0, lifetime = 4.3880810000000005e-24, evtgenname = 'N(1675)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1950)~0', geantid = -2118, pdgid = -2118, charge = 0.0, mass = 1930.0, lifetime = 2.350758e-24, evtgenname = 'anti-Delta(1950)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1950)0', geantid = 2118, pdgid = 2118, charge = 0.0, mass = 1930.0, lifetime = 2.350758e-24, evtgenname = 'Delta(1950)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1620)~-', geantid = -2122, pdgid = -2122, charge = -1.0, mass = 1630.0, lifetime = 4.701516e-24, evtgenname = 'anti-Delta(1620)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1620)+', geantid = 2122, pdgid = 2122, charge = 1.0, mass = 1630.0, lifetime = 4.701516e-24, evtgenname = 'Delta(1620)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1520)~-', geantid = -2124, pdgid = -2124, charge = -1.0, mass = 1515.0, lifetime = 5.723584000000001e-24, evtgenname = 'anti-N(1520)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1520)+', geantid = 2124, pdgid = 2124, charge = 1.0, mass = 1515.0, lifetime = 5.723584000000001e-24, evtgenname = 'N(1520)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1905)~-', geantid = -2126, pdgid = -2126, charge = -1.0, mass = 1880.0, lifetime = 1.994582e-24, evtgenname = 'anti-Delta(1905)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1905)+', geantid = 2126, pdgid = 2126, charge = 1.0, mass = 1880.0, lifetime = 1.994582e-24, evtgenname = 'Delta(1905)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(2190)~-', geantid = -2128, pdgid = -2128, charge = -1.0, mass = 2190.0, lifetime = 1.3164240000000002e-24, evtgenname = 'anti-N(2190)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(2190)+', geantid = 2128, pdgid = 2128, charge = 1.0, mass = 2190.0, lifetime = 1.3164240000000002e-24, evtgenname = 'N(2190)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'anti-uu_1', geantid = -2203, pdgid = -2203, charge = -1.3, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-uu_1', pythiaid = -2203, maxwidth = 0.0),
- ParticleInfo(name = 'uu_1', geantid = 2203, pdgid = 2203, charge = 1.3, mass = 0.0, lifetime = 0.0, evtgenname = 'uu_1', pythiaid = 2203, maxwidth = 0.0),
- ParticleInfo(name = 'p~-', geantid = -2212, pdgid = -2212, charge = -1.0, mass = 938.27205, lifetime = 1.0000000000000002e+16, evtgenname = 'anti-p-', pythiaid = -2212, maxwidth = 0.0),
- ParticleInfo(name = 'p+', geantid = 2212, pdgid = 2212, charge = 1.0, mass = 938.27205, lifetime = 1.0000000000000002e+16, evtgenname = 'p+', pythiaid = 2212, maxwidth = 0.0),
- ParticleInfo(name = 'Delta~-', geantid = -2214, pdgid = -2214, charge = -1.0, mass = 1232.0, lifetime = 5.625745000000001e-24, evtgenname = 'anti-Delta-', pythiaid = -2214, maxwidth = 0.0),
- ParticleInfo(name = 'Delta+', geantid = 2214, pdgid = 2214, charge = 1.0, mass = 1232.0, lifetime = 5.625745000000001e-24, evtgenname = 'Delta+', pythiaid = 2214, maxwidth = 0.0),
- ParticleInfo(name = 'N(1675)~-', geantid = -2216, pdgid = -2216, charge = -1.0, mass = 1675.0, lifetime = 4.3880810000000005e-24, evtgenname = 'anti-N(1675)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1675)+', geantid = 2216, pdgid = 2216, charge = 1.0, mass = 1675.0, lifetime = 4.3880810000000005e-24, evtgenname = 'N(1675)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1950)~-', geantid = -2218, pdgid = -2218, charge = -1.0, mass = 1930.0, lifetime = 2.350758e-24, evtgenname = 'anti-Delta(1950)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1950)+', geantid = 2218, pdgid = 2218, charge = 1.0, mass = 1930.0, lifetime = 2.350758e-24, evtgenname = 'Delta(1950)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1620)~--', geantid = -2222, pdgid = -2222, charge = -2.0, mass = 1630.0, lifetime = 4.701516e-24, evtgenname = 'anti-Delta(1620)--', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1620)++', geantid = 2222, pdgid = 2222, charge = 2.0, mass = 1630.0, lifetime = 4.701516e-24, evtgenname = 'Delta(1620)++', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta~--', geantid = -2224, pdgid = -2224, charge = -2.0, mass = 1232.0, lifetime = 5.625745000000001e-24, evtgenname = 'anti-Delta--', pythiaid = -2224, maxwidth = 0.0),
- ParticleInfo(name = 'Delta++', geantid = 2224, pdgid = 2224, charge = 2.0, mass = 1232.0, lifetime = 5.625745000000001e-24, evtgenname = 'Delta++', pythiaid = 2224, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1905)~--', geantid = -2226, pdgid = -2226, charge = -2.0, mass = 1880.0, lifetime = 1.994582e-24, evtgenname = 'anti-Delta(1905)--', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1905)++', geantid = 2226, pdgid = 2226, charge = 2.0, mass = 1880.0, lifetime = 1.994582e-24, evtgenname = 'Delta(1905)++', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1950)~--', geantid = -2228, pdgid = -2228, charge = -2.0, mass = 1930.0, lifetime = 2.350758e-24, evtgenname = 'anti-Delta(1950)--', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1950)++', geantid = 2228, pdgid = 2228, charge = 2.0, mass = 1930.0, lifetime = 2.350758e-24, evtgenname = 'Delta(1950)++', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'anti-sd_0', geantid = -3101, pdgid = -3101, charge = 0.7, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-sd_0', pythiaid = -3101, maxwidth = 0.0),
- ParticleInfo(name = 'sd_0', geantid = 3101, pdgid = 3101, charge = -0.7, mass = 0.0, lifetime = 0.0, evtgenname = 'sd_0', pythiaid = 3101, maxwidth = 0.0),
- ParticleInfo(name = 'anti-sd_1', geantid = -3103, pdgid = -3103, charge = 0.7, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-sd_1', pythiaid = -3103, maxwidth = 0.0),
- ParticleInfo(name = 'sd_1', geantid = 3103, pdgid = 3103, charge = -0.7, mass = 0.0, lifetime = 0.0, evtgenname = 'sd_1', pythiaid = 3103, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma~+', geantid = -3112, pdgid = -3112, charge = 1.0, mass = 1197.449, lifetime = 1.479e-10, evtgenname = 'anti-Sigma+', pythiaid = -3112, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma-', geantid = 3112, pdgid = 3112, charge = -1.0, mass = 1197.449, lifetime = 1.479e-10, evtgenname = 'Sigma-', pythiaid = 3112, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma*~+', geantid = -3114, pdgid = -3114, charge = 1.0, mass = 1387.2, lifetime = 1.670589e-23, evtgenname = 'anti-Sigma*+', pythiaid = -3114, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma*-', geantid = 3114, pdgid = 3114, charge = -1.0, mass = 1387.2, lifetime = 1.670589e-23, evtgenname = 'Sigma*-', pythiaid = 3114, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1775)~+', geantid = -3116, pdgid = -3116, charge = 1.0, mass = 1775.0, lifetime = 5.485102000000001e-24, evtgenname = 'anti-Sigma(1775)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1775)-', geantid = 3116, pdgid = 3116, charge = -1.0, mass = 1775.0, lifetime = 5.485102000000001e-24, evtgenname = 'Sigma(1775)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(2030)~+', geantid = -3118, pdgid = -3118, charge = 1.0, mass = 2029.9999999999998, lifetime = 3.656734e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(2030)-', geantid = 3118, pdgid = 3118, charge = -1.0, mass = 2029.9999999999998, lifetime = 3.656734e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda~0', geantid = -3122, pdgid = -3122, charge = 0.0, mass = 1115.683, lifetime = 2.632e-10, evtgenname = 'anti-Lambda0', pythiaid = -3122, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda0', geantid = 3122, pdgid = 3122, charge = 0.0, mass = 1115.683, lifetime = 2.632e-10, evtgenname = 'Lambda0', pythiaid = 3122, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(1520)~0', geantid = -3124, pdgid = -3124, charge = 0.0, mass = 1519.5, lifetime = 4.219309e-23, evtgenname = 'anti-Lambda(1520)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(1520)0', geantid = 3124, pdgid = 3124, charge = 0.0, mass = 1519.5, lifetime = 4.219309e-23, evtgenname = 'Lambda(1520)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(1820)~0', geantid = -3126, pdgid = -3126, charge = 0.0, mass = 1820.0, lifetime = 8.227652000000001e-24, evtgenname = 'anti-Lambda(1820)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(1820)0', geantid = 3126, pdgid = 3126, charge = 0.0, mass = 1820.0, lifetime = 8.227652000000001e-24, evtgenname = 'Lambda(1820)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(2100)~0', geantid = -3128, pdgid = -3128, charge = 0.0, mass = 2100.0, lifetime = 3.2910610000000003e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(2100)0', geantid = 3128, pdgid = 3128, charge = 0.0, mass = 2100.0, lifetime = 3.2910610000000003e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'anti-su_0', geantid = -3201, pdgid = -3201, charge = -0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-su_0', pythiaid = -3201, maxwidth = 0.0),
- ParticleInfo(name = 'su_0', geantid = 3201, pdgid = 3201, charge = 0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'su_0', pythiaid = 3201, maxwidth = 0.0),
- ParticleInfo(name = 'anti-su_1', geantid = -3203, pdgid = -3203, charge = -0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-su_1', pythiaid = -3203, maxwidth = 0.0),
- ParticleInfo(name = 'su_1', geantid = 3203, pdgid = 3203, charge = 0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'su_1', pythiaid = 3203, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma~0', geantid = -3212, pdgid = -3212, charge = 0.0, mass = 1192.642, lifetime = 7.400000000000001e-20, evtgenname = 'anti-Sigma0', pythiaid = -3212, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma0', geantid = 3212, pdgid = 3212, charge = 0.0, mass = 1192.642, lifetime = 7.400000000000001e-20, evtgenname = 'Sigma0', pythiaid = 3212, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma*~0', geantid = -3214, pdgid = -3214, charge = 0.0, mass = 1383.6999999999998, lifetime = 1.8283670000000003e-23, evtgenname = 'anti-Sigma*0', pythiaid = -3214, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma*0', geantid = 3214, pdgid = 3214, charge = 0.0, mass = 1383.6999999999998, lifetime = 1.8283670000000003e-23, evtgenname = 'Sigma*0', pythiaid = 3214, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1775)~0', geantid = -3216, pdgid = -3216, charge = 0.0, mass = 1775.0, lifetime = 5.485102000000001e-24, evtgenname = 'anti-Sigma(1775)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1775)0', geantid = 3216, pdgid = 3216, charge = 0.0, mass = 1775.0, lifetime = 5.485102000000001e-24, evtgenname = 'Sigma(1775)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(2030)~0', geantid = -3218, pdgid = -3218, charge = 0.0, mass = 2029.9999999999998, lifetime = 3.656734e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(2030)0', geantid = 3218, pdgid = 3218, charge = 0.0, mass = 2029.9999999999998, lifetime = 3.656734e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma~-', geantid = -3222, pdgid = -3222, charge = -1.0, mass = 1189.3700000000001, lifetime = 8.018e-11, evtgenname = 'anti-Sigma-', pythiaid = -3222, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma+', geantid = 3222, pdgid = 3222, charge = 1.0, mass = 1189.3700000000001, lifetime = 8.018e-11, evtgenname = 'Sigma+', pythiaid = 3222, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma*~-', geantid = -3224, pdgid = -3224, charge = -1.0, mass = 1382.8, lifetime = 1.8283670000000003e-23, evtgenname = 'anti-Sigma*-', pythiaid = -3224, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma*+', geantid = 3224, pdgid = 3224, charge = 1.0, mass = 1382.8, lifetime = 1.8283670000000003e-23, evtgenname = 'Sigma*+', pythiaid = 3224, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1775)~-', geantid = -3226, pdgid = -3226, charge = -1.0, mass = 1775.0, lifetime = 5.485102000000001e-24, evtgenname = 'anti-Sigma(1775)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1775)+', geantid = 3226, pdgid = 3226, charge = 1.0, mass = 1775.0, lifetime = 5.485102000000001e-24, evtgenname = 'Sigma(1775)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(2030)~-', geantid = -3228, pdgid = -3228, charge = -1.0, mass = 2029.9999999999998, lifetime = 3.656734e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(2030)+', geantid = 3228, pdgid = 3228, charge = 1.0, mass = 2029.9999999999998, lifetime = 3.656734e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'anti-ss_1', geantid = -3303, pdgid = -3303, charge = 0.7, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-ss_1', pythiaid = -3303, maxwidth = 0.0),
- ParticleInfo(name = 'ss_1', geantid = 3303, pdgid = 3303, charge = -0.7, mass = 0.0, lifetime = 0.0, evtgenname = 'ss_1', pythiaid = 3303, maxwidth = 0.0),
- ParticleInfo(name = 'Xi~+', geantid = -3312, pdgid = -3312, charge = 1.0, mass = 1321.71, lifetime = 1.639e-10, evtgenname = 'anti-Xi+', pythiaid = -3312, maxwidth = 0.0),
- ParticleInfo(name = 'Xi-', geantid = 3312, pdgid = 3312, charge = -1.0, mass = 1321.71, lifetime = 1.639e-10, evtgenname = 'Xi-', pythiaid = 3312, maxwidth = 0.0),
- ParticleInfo(name = 'Xi*~+', geantid = -3314, pdgid = -3314, charge = 1.0, mass = 1535.0, lifetime = 6.648608000000001e-23, evtgenname = 'anti-Xi*+', pythiaid = -3314, maxwidth = 0.0),
- ParticleInfo(name = 'Xi*-', geantid = 3314, pdgid = 3314, charge = -1.0, mass = 1535.0, lifetime = 6.648608000000001e-23, evtgenname = 'Xi*-', pythiaid = 3314, maxwidth = 0.0),
- ParticleInfo(name = 'Xi~0', geantid = -3322, pdgid = -3322, charge = 0.0, mass = 1314.86, lifetime = 2.9e-10, evtgenname = 'anti-Xi0', pythiaid = -3322, maxwidth = 0.0),
- ParticleInfo(name = 'Xi0', geantid = 3322, pdgid = 3322, charge = 0.0, mass = 1314.86, lifetime = 2.9e-10, evtgenname = 'Xi0', pythiaid = 3322, maxwidth = 0.0),
- ParticleInfo(name = 'Xi*~0', geantid = -3324, pdgid = -3324, charge = 0.0, mass = 1531.8, lifetime = 7.233101000000001e-23, evtgenname = 'anti-Xi*0', pythiaid = -3324, maxwidth = 0.0),
- ParticleInfo(name = 'Xi*0', geantid = 3324, pdgid = 3324, charge = 0.0, mass = 1531.8, lifetime = 7.233101000000001e-23, evtgenname = 'Xi*0', pythiaid = 3324, maxwidth = 0.0),
- ParticleInfo(name = 'Omega~+', geantid = -3334, pdgid = -3334, charge = 1.0, mass = 1672.45, lifetime = 8.21e-11, evtgenname = 'anti-Omega+', pythiaid = -3334, maxwidth = 0.0),
- ParticleInfo(name = 'Omega-', geantid = 3334, pdgid = 3334, charge = -1.0, mass = 1672.45, lifetime = 8.21e-11, evtgenname = 'Omega-', pythiaid = 3334, maxwidth = 0.0),
- ParticleInfo(name = 'anti-cd_0', geantid = -4101, pdgid = -4101, charge = -0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-cd_0', pythiaid = -4101, maxwidth = 0.0),
- ParticleInfo(name = 'cd_0', geantid = 4101, pdgid = 4101, charge = 0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'cd_0', pythiaid = 4101, maxwidth = 0.0),
- ParticleInfo(name = 'anti-cd_1', geantid = -4103, pdgid = -4103, charge = -0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-cd_1', pythiaid = -4103, maxwidth = 0.0),
- ParticleInfo(name = 'cd_1', geantid = 4103, pdgid = 4103, charge = 0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'cd_1', pythiaid = 4103, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_c~0', geantid = -4112, pdgid = -4112, charge = 0.0, mass = 2453.74, lifetime = 3.0472790000000004e-22, evtgenname = 'anti-Sigma_c0', pythiaid = -4112, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_c0', geantid = 4112, pdgid = 4112, charge = 0.0, mass = 2453.74, lifetime = 3.0472790000000004e-22, evtgenname = 'Sigma_c0', pythiaid = 4112, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_c*~0', geantid = -4114, pdgid = -4114, charge = 0.0, mass = 2518.8, lifetime = 4.539394e-23, evtgenname = 'anti-Sigma_c*0', pythiaid = -4114, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_c*0', geantid = 4114, pdgid = 4114, charge = 0.0, mass = 2518.8, lifetime = 4.539394e-23, evtgenname = 'Sigma_c*0', pythiaid = 4114, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda_c~-', geantid = -4122, pdgid = -4122, charge = -1.0, mass = 2286.46, lifetime = 2.0000000000000003e-13, evtgenname = 'anti-Lambda_c-', pythiaid = -4122, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda_c+', geantid = 4122, pdgid = 4122, charge = 1.0, mass = 2286.46, lifetime = 2.0000000000000003e-13, evtgenname = 'Lambda_c+', pythiaid = 4122, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_c~0', geantid = -4132, pdgid = -4132, charge = 0.0, mass = 2470.88, lifetime = 1.12e-13, evtgenname = 'anti-Xi_c0', pythiaid = -4132, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_c0', geantid = 4132, pdgid = 4132, charge = 0.0, mass = 2470.88, lifetime = 1.12e-13, evtgenname = 'Xi_c0', pythiaid = 4132, maxwidth = 0.0),
- ParticleInfo(name = 'anti-cu_0', geantid = -4201, pdgid = -4201, charge = -1.3, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-cu_0', pythiaid = -4201, maxwidth = 0.0),
- ParticleInfo(name = 'cu_0', geantid = 4201, pdgid = 4201, charge = 1.3, mass = 0.0, lifetime = 0.0, evtgenname = 'cu_0', pythiaid = 4201, maxwidth = 0.0),
- ParticleInfo(name = 'anti-cu_1', geantid = -4203, pdgid = -4203, charge = -1.3, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-cu_1', pythiaid = -4203, maxwidth = 0.0),
- ParticleInfo(name = 'cu_1', geantid = 4203, pdgid = 4203, charge = 1.3, mass = 0.0, lifetime = 0.0, evtgenname = 'cu_1', pythiaid = 4203, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_c~-', geantid = -4212, pdgid = -4212, charge = -1.0, mass = 2452.9, lifetime = 3.9999990000000003e-22, evtgenname = 'anti-Sigma_c-', pythiaid = -4212, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_c+', geantid = 4212, pdgid = 4212, charge = 1.0, mass = 2452.9, lifetime = 3.9999990000000003e-22, evtgenname = 'Sigma_c+', pythiaid = 4212, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_c*~-', geantid = -4214, pdgid = -4214, charge = -1.0, mass = 2517.5, lifetime = 3.291061e-22, evtgenname = 'anti-Sigma_c*-', pythiaid = -4214, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_c*+', geantid = 4214, pdgid = 4214, charge = 1.0, mass = 2517.5, lifetime = 3.291061e-22, evtgenname = 'Sigma_c*+', pythiaid = 4214, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_c~--', geantid = -4222, pdgid = -4222, charge = -2.0, mass = 2453.98, lifetime = 2.912443e-22, evtgenname = 'anti-Sigma_c--', pythiaid = -4222, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_c++', geantid = 4222, pdgid = 4222, charge = 2.0, mass = 2453.98, lifetime = 2.912443e-22, evtgenname = 'Sigma_c++', pythiaid = 4222, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_c*~--', geantid = -4224, pdgid = -4224, charge = -2.0, mass = 2517.9, lifetime = 4.417531e-23, evtgenname = 'anti-Sigma_c*--', pythiaid = -4224, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_c*++', geantid = 4224, pdgid = 4224, charge = 2.0, mass = 2517.9, lifetime = 4.417531e-23, evtgenname = 'Sigma_c*++', pythiaid = 4224, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_c~-', geantid = -4232, pdgid = -4232, charge = -1.0, mass = 2467.8, lifetime = 4.4200000000000004e-13, evtgenname = 'anti-Xi_c-', pythiaid = -4232, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_c+', geantid = 4232, pdgid = 4232, charge = 1.0, mass = 2467.8, lifetime = 4.4200000000000004e-13, evtgenname = 'Xi_c+', pythiaid = 4232, maxwidth = 0.0),
- ParticleInfo(name = 'anti-cs_0', geantid = -4301, pdgid = -4301, charge = -0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-cs_0', pythiaid = -4301, maxwidth = 0.0),
- ParticleInfo(name = 'cs_0', geantid = 4301, pdgid = 4301, charge = 0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'cs_0', pythiaid = 4301, maxwidth = 0.0),
- ParticleInfo(name = 'anti-cs_1', geantid = -4303, pdgid = -4303, charge = -0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-cs_1', pythiaid = -4303, maxwidth = 0.0),
- ParticleInfo(name = 'cs_1', geantid = 4303, pdgid = 4303, charge = 0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'cs_1', pythiaid = 4303, maxwidth = 0.0),
- ParticleInfo(name = "Xi'_c~0", geantid = -4312, pdgid = -4312, charge = 0.0, mass = 2577.9, lifetime = 0.0, evtgenname = "anti-Xi'_c0", pythiaid = -4312, maxwidth = 0.0),
- ParticleInfo(name = "Xi'_c0", geantid = 4312, pdgid = 4312, charge = 0.0, mass = 2577.9, lifetime = 0.0, evtgenname = "Xi'_c0", pythiaid = 4312, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_c*~0', geantid = -4314, pdgid = -4314, charge = 0.0, mass = 2645.9, lifetime = 0.0, evtgenname = 'anti-Xi_c*0', pythiaid = -4314, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_c*0', geantid = 4314, pdgid = 4314, charge = 0.0, mass = 2645.9, lifetime = 0.0, evtgenname = 'Xi_c*0', pythiaid = 4314, maxwidth = 0.0),
- ParticleInfo(name = "Xi'_c~-", geantid = -4322, pdgid = -4322, charge = -1.0, mass = 2575.6, lifetime = 0.0, evtgenname = "anti-Xi'_c-", pythiaid = -4322, maxwidth = 0.0),
- ParticleInfo(name = "Xi'_c+", geantid = 4322, pdgid = 4322, charge = 1.0, mass = 2575.6, lifetime = 0.0, evtgenname = "Xi'_c+", pythiaid = 4322, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_c*~-', geantid = -4324, pdgid = -4324, charge = -1.0, mass = 2645.9, lifetime = 0.0, evtgenname = 'anti-Xi_c*-', pythiaid = -4324, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_c*+', geantid = 4324, pdgid = 4324, charge = 1.0, mass = 2645.9, lifetime = 0.0, evtgenname = 'Xi_c*+', pythiaid = 4324, maxwidth = 0.0),
- ParticleInfo(name = 'Omega_c~0', geantid = -4332, pdgid = -4332, charge = 0.0, mass = 2695.2, lifetime = 6.9e-14, evtgenname = 'anti-Omega_c0', pythiaid = -4332, maxwidth = 0.0),
- ParticleInfo(name = 'Omega_c0', geantid = 4332, pdgid = 4332, charge = 0.0, mass = 2695.2, lifetime = 6.9e-14, evtgenname = 'Omega_c0', pythiaid = 4332, maxwidth = 0.0),
- ParticleInfo(name = 'Omega_c*~0', geantid = -4334, pdgid = -4334, charge = 0.0, mass = 2765.8999999999996, lifetime = 0.0, evtgenname = 'anti-Omega_c*0', pythiaid = -4334, maxwidth = 0.0),
- ParticleInfo(name = 'Omega_c*0', geantid = 4334, pdgid = 4334, charge = 0.0, mass = 2765.8999999999996, lifetime = 0.0, evtgenname = 'Omega_c*0', pythiaid = 4334, maxwidth = 0.0),
- ParticleInfo(name = 'anti-cc_1', geantid = -4403, pdgid = -4403, charge = -1.3, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-cc_1', pythiaid = -4403, maxwidth = 0.0),
- ParticleInfo(name = 'cc_1', geantid = 4403, pdgid = 4403, charge = 1.3, mass = 0.0, lifetime = 0.0, evtgenname = 'cc_1', pythiaid = 4403, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_cc~-', geantid = -4412, pdgid = -4412, charge = -1.0, mass = 3621.4, lifetime = 3.335641e-13, evtgenname = 'anti-Xi_cc-', pythiaid = -4412, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_cc+', geantid = 4412, pdgid = 4412, charge = 1.0, mass = 3621.4, lifetime = 3.335641e-13, evtgenname = 'Xi_cc+', pythiaid = 4412, maxwidth = 0.0),
- ParticleInfo(name = 'Xi*_cc~-', geantid = -4414, pdgid = -4414, charge = -1.0, mass = 3656.48, lifetime = 0.0, evtgenname = 'anti-Xi_cc*-', pythiaid = -4414, maxwidth = 0.0),
- ParticleInfo(name = 'Xi*_cc+', geantid = 4414, pdgid = 4414, charge = 1.0, mass = 3656.48, lifetime = 0.0, evtgenname = 'Xi_cc*+', pythiaid = 4414, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_cc~--', geantid = -4422, pdgid = -4422, charge = -2.0, mass = 3621.4, lifetime = 3.335641e-13, evtgenname = 'anti-Xi_cc--', pythiaid = -4422, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_cc++', geantid = 4422, pdgid = 4422, charge = 2.0, mass = 3621.4, lifetime = 3.335641e-13, evtgenname = 'Xi_cc++', pythiaid = 4422, maxwidth = 0.0),
- ParticleInfo(name = 'Xi*_cc~--', geantid = -4424, pdgid = -4424, charge = -2.0, mass = 3656.48, lifetime = 0.0, evtgenname = 'anti-Xi_cc*--', pythiaid = -4424, maxwidth = 0.0),
- ParticleInfo(name = 'Xi*_cc++', geantid = 4424, pdgid = 4424, charge = 2.0, mass = 3656.48, lifetime = 0.0, evtgenname = 'Xi_cc*++', pythiaid = 4424, maxwidth = 0.0),
- ParticleInfo(name = 'Omega_cc~-', geantid = -4432, pdgid = -4432, charge = -1.0, mass = 3786.63, lifetime = 3.335641e-13, evtgenname = 'anti-Omega_cc-', pythiaid = -4432, maxwidth = 0.0),
- ParticleInfo(name = 'Omega_cc+', geantid = 4432, pdgid = 4432, charge = 1.0, mass = 3786.63, lifetime = 3.335641e-13, evtgenname = 'Omega_cc+', pythiaid = 4432, maxwidth = 0.0),
- ParticleInfo(name = 'Omega*_cc~-', geantid = -4434, pdgid = -4434, charge = -1.0, mass = 3824.6600000000003, lifetime = 0.0, evtgenname = 'anti-Omega_cc*-', pythiaid = -4434, maxwidth = 0.0),
- ParticleInfo(name = 'Omega*_cc+', geantid = 4434, pdgid = 4434, charge = 1.0, mass = 3824.6600000000003, lifetime = 0.0, evtgenname = 'Omega_cc*+', pythiaid = 4434, maxwidth = 0.0),
- ParticleInfo(name = 'Omega*_ccc~--', geantid = -4444, pdgid = -4444, charge = -2.0, mass = 4915.94, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -4444, maxwidth = 0.0),
- ParticleInfo(name = 'Omega*_ccc++', geantid = 4444, pdgid = 4444, charge = 2.0, mass = 4915.94, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 4444, maxwidth = 0.0),
- ParticleInfo(name = 'anti-bd_0', geantid = -5101, pdgid = -5101, charge = 0.7, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-bd_0', pythiaid = -5101, maxwidth = 0.0),
- ParticleInfo(name = 'bd_0', geantid = 5101, pdgid = 5101, charge = -0.7, mass = 0.0, lifetime = 0.0, evtgenname = 'bd_0', pythiaid = 5101, maxwidth = 0.0),
- ParticleInfo(name = 'anti-bd_1', geantid = -5103, pdgid = -5103, charge = 0.7, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-bd_1', pythiaid = -5103, maxwidth = 0.0),
- ParticleInfo(name = 'bd_1', geantid = 5103, pdgid = 5103, charge = -0.7, mass = 0.0, lifetime = 0.0, evtgenname = 'bd_1', pythiaid = 5103, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_b~+', geantid = -5112, pdgid = -5112, charge = 1.0, mass = 5815.5, lifetime = 1.34329e-22, evtgenname = 'anti-Sigma_b+', pythiaid = -5112, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_b-', geantid = 5112, pdgid = 5112, charge = -1.0, mass = 5815.5, lifetime = 1.34329e-22, evtgenname = 'Sigma_b-', pythiaid = 5112, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_b*~+', geantid = -5114, pdgid = -5114, charge = 1.0, mass = 5835.099999999999, lifetime = 8.776160000000001e-23, evtgenname = 'anti-Sigma_b*+', pythiaid = -5114, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_b*-', geantid = 5114, pdgid = 5114, charge = -1.0, mass = 5835.099999999999, lifetime = 8.776160000000001e-23, evtgenname = 'Sigma_b*-', pythiaid = 5114, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda_b~0', geantid = -5122, pdgid = -5122, charge = 0.0, mass = 5619.5, lifetime = 1.4510000000000002e-12, evtgenname = 'anti-Lambda_b0', pythiaid = -5122, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda_b0', geantid = 5122, pdgid = 5122, charge = 0.0, mass = 5619.5, lifetime = 1.4510000000000002e-12, evtgenname = 'Lambda_b0', pythiaid = 5122, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda_b(5920)~0', geantid = -5124, pdgid = -5124, charge = 0.0, mass = 5919.7699999999995, lifetime = 1.3160000000000002e-21, evtgenname = 'anti-Lambda_b(5920)0', pythiaid = -5124, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda_b(5920)0', geantid = 5124, pdgid = 5124, charge = 0.0, mass = 5919.7699999999995, lifetime = 1.3160000000000002e-21, evtgenname = 'Lambda_b(5920)0', pythiaid = 5124, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_b~+', geantid = -5132, pdgid = -5132, charge = 1.0, mass = 5794.900000000001, lifetime = 1.56e-12, evtgenname = 'anti-Xi_b+', pythiaid = -5132, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_b-', geantid = 5132, pdgid = 5132, charge = -1.0, mass = 5794.900000000001, lifetime = 1.56e-12, evtgenname = 'Xi_b-', pythiaid = 5132, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_bc~0', geantid = -5142, pdgid = -5142, charge = 0.0, mass = 6900.0, lifetime = 5.000000000000001e-13, evtgenname = 'anti-Xi_bc0', pythiaid = -5142, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_bc0', geantid = 5142, pdgid = 5142, charge = 0.0, mass = 6900.0, lifetime = 5.000000000000001e-13, evtgenname = 'Xi_bc0', pythiaid = 5142, maxwidth = 0.0),
- ParticleInfo(name = 'anti-bu_0', geantid = -5201, pdgid = -5201, charge = -0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-bu_0', pythiaid = -5201, maxwidth = 0.0),
- ParticleInfo(name = 'bu_0', geantid = 5201, pdgid = 5201, charge = 0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'bu_0', pythiaid = 5201, maxwidth = 0.0),
- ParticleInfo(name = 'anti-bu_1', geantid = -5203, pdgid = -5203, charge = -0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-bu_1', pythiaid = -5203, maxwidth = 0.0),
- ParticleInfo(name = 'bu_1', geantid = 5203, pdgid = 5203, charge = 0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'bu_1', pythiaid = 5203, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_b~0', geantid = -5212, pdgid = -5212, charge = 0.0, mass = 5807.8, lifetime = 1.0000000000000001e-19, evtgenname = 'anti-Sigma_b0', pythiaid = -5212, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_b0', geantid = 5212, pdgid = 5212, charge = 0.0, mass = 5807.8, lifetime = 1.0000000000000001e-19, evtgenname = 'Sigma_b0', pythiaid = 5212, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_b*~0', geantid = -5214, pdgid = -5214, charge = 0.0, mass = 5829.0, lifetime = 0.0, evtgenname = 'anti-Sigma_b*0', pythiaid = -5214, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_b*0', geantid = 5214, pdgid = 5214, charge = 0.0, mass = 5829.0, lifetime = 0.0, evtgenname = 'Sigma_b*0', pythiaid = 5214, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_b~-', geantid = -5222, pdgid = -5222, charge = -1.0, mass = 5811.3, lifetime = 6.785693e-23, evtgenname = 'anti-Sigma_b-', pythiaid = -5222, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_b+', geantid = 5222, pdgid = 5222, charge = 1.0, mass = 5811.3, lifetime = 6.785693e-23, evtgenname = 'Sigma_b+', pythiaid = 5222, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_b*~-', geantid = -5224, pdgid = -5224, charge = -1.0, mass = 5832.099999999999, lifetime = 5.723583e-23, evtgenname = 'anti-Sigma_b*-', pythiaid = -5224, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma_b*+', geantid = 5224, pdgid = 5224, charge = 1.0, mass = 5832.099999999999, lifetime = 5.723583e-23, evtgenname = 'Sigma_b*+', pythiaid = 5224, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_b~0', geantid = -5232, pdgid = -5232, charge = 0.0, mass = 5793.1, lifetime = 1.4900000000000001e-12, evtgenname = 'anti-Xi_b0', pythiaid = -5232, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_b0', geantid = 5232, pdgid = 5232, charge = 0.0, mass = 5793.1, lifetime = 1.4900000000000001e-12, evtgenname = 'Xi_b0', pythiaid = 5232, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_bc~-', geantid = -5242, pdgid = -5242, charge = -1.0, mass = 6900.0, lifetime = 5.000000000000001e-13, evtgenname = 'anti-Xi_bc-', pythiaid = -5242, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_bc+', geantid = 5242, pdgid = 5242, charge = 1.0, mass = 6900.0, lifetime = 5.000000000000001e-13, evtgenname = 'Xi_bc+', pythiaid = 5242, maxwidth = 0.0),
- ParticleInfo(name = 'anti-bs_0', geantid = -5301, pdgid = -5301, charge = 0.7, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-bs_0', pythiaid = -5301, maxwidth = 0.0),
- ParticleInfo(name = 'bs_0', geantid = 5301, pdgid = 5301, charge = -0.7, mass = 0.0, lifetime = 0.0, evtgenname = 'bs_0', pythiaid = 5301, maxwidth = 0.0),
- ParticleInfo(name = 'anti-bs_1', geantid = -5303, pdgid = -5303, charge = 0.7, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-bs_1', pythiaid = -5303, maxwidth = 0.0),
- ParticleInfo(name = 'bs_1', geantid = 5303, pdgid = 5303, charge = -0.7, mass = 0.0, lifetime = 0.0, evtgenname = 'bs_1', pythiaid = 5303, maxwidth = 0.0),
- ParticleInfo(name = "Xi'_b~+", geantid = -5312, pdgid = -5312, charge = 1.0, mass = 5960.0, lifetime = 1.0000000000000001e-19, evtgenname = "anti-Xi'_b+", pythiaid = -5312, maxwidth = 0.0),
- ParticleInfo(name = "Xi'_b-", geantid = 5312, pdgid = 5312, charge = -1.0, mass = 5960.0, lifetime = 1.0000000000000001e-19, evtgenname = "Xi'_b-", pythiaid = 5312, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_b*~+', geantid = -5314, pdgid = -5314, charge = 1.0, mass = 5970.0, lifetime = 0.0, evtgenname = 'anti-Xi_b*+', pythiaid = -5314, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_b*-', geantid = 5314, pdgid = 5314, charge = -1.0, mass = 5970.0, lifetime = 0.0, evtgenname = 'Xi_b*-', pythiaid = 5314, maxwidth = 0.0),
- ParticleInfo(name = "Xi'_b~0", geantid = -5322, pdgid = -5322, charge = 0.0, mass = 5960.0, lifetime = 1.0000000000000001e-19, evtgenname = "anti-Xi'_b0", pythiaid = -5322, maxwidth = 0.0),
- ParticleInfo(name = "Xi'_b0", geantid = 5322, pdgid = 5322, charge = 0.0, mass = 5960.0, lifetime = 1.0000000000000001e-19, evtgenname = "Xi'_b0", pythiaid = 5322, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_b*~0', geantid = -5324, pdgid = -5324, charge = 0.0, mass = 5970.0, lifetime = 0.0, evtgenname = 'anti-Xi_b*0', pythiaid = -5324, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_b*0', geantid = 5324, pdgid = 5324, charge = 0.0, mass = 5970.0, lifetime = 0.0, evtgenname = 'Xi_b*0', pythiaid = 5324, maxwidth = 0.0),
- ParticleInfo(name = 'Omega_b~+', geantid = -5332, pdgid = -5332, charge = 1.0, mass = 6048.8, lifetime = 1.1e-12, evtgenname = 'anti-Omega_b+', pythiaid = -5332, maxwidth = 0.0),
- ParticleInfo(name = 'Omega_b-', geantid = 5332, pdgid = 5332, charge = -1.0, mass = 6048.8, lifetime = 1.1e-12, evtgenname = 'Omega_b-', pythiaid = 5332, maxwidth = 0.0),
- ParticleInfo(name = 'Omega_b*~+', geantid = -5334, pdgid = -5334, charge = 1.0, mass = 6130.0, lifetime = 0.0, evtgenname = 'anti-Omega_b*+', pythiaid = -5334, maxwidth = 0.0),
- ParticleInfo(name = 'Omega_b*-', geantid = 5334, pdgid = 5334, charge = -1.0, mass = 6130.0, lifetime = 0.0, evtgenname = 'Omega_b*-', pythiaid = 5334, maxwidth = 0.0),
- ParticleInfo(name = 'Omega_bc~0', geantid = -5342, pdgid = -5342, charge = 0.0, mass = 7190.99, lifetime = 5.000000000000001e-13, evtgenname = 'unknown', pythiaid = -5342, maxwidth = 0.0),
- ParticleInfo(name = 'Omega_bc0', geantid = 5342, pdgid = 5342, charge = 0.0, mass = 7190.99, lifetime = 5.000000000000001e-13, evtgenname = 'unknown', pythiaid = 5342, maxwidth = 0.0),
- ParticleInfo(name = 'anti-bc_0', geantid = -5401, pdgid = -5401, charge = -0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-bc_0', pythiaid = -5401, maxwidth = 0.0),
- ParticleInfo(name = 'bc_0', geantid = 5401, pdgid = 5401, charge = 0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'bc_0', pythiaid = 5401, maxwidth = 0.0),
- ParticleInfo(name = 'anti-bc_1', geantid = -5403, pdgid = -5403, charge = -0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-bc_1', pythiaid = -5403, maxwidth = 0.0),
- ParticleInfo(name = 'bc_1', geantid = 5403, pdgid = 5403, charge = 0.3, mass = 0.0, lifetime = 0.0, evtgenname = 'bc_1', pythiaid = 5403, maxwidth = 0.0),
- ParticleInfo(name = "Xi'_bc~0", geantid = -5412, pdgid = -5412, charge = 0.0, mass = 7037.24, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -5412, maxwidth = 0.0),
- ParticleInfo(name = "Xi'_bc0", geantid = 5412, pdgid = 5412, charge = 0.0, mass = 7037.24, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 5412, maxwidth = 0.0),
- ParticleInfo(name = 'Xi*_bc~0', geantid = -5414, pdgid = -5414, charge = 0.0, mass = 7048.5, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -5414, maxwidth = 0.0),
- ParticleInfo(name = 'Xi*_bc0', geantid = 5414, pdgid = 5414, charge = 0.0, mass = 7048.5, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 5414, maxwidth = 0.0),
- ParticleInfo(name = "Xi'_bc~-", geantid = -5422, pdgid = -5422, charge = -1.0, mass = 7037.24, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -5422, maxwidth = 0.0),
- ParticleInfo(name = "Xi'_bc+", geantid = 5422, pdgid = 5422, charge = 1.0, mass = 7037.24, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 5422, maxwidth = 0.0),
- ParticleInfo(name = 'Xi*_bc~-', geantid = -5424, pdgid = -5424, charge = -1.0, mass = 7048.5, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -5424, maxwidth = 0.0),
- ParticleInfo(name = 'Xi*_bc+', geantid = 5424, pdgid = 5424, charge = 1.0, mass = 7048.5, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 5424, maxwidth = 0.0),
- ParticleInfo(name = "Omega'_bc~0", geantid = -5432, pdgid = -5432, charge = 0.0, mass = 7211.01, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -5432, maxwidth = 0.0),
- ParticleInfo(name = "Omega'_bc0", geantid = 5432, pdgid = 5432, charge = 0.0, mass = 7211.01, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 5432, maxwidth = 0.0),
- ParticleInfo(name = 'Omega*_bc~0', geantid = -5434, pdgid = -5434, charge = 0.0, mass = 7219.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -5434, maxwidth = 0.0),
- ParticleInfo(name = 'Omega*_bc0', geantid = 5434, pdgid = 5434, charge = 0.0, mass = 7219.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 5434, maxwidth = 0.0),
- ParticleInfo(name = 'Omega_bcc~-', geantid = -5442, pdgid = -5442, charge = -1.0, mass = 8309.45, lifetime = 1.290893e-12, evtgenname = 'unknown', pythiaid = -5442, maxwidth = 0.0),
- ParticleInfo(name = 'Omega_bcc+', geantid = 5442, pdgid = 5442, charge = 1.0, mass = 8309.45, lifetime = 1.290893e-12, evtgenname = 'unknown', pythiaid = 5442, maxwidth = 0.0),
- ParticleInfo(name = 'Omega*_bcc~-', geantid = -5444, pdgid = -5444, charge = -1.0, mass = 8313.25, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -5444, maxwidth = 0.0),
- ParticleInfo(name = 'Omega*_bcc+', geantid = 5444, pdgid = 5444, charge = 1.0, mass = 8313.25, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 5444, maxwidth = 0.0),
- ParticleInfo(name = 'anti-bb_1', geantid = -5503, pdgid = -5503, charge = 0.7, mass = 0.0, lifetime = 0.0, evtgenname = 'anti-bb_1', pythiaid = -5503, maxwidth = 0.0),
- ParticleInfo(name = 'bb_1', geantid = 5503, pdgid = 5503, charge = -0.7, mass = 0.0, lifetime = 0.0, evtgenname = 'bb_1', pythiaid = 5503, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_bb~+', geantid = -5512, pdgid = -5512, charge = 1.0, mass = 10422.72, lifetime = 1.290893e-12, evtgenname = 'unknown', pythiaid = -5512, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_bb-', geantid = 5512, pdgid = 5512, charge = -1.0, mass = 10422.72, lifetime = 1.290893e-12, evtgenname = 'unknown', pythiaid = 5512, maxwidth = 0.0),
- ParticleInfo(name = 'Xi*_bb~+', geantid = -5514, pdgid = -5514, charge = 1.0, mass = 10441.44, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -5514, maxwidth = 0.0),
- ParticleInfo(name = 'Xi*_bb-', geantid = 5514, pdgid = 5514, charge = -1.0, mass = 10441.44, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 5514, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_bb~0', geantid = -5522, pdgid = -5522, charge = 0.0, mass = 10422.72, lifetime = 1.290893e-12, evtgenname = 'unknown', pythiaid = -5522, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_bb0', geantid = 5522, pdgid = 5522, charge = 0.0, mass = 10422.72, lifetime = 1.290893e-12, evtgenname = 'unknown', pythiaid = 5522, maxwidth = 0.0),
- ParticleInfo(name = 'Xi*_bb~0', geantid = -5524, pdgid = -5524, charge = 0.0, mass = 10441.44, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -5524, maxwidth = 0.0),
- ParticleInfo(name = 'Xi*_bb0', geantid = 5524, pdgid = 5524, charge = 0.0, mass = 10441.44, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 5524, maxwidth = 0.0),
- ParticleInfo(name = 'Omega_bb~+', geantid = -5532, pdgid = -5532, charge = 1.0, mass = 10602.09, lifetime = 1.290893e-12, evtgenname = 'unknown', pythiaid = -5532, maxwidth = 0.0),
- ParticleInfo(name = 'Omega_bb-', geantid = 5532, pdgid = 5532, charge = -1.0, mass = 10602.09, lifetime = 1.290893e-12, evtgenname = 'unknown', pythiaid = 5532, maxwidth = 0.0),
- ParticleInfo(name = 'Omega*_bb~+', geantid = -5534, pdgid = -5534, charge = 1.0, mass = 10614.26, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -5534, maxwidth = 0.0),
- ParticleInfo(name = 'Omega*_bb-', geantid = 5534, pdgid = 5534, charge = -1.0, mass = 10614.26, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 5534, maxwidth = 0.0),
- ParticleInfo(name = 'Omega_bbc~0', geantid = -5542, pdgid = -5542, charge = 0.0, mass = 11707.67, lifetime = 1.290893e-12, evtgenname = 'unknown', pythiaid = -5542, maxwidth = 0.0),
- ParticleInfo(name = 'Omega_bbc0', geantid = 5542, pdgid = 5542, charge = 0.0, mass = 11707.67, lifetime = 1.290893e-12, evtgenname = 'unknown', pythiaid = 5542, maxwidth = 0.0),
- ParticleInfo(name = 'Omega*_bbc~0', geantid = -5544, pdgid = -5544, charge = 0.0, mass = 11711.470000000001, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -5544, maxwidth = 0.0),
- ParticleInfo(name = 'Omega*_bbc0', geantid = 5544, pdgid = 5544, charge = 0.0, mass = 11711.470000000001, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 5544, maxwidth = 0.0),
- ParticleInfo(name = 'Omega*_bbb~+', geantid = -5554, pdgid = -5554, charge = 1.0, mass = 15110.609999999999, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -5554, maxwidth = 0.0),
- ParticleInfo(name = 'Omega*_bbb-', geantid = 5554, pdgid = 5554, charge = -1.0, mass = 15110.609999999999, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 5554, maxwidth = 0.0),
- ParticleInfo(name = 'vpho', geantid = 10022, pdgid = 10022, charge = 0.0, mass = 0.0, lifetime = 0.0, evtgenname = 'vpho', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'a_0(1450)0', geantid = 10111, pdgid = 10111, charge = 0.0, mass = 1474.0, lifetime = 2.4838200000000004e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'b_1(1235)0', geantid = 10113, pdgid = 10113, charge = 0.0, mass = 1229.5, lifetime = 4.6352970000000006e-24, evtgenname = 'b_10', pythiaid = 10113, maxwidth = 0.0),
- ParticleInfo(name = 'pi_2(1670)0', geantid = 10115, pdgid = 10115, charge = 0.0, mass = 1672.1999999999998, lifetime = 2.531585e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'a_0(1450)-', geantid = -10211, pdgid = -10211, charge = -1.0, mass = 1474.0, lifetime = 2.4838200000000004e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'a_0(1450)+', geantid = 10211, pdgid = 10211, charge = 1.0, mass = 1474.0, lifetime = 2.4838200000000004e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'b_1(1235)-', geantid = -10213, pdgid = -10213, charge = -1.0, mass = 1229.5, lifetime = 4.6352970000000006e-24, evtgenname = 'b_1-', pythiaid = -10213, maxwidth = 0.0),
- ParticleInfo(name = 'b_1(1235)+', geantid = 10213, pdgid = 10213, charge = 1.0, mass = 1229.5, lifetime = 4.6352970000000006e-24, evtgenname = 'b_1+', pythiaid = 10213, maxwidth = 0.0),
- ParticleInfo(name = 'pi_2(1670)-', geantid = -10215, pdgid = -10215, charge = -1.0, mass = 1672.1999999999998, lifetime = 2.531585e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'pi_2(1670)+', geantid = 10215, pdgid = 10215, charge = 1.0, mass = 1672.1999999999998, lifetime = 2.531585e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'f_0(1370)', geantid = 10221, pdgid = 10221, charge = 0.0, mass = 1350.0, lifetime = 1.880606e-24, evtgenname = "f'_0", pythiaid = 10331, maxwidth = 0.0),
- ParticleInfo(name = 'h_1(1170)', geantid = 10223, pdgid = 10223, charge = 0.0, mass = 1170.0, lifetime = 1.828367e-24, evtgenname = 'h_1', pythiaid = 10223, maxwidth = 0.0),
- ParticleInfo(name = 'eta_2(1645)', geantid = 10225, pdgid = 10225, charge = 0.0, mass = 1617.0, lifetime = 3.636531e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K*_0(1430)~0', geantid = -10311, pdgid = -10311, charge = 0.0, mass = 1425.0, lifetime = 2.437823e-24, evtgenname = 'anti-K_0*0', pythiaid = -10311, maxwidth = 0.0),
- ParticleInfo(name = 'K*_0(1430)0', geantid = 10311, pdgid = 10311, charge = 0.0, mass = 1425.0, lifetime = 2.437823e-24, evtgenname = 'K_0*0', pythiaid = 10311, maxwidth = 0.0),
- ParticleInfo(name = 'K_1(1270)~0', geantid = -10313, pdgid = -10313, charge = 0.0, mass = 1272.0, lifetime = 7.313469000000002e-24, evtgenname = 'anti-K_10', pythiaid = -10313, maxwidth = 0.0),
- ParticleInfo(name = 'K_1(1270)0', geantid = 10313, pdgid = 10313, charge = 0.0, mass = 1272.0, lifetime = 7.313469000000002e-24, evtgenname = 'K_10', pythiaid = 10313, maxwidth = 0.0),
- ParticleInfo(name = 'K_2(1770)~0', geantid = -10315, pdgid = -10315, charge = 0.0, mass = 1773.0, lifetime = 3.538775e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K_2(1770)0', geantid = 10315, pdgid = 10315, charge = 0.0, mass = 1773.0, lifetime = 3.538775e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K*_0(1430)-', geantid = -10321, pdgid = -10321, charge = -1.0, mass = 1425.0, lifetime = 2.437823e-24, evtgenname = 'K_0*-', pythiaid = -10321, maxwidth = 0.0),
- ParticleInfo(name = 'K*_0(1430)+', geantid = 10321, pdgid = 10321, charge = 1.0, mass = 1425.0, lifetime = 2.437823e-24, evtgenname = 'K_0*+', pythiaid = 10321, maxwidth = 0.0),
- ParticleInfo(name = 'K_1(1270)-', geantid = -10323, pdgid = -10323, charge = -1.0, mass = 1272.0, lifetime = 7.313469000000002e-24, evtgenname = 'K_1-', pythiaid = -10323, maxwidth = 0.0),
- ParticleInfo(name = 'K_1(1270)+', geantid = 10323, pdgid = 10323, charge = 1.0, mass = 1272.0, lifetime = 7.313469000000002e-24, evtgenname = 'K_1+', pythiaid = 10323, maxwidth = 0.0),
- ParticleInfo(name = 'K_2(1770)-', geantid = -10325, pdgid = -10325, charge = -1.0, mass = 1773.0, lifetime = 3.538775e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K_2(1770)+', geantid = 10325, pdgid = 10325, charge = 1.0, mass = 1773.0, lifetime = 3.538775e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'f_0(1710)', geantid = 10331, pdgid = 10331, charge = 0.0, mass = 1722.0, lifetime = 4.875646e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'h_1(1380)', geantid = 10333, pdgid = 10333, charge = 0.0, mass = 1400.0, lifetime = 0.0, evtgenname = "h'_1", pythiaid = 10333, maxwidth = 0.0),
- ParticleInfo(name = 'eta_2(1870)', geantid = 10335, pdgid = 10335, charge = 0.0, mass = 1854.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'D*_0-', geantid = -10411, pdgid = -10411, charge = -1.0, mass = 2318.0, lifetime = 2.465213e-24, evtgenname = 'D_0*-', pythiaid = -10411, maxwidth = 0.0),
- ParticleInfo(name = 'D*_0+', geantid = 10411, pdgid = 10411, charge = 1.0, mass = 2318.0, lifetime = 2.465213e-24, evtgenname = 'D_0*+', pythiaid = 10411, maxwidth = 0.0),
- ParticleInfo(name = 'D_1(2420)-', geantid = -10413, pdgid = -10413, charge = -1.0, mass = 2423.0, lifetime = 3.290000000000001e-23, evtgenname = 'D_1-', pythiaid = -10413, maxwidth = 0.0),
- ParticleInfo(name = 'D_1(2420)+', geantid = 10413, pdgid = 10413, charge = 1.0, mass = 2423.0, lifetime = 3.290000000000001e-23, evtgenname = 'D_1+', pythiaid = 10413, maxwidth = 0.0),
- ParticleInfo(name = 'D*_0~0', geantid = -10421, pdgid = -10421, charge = 0.0, mass = 2318.0, lifetime = 2.465213e-24, evtgenname = 'anti-D_0*0', pythiaid = -10421, maxwidth = 0.0),
- ParticleInfo(name = 'D*_00', geantid = 10421, pdgid = 10421, charge = 0.0, mass = 2318.0, lifetime = 2.465213e-24, evtgenname = 'D_0*0', pythiaid = 10421, maxwidth = 0.0),
- ParticleInfo(name = 'D_1(2420)~0', geantid = -10423, pdgid = -10423, charge = 0.0, mass = 2421.4, lifetime = 2.428827e-23, evtgenname = 'anti-D_10', pythiaid = -10423, maxwidth = 0.0),
- ParticleInfo(name = 'D_1(2420)0', geantid = 10423, pdgid = 10423, charge = 0.0, mass = 2421.4, lifetime = 2.428827e-23, evtgenname = 'D_10', pythiaid = 10423, maxwidth = 0.0),
- ParticleInfo(name = 'D*_s0-', geantid = -10431, pdgid = -10431, charge = -1.0, mass = 2317.7, lifetime = 6.5821e-22, evtgenname = 'D_s0*-', pythiaid = -10431, maxwidth = 0.0),
- ParticleInfo(name = 'D*_s0+', geantid = 10431, pdgid = 10431, charge = 1.0, mass = 2317.7, lifetime = 6.5821e-22, evtgenname = 'D_s0*+', pythiaid = 10431, maxwidth = 0.0),
- ParticleInfo(name = 'D_s1(2536)-', geantid = -10433, pdgid = -10433, charge = -1.0, mass = 2535.1, lifetime = 7.15448e-22, evtgenname = "D'_s1-", pythiaid = -10433, maxwidth = 0.0),
- ParticleInfo(name = 'D_s1(2536)+', geantid = 10433, pdgid = 10433, charge = 1.0, mass = 2535.1, lifetime = 7.15448e-22, evtgenname = "D'_s1+", pythiaid = 10433, maxwidth = 0.0),
- ParticleInfo(name = 'chi_c0(1P)', geantid = 10441, pdgid = 10441, charge = 0.0, mass = 3414.75, lifetime = 6.328963e-23, evtgenname = 'chi_c0', pythiaid = 10441, maxwidth = 0.0),
- ParticleInfo(name = 'h_c(1P)', geantid = 10443, pdgid = 10443, charge = 0.0, mass = 3525.38, lifetime = 9.403029e-22, evtgenname = 'h_c', pythiaid = 10443, maxwidth = 0.0),
- ParticleInfo(name = 'B*_0~0', geantid = -10511, pdgid = -10511, charge = 0.0, mass = 5738.0, lifetime = 4.3900000000000004e-24, evtgenname = 'anti-B_0*0', pythiaid = -10511, maxwidth = 0.0),
- ParticleInfo(name = 'B*_00', geantid = 10511, pdgid = 10511, charge = 0.0, mass = 5738.0, lifetime = 4.3900000000000004e-24, evtgenname = 'B_0*0', pythiaid = 10511, maxwidth = 0.0),
- ParticleInfo(name = 'B_1(L)~0', geantid = -10513, pdgid = -10513, charge = 0.0, mass = 5723.4, lifetime = 3.134e-23, evtgenname = 'anti-B_10', pythiaid = -10513, maxwidth = 0.0),
- ParticleInfo(name = 'B_1(L)0', geantid = 10513, pdgid = 10513, charge = 0.0, mass = 5723.4, lifetime = 3.134e-23, evtgenname = 'B_10', pythiaid = 10513, maxwidth = 0.0),
- ParticleInfo(name = 'B*_0-', geantid = -10521, pdgid = -10521, charge = -1.0, mass = 5738.0, lifetime = 4.3900000000000004e-24, evtgenname = 'B_0*-', pythiaid = -10521, maxwidth = 0.0),
- ParticleInfo(name = 'B*_0+', geantid = 10521, pdgid = 10521, charge = 1.0, mass = 5738.0, lifetime = 4.3900000000000004e-24, evtgenname = 'B_0*+', pythiaid = 10521, maxwidth = 0.0),
- ParticleInfo(name = 'B_1(L)-', geantid = -10523, pdgid = -10523, charge = -1.0, mass = 5723.4, lifetime = 3.134e-23, evtgenname = 'B_1-', pythiaid = -10523, maxwidth = 0.0),
- ParticleInfo(name = 'B_1(L)+', geantid = 10523, pdgid = 10523, charge = 1.0, mass = 5723.4, lifetime = 3.134e-23, evtgenname = 'B_1+', pythiaid = 10523, maxwidth = 0.0),
- ParticleInfo(name = 'B*_s0~0', geantid = -10531, pdgid = -10531, charge = 0.0, mass = 5841.0, lifetime = 4.3900000000000004e-24, evtgenname = 'anti-B_s0*0', pythiaid = -10531, maxwidth = 0.0),
- ParticleInfo(name = 'B*_s00', geantid = 10531, pdgid = 10531, charge = 0.0, mass = 5841.0, lifetime = 4.3900000000000004e-24, evtgenname = 'B_s0*0', pythiaid = 10531, maxwidth = 0.0),
- ParticleInfo(name = 'B_s1(L)~0', geantid = -10533, pdgid = -10533, charge = 0.0, mass = 5828.700000000001, lifetime = 1.316424e-22, evtgenname = 'anti-B_s10', pythiaid = -10533, maxwidth = 0.0),
- ParticleInfo(name = 'B_s1(L)0', geantid = 10533, pdgid = 10533, charge = 0.0, mass = 5828.700000000001, lifetime = 1.316424e-21, evtgenname = 'B_s10', pythiaid = 10533, maxwidth = 0.0),
- ParticleInfo(name = 'B_c0*-', geantid = -10541, pdgid = -10541, charge = -1.0, mass = 7250.0, lifetime = 0.0, evtgenname = 'B_c0*-', pythiaid = -10541, maxwidth = 0.0),
- ParticleInfo(name = 'B_c0*+', geantid = 10541, pdgid = 10541, charge = 1.0, mass = 7250.0, lifetime = 0.0, evtgenname = 'B_c0*+', pythiaid = 10541, maxwidth = 0.0),
- ParticleInfo(name = 'B_c1(L)-', geantid = -10543, pdgid = -10543, charge = -1.0, mass = 7300.0, lifetime = 0.0, evtgenname = 'B_c1-', pythiaid = -10543, maxwidth = 0.0),
- ParticleInfo(name = 'B_c1(L)+', geantid = 10543, pdgid = 10543, charge = 1.0, mass = 7300.0, lifetime = 0.0, evtgenname = 'B_c1+', pythiaid = 10543, maxwidth = 0.0),
- ParticleInfo(name = 'chi_b0(1P)', geantid = 10551, pdgid = 10551, charge = 0.0, mass = 9859.439999999999, lifetime = 0.0, evtgenname = 'chi_b0', pythiaid = 10551, maxwidth = 0.0),
- ParticleInfo(name = 'h_b(1P)', geantid = 10553, pdgid = 10553, charge = 0.0, mass = 9899.300000000001, lifetime = 0.0, evtgenname = 'h_b', pythiaid = 10553, maxwidth = 0.0),
- ParticleInfo(name = 'eta_b2(1D)', geantid = 10555, pdgid = 10555, charge = 0.0, mass = 10157.0, lifetime = 0.0, evtgenname = 'eta_b2(1D)', pythiaid = 10555, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1900)~+', geantid = -11112, pdgid = -11112, charge = 1.0, mass = 1840.0, lifetime = 0.0, evtgenname = 'anti-Delta(1900)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1900)-', geantid = 11112, pdgid = 11112, charge = -1.0, mass = 1840.0, lifetime = 0.0, evtgenname = 'Delta(1900)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1700)~+', geantid = -11114, pdgid = -11114, charge = 1.0, mass = 1700.0, lifetime = 2.194041e-24, evtgenname = 'anti-Delta(1700)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1700)-', geantid = 11114, pdgid = 11114, charge = -1.0, mass = 1700.0, lifetime = 2.194041e-24, evtgenname = 'Delta(1700)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1930)~+', geantid = -11116, pdgid = -11116, charge = 1.0, mass = 1950.0, lifetime = 1.828367e-24, evtgenname = 'anti-Delta(1930)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1930)-', geantid = 11116, pdgid = 11116, charge = -1.0, mass = 1950.0, lifetime = 1.828367e-24, evtgenname = 'Delta(1930)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1900)~0', geantid = -11212, pdgid = -11212, charge = 0.0, mass = 1930.0, lifetime = 1.880606e-24, evtgenname = 'anti-Delta(1900)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1900)0', geantid = 11212, pdgid = 11212, charge = 0.0, mass = 1930.0, lifetime = 1.880606e-24, evtgenname = 'Delta(1900)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1930)~0', geantid = -11216, pdgid = -11216, charge = 0.0, mass = 1950.0, lifetime = 1.828367e-24, evtgenname = 'anti-Delta(1930)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1930)0', geantid = 11216, pdgid = 11216, charge = 0.0, mass = 1950.0, lifetime = 1.828367e-24, evtgenname = 'Delta(1930)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1440)~0', geantid = -12112, pdgid = -12112, charge = 0.0, mass = 1430.0, lifetime = 2.194041e-24, evtgenname = 'anti-N(1440)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1440)0', geantid = 12112, pdgid = 12112, charge = 0.0, mass = 1430.0, lifetime = 2.194041e-24, evtgenname = 'N(1440)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1700)~0', geantid = -12114, pdgid = -12114, charge = 0.0, mass = 1700.0, lifetime = 2.194041e-24, evtgenname = 'anti-Delta(1700)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1700)0', geantid = 12114, pdgid = 12114, charge = 0.0, mass = 1700.0, lifetime = 2.194041e-24, evtgenname = 'Delta(1700)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1680)~0', geantid = -12116, pdgid = -12116, charge = 0.0, mass = 1685.0, lifetime = 5.063171000000001e-24, evtgenname = 'anti-N(1680)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1680)0', geantid = 12116, pdgid = 12116, charge = 0.0, mass = 1685.0, lifetime = 5.063171000000001e-24, evtgenname = 'N(1680)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1990)~0', geantid = -12118, pdgid = -12118, charge = 0.0, mass = 1950.0, lifetime = 0.0, evtgenname = 'anti-N(1990)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1990)0', geantid = 12118, pdgid = 12118, charge = 0.0, mass = 1950.0, lifetime = 0.0, evtgenname = 'N(1990)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1900)~-', geantid = -12122, pdgid = -12122, charge = -1.0, mass = 1840.0, lifetime = 0.0, evtgenname = 'anti-Delta(1900)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1900)+', geantid = 12122, pdgid = 12122, charge = 1.0, mass = 1840.0, lifetime = 0.0, evtgenname = 'Delta(1900)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1930)~-', geantid = -12126, pdgid = -12126, charge = -1.0, mass = 1950.0, lifetime = 1.828367e-24, evtgenname = 'anti-Delta(1930)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1930)+', geantid = 12126, pdgid = 12126, charge = 1.0, mass = 1950.0, lifetime = 1.828367e-24, evtgenname = 'Delta(1930)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1440)~-', geantid = -12212, pdgid = -12212, charge = -1.0, mass = 1430.0, lifetime = 2.194041e-24, evtgenname = 'anti-N(1440)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1440)+', geantid = 12212, pdgid = 12212, charge = 1.0, mass = 1430.0, lifetime = 2.194041e-24, evtgenname = 'N(1440)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1700)~-', geantid = -12214, pdgid = -12214, charge = -1.0, mass = 1700.0, lifetime = 2.194041e-24, evtgenname = 'anti-Delta(1700)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1700)+', geantid = 12214, pdgid = 12214, charge = 1.0, mass = 1700.0, lifetime = 2.194041e-24, evtgenname = 'Delta(1700)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1680)~-', geantid = -12216, pdgid = -12216, charge = -1.0, mass = 1685.0, lifetime = 5.063171000000001e-24, evtgenname = 'anti-N(1680)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1680)+', geantid = 12216, pdgid = 12216, charge = 1.0, mass = 1685.0, lifetime = 5.063171000000001e-24, evtgenname = 'N(1680)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1990)~-', geantid = -12218, pdgid = -12218, charge = -1.0, mass = 1950.0, lifetime = 0.0, evtgenname = 'anti-N(1990)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1990)+', geantid = 12218, pdgid = 12218, charge = 1.0, mass = 1950.0, lifetime = 0.0, evtgenname = 'N(1990)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1900)~--', geantid = -12222, pdgid = -12222, charge = -2.0, mass = 1840.0, lifetime = 0.0, evtgenname = 'anti-Delta(1900)--', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1900)++', geantid = 12222, pdgid = 12222, charge = 2.0, mass = 1840.0, lifetime = 0.0, evtgenname = 'Delta(1900)++', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1700)~--', geantid = -12224, pdgid = -12224, charge = -2.0, mass = 1700.0, lifetime = 2.194041e-24, evtgenname = 'anti-Delta(1700)--', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1700)++', geantid = 12224, pdgid = 12224, charge = 2.0, mass = 1700.0, lifetime = 2.194041e-24, evtgenname = 'Delta(1700)++', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1930)~--', geantid = -12226, pdgid = -12226, charge = -2.0, mass = 1950.0, lifetime = 1.828367e-24, evtgenname = 'anti-Delta(1930)--', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1930)++', geantid = 12226, pdgid = 12226, charge = 2.0, mass = 1950.0, lifetime = 1.828367e-24, evtgenname = 'Delta(1930)++', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1660)~+', geantid = -13112, pdgid = -13112, charge = 1.0, mass = 1660.0, lifetime = 6.5821220000000005e-24, evtgenname = 'anti-Sigma(1660)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1660)-', geantid = 13112, pdgid = 13112, charge = -1.0, mass = 1660.0, lifetime = 6.5821220000000005e-24, evtgenname = 'Sigma(1660)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1670)~+', geantid = -13114, pdgid = -13114, charge = 1.0, mass = 1670.0, lifetime = 1.0970200000000001e-23, evtgenname = 'anti-Sigma(1670)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1670)-', geantid = 13114, pdgid = 13114, charge = -1.0, mass = 1670.0, lifetime = 1.0970200000000001e-23, evtgenname = 'Sigma(1670)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1915)~+', geantid = -13116, pdgid = -13116, charge = 1.0, mass = 1915.0, lifetime = 5.485102000000001e-24, evtgenname = 'anti-Sigma(1915)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1915)-', geantid = 13116, pdgid = 13116, charge = -1.0, mass = 1915.0, lifetime = 5.485102000000001e-24, evtgenname = 'Sigma(1915)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(1405)~0', geantid = -13122, pdgid = -13122, charge = 0.0, mass = 1405.1, lifetime = 1.316424e-23, evtgenname = 'anti-Lambda(1405)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(1405)0', geantid = 13122, pdgid = 13122, charge = 0.0, mass = 1405.1, lifetime = 1.316424e-23, evtgenname = 'Lambda(1405)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(1690)~0', geantid = -13124, pdgid = -13124, charge = 0.0, mass = 1690.0, lifetime = 1.0970200000000001e-23, evtgenname = 'anti-Lambda(1690)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(1690)0', geantid = 13124, pdgid = 13124, charge = 0.0, mass = 1690.0, lifetime = 1.0970200000000001e-23, evtgenname = 'Lambda(1690)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(1830)~0', geantid = -13126, pdgid = -13126, charge = 0.0, mass = 1830.0, lifetime = 6.928549e-24, evtgenname = 'anti-Lambda(1830)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(1830)0', geantid = 13126, pdgid = 13126, charge = 0.0, mass = 1830.0, lifetime = 6.928549e-24, evtgenname = 'Lambda(1830)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1660)~0', geantid = -13212, pdgid = -13212, charge = 0.0, mass = 1660.0, lifetime = 6.5821220000000005e-24, evtgenname = 'anti-Sigma(1660)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1660)0', geantid = 13212, pdgid = 13212, charge = 0.0, mass = 1660.0, lifetime = 6.5821220000000005e-24, evtgenname = 'Sigma(1660)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1670)~0', geantid = -13214, pdgid = -13214, charge = 0.0, mass = 1670.0, lifetime = 1.0970200000000001e-23, evtgenname = 'anti-Sigma(1670)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1670)0', geantid = 13214, pdgid = 13214, charge = 0.0, mass = 1670.0, lifetime = 1.0970200000000001e-23, evtgenname = 'Sigma(1670)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1915)~0', geantid = -13216, pdgid = -13216, charge = 0.0, mass = 1915.0, lifetime = 5.485102000000001e-24, evtgenname = 'anti-Sigma(1915)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1915)0', geantid = 13216, pdgid = 13216, charge = 0.0, mass = 1915.0, lifetime = 5.485102000000001e-24, evtgenname = 'Sigma(1915)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1660)~-', geantid = -13222, pdgid = -13222, charge = -1.0, mass = 1660.0, lifetime = 6.5821220000000005e-24, evtgenname = 'anti-Sigma(1660)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1660)+', geantid = 13222, pdgid = 13222, charge = 1.0, mass = 1660.0, lifetime = 6.5821220000000005e-24, evtgenname = 'Sigma(1660)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1670)~-', geantid = -13224, pdgid = -13224, charge = -1.0, mass = 1670.0, lifetime = 1.0970200000000001e-23, evtgenname = 'anti-Sigma(1670)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1670)+', geantid = 13224, pdgid = 13224, charge = 1.0, mass = 1670.0, lifetime = 1.0970200000000001e-23, evtgenname = 'Sigma(1670)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1915)~-', geantid = -13226, pdgid = -13226, charge = -1.0, mass = 1915.0, lifetime = 5.485102000000001e-24, evtgenname = 'anti-Sigma(1915)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1915)+', geantid = 13226, pdgid = 13226, charge = 1.0, mass = 1915.0, lifetime = 5.485102000000001e-24, evtgenname = 'Sigma(1915)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi(1820)~+', geantid = -13314, pdgid = -13314, charge = 1.0, mass = 1823.0, lifetime = 2.742551e-23, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi(1820)-', geantid = 13314, pdgid = 13314, charge = -1.0, mass = 1823.0, lifetime = 2.742551e-23, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi(1820)~0', geantid = -13324, pdgid = -13324, charge = 0.0, mass = 1823.0, lifetime = 2.742551e-23, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi(1820)0', geantid = 13324, pdgid = 13324, charge = 0.0, mass = 1823.0, lifetime = 2.742551e-23, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda_c(2595)~-', geantid = -14122, pdgid = -14122, charge = -1.0, mass = 2592.25, lifetime = 2.531585e-22, evtgenname = 'anti-Lambda_c(2593)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda_c(2595)+', geantid = 14122, pdgid = 14122, charge = 1.0, mass = 2592.25, lifetime = 2.531585e-22, evtgenname = 'Lambda_c(2593)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda_b(5912)~0', geantid = -15122, pdgid = -15122, charge = 0.0, mass = 5911.97, lifetime = 1.3160000000000002e-21, evtgenname = 'anti-Lambda_b(5912)0', pythiaid = -15122, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda_b(5912)0', geantid = 15122, pdgid = 15122, charge = 0.0, mass = 5911.97, lifetime = 1.3160000000000002e-21, evtgenname = 'Lambda_b(5912)0', pythiaid = 15122, maxwidth = 0.0),
- ParticleInfo(name = 'opticalphoton', geantid = 20022, pdgid = 20022, charge = 0.0, mass = 0.0, lifetime = 1.0000000000000002e+16, evtgenname = 'Cerenkov', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'a_1(1260)0', geantid = 20113, pdgid = 20113, charge = 0.0, mass = 1230.0, lifetime = 1.567172e-24, evtgenname = 'a_10', pythiaid = 20113, maxwidth = 0.0),
- ParticleInfo(name = 'a_1(1260)-', geantid = -20213, pdgid = -20213, charge = -1.0, mass = 1230.0, lifetime = 1.567172e-24, evtgenname = 'a_1-', pythiaid = -20213, maxwidth = 0.0),
- ParticleInfo(name = 'a_1(1260)+', geantid = 20213, pdgid = 20213, charge = 1.0, mass = 1230.0, lifetime = 1.567172e-24, evtgenname = 'a_1+', pythiaid = 20213, maxwidth = 0.0),
- ParticleInfo(name = 'f_1(1285)', geantid = 20223, pdgid = 20223, charge = 0.0, mass = 1281.9, lifetime = 2.719885e-23, evtgenname = 'f_1', pythiaid = 20223, maxwidth = 0.0),
- ParticleInfo(name = 'K_1(1400)~0', geantid = -20313, pdgid = -20313, charge = 0.0, mass = 1403.0, lifetime = 3.782829e-24, evtgenname = "anti-K'_10", pythiaid = -20313, maxwidth = 0.0),
- ParticleInfo(name = 'K_1(1400)0', geantid = 20313, pdgid = 20313, charge = 0.0, mass = 1403.0, lifetime = 3.782829e-24, evtgenname = "K'_10", pythiaid = 20313, maxwidth = 0.0),
- ParticleInfo(name = 'K_2(1820)~0', geantid = -20315, pdgid = -20315, charge = 0.0, mass = 1816.0, lifetime = 2.384827e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K_2(1820)0', geantid = 20315, pdgid = 20315, charge = 0.0, mass = 1816.0, lifetime = 2.384827e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K_1(1400)-', geantid = -20323, pdgid = -20323, charge = -1.0, mass = 1403.0, lifetime = 3.782829e-24, evtgenname = "K'_1-", pythiaid = -20323, maxwidth = 0.0),
- ParticleInfo(name = 'K_1(1400)+', geantid = 20323, pdgid = 20323, charge = 1.0, mass = 1403.0, lifetime = 3.782829e-24, evtgenname = "K'_1+", pythiaid = 20323, maxwidth = 0.0),
- ParticleInfo(name = 'K_2(1820)-', geantid = -20325, pdgid = -20325, charge = -1.0, mass = 1816.0, lifetime = 2.384827e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K_2(1820)+', geantid = 20325, pdgid = 20325, charge = 1.0, mass = 1816.0, lifetime = 2.384827e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'f_1(1420)', geantid = 20333, pdgid = 20333, charge = 0.0, mass = 1426.3999999999999, lifetime = 1.1989290000000002e-23, evtgenname = "f'_1", pythiaid = 20333, maxwidth = 0.0),
- ParticleInfo(name = 'D_1(H)-', geantid = -20413, pdgid = -20413, charge = -1.0, mass = 2445.0, lifetime = 2.63e-24, evtgenname = "D'_1-", pythiaid = -20413, maxwidth = 0.0),
- ParticleInfo(name = 'D_1(H)+', geantid = 20413, pdgid = 20413, charge = 1.0, mass = 2445.0, lifetime = 2.63e-24, evtgenname = "D'_1+", pythiaid = 20413, maxwidth = 0.0),
- ParticleInfo(name = 'D_1(H)~0', geantid = -20423, pdgid = -20423, charge = 0.0, mass = 2445.0, lifetime = 2.63e-24, evtgenname = "anti-D'_10", pythiaid = -20423, maxwidth = 0.0),
- ParticleInfo(name = 'D_1(H)0', geantid = 20423, pdgid = 20423, charge = 0.0, mass = 2445.0, lifetime = 2.63e-24, evtgenname = "D'_10", pythiaid = 20423, maxwidth = 0.0),
- ParticleInfo(name = 'D_s1(2460)-', geantid = -20433, pdgid = -20433, charge = -1.0, mass = 2459.5, lifetime = 6.5821e-22, evtgenname = 'D_s1-', pythiaid = -20433, maxwidth = 0.0),
- ParticleInfo(name = 'D_s1(2460)+', geantid = 20433, pdgid = 20433, charge = 1.0, mass = 2459.5, lifetime = 6.5821e-22, evtgenname = 'D_s1+', pythiaid = 20433, maxwidth = 0.0),
- ParticleInfo(name = 'chi_c1(1P)', geantid = 20443, pdgid = 20443, charge = 0.0, mass = 3510.6600000000003, lifetime = 7.835857000000001e-22, evtgenname = 'chi_c1', pythiaid = 20443, maxwidth = 0.0),
- ParticleInfo(name = 'B_1(H)~0', geantid = -20513, pdgid = -20513, charge = 0.0, mass = 5757.0, lifetime = 2.63e-24, evtgenname = "anti-B'_10", pythiaid = -20513, maxwidth = 0.0),
- ParticleInfo(name = 'B_1(H)0', geantid = 20513, pdgid = 20513, charge = 0.0, mass = 5757.0, lifetime = 2.63e-24, evtgenname = "B'_10", pythiaid = 20513, maxwidth = 0.0),
- ParticleInfo(name = 'B_1(H)-', geantid = -20523, pdgid = -20523, charge = -1.0, mass = 5757.0, lifetime = 2.63e-24, evtgenname = "B'_1-", pythiaid = -20523, maxwidth = 0.0),
- ParticleInfo(name = 'B_1(H)+', geantid = 20523, pdgid = 20523, charge = 1.0, mass = 5757.0, lifetime = 2.63e-24, evtgenname = "B'_1+", pythiaid = 20523, maxwidth = 0.0),
- ParticleInfo(name = 'B_s1(H)~0', geantid = -20533, pdgid = -20533, charge = 0.0, mass = 5859.0, lifetime = 2.63e-24, evtgenname = "anti-B'_s10", pythiaid = -20533, maxwidth = 0.0),
- ParticleInfo(name = 'B_s1(H)0', geantid = 20533, pdgid = 20533, charge = 0.0, mass = 5859.0, lifetime = 2.63e-24, evtgenname = "B'_s10", pythiaid = 20533, maxwidth = 0.0),
- ParticleInfo(name = 'B_c1(H)-', geantid = -20543, pdgid = -20543, charge = -1.0, mass = 7400.0, lifetime = 0.0, evtgenname = "B'_c1-", pythiaid = -20543, maxwidth = 0.0),
- ParticleInfo(name = 'B_c1(H)+', geantid = 20543, pdgid = 20543, charge = 1.0, mass = 7400.0, lifetime = 0.0, evtgenname = "B'_c1+", pythiaid = 20543, maxwidth = 0.0),
- ParticleInfo(name = 'chi_b1(1P)', geantid = 20553, pdgid = 20553, charge = 0.0, mass = 9892.78, lifetime = 0.0, evtgenname = 'chi_b1', pythiaid = 20553, maxwidth = 0.0),
- ParticleInfo(name = 'Upsilon_2(1D)', geantid = 20555, pdgid = 20555, charge = 0.0, mass = 10156.2, lifetime = 0.0, evtgenname = 'Upsilon_2(1D)', pythiaid = 20555, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1910)~+', geantid = -21112, pdgid = -21112, charge = 1.0, mass = 1890.0, lifetime = 2.350758e-24, evtgenname = 'anti-Delta(1910)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1910)-', geantid = 21112, pdgid = 21112, charge = -1.0, mass = 1890.0, lifetime = 2.350758e-24, evtgenname = 'Delta(1910)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1920)~+', geantid = -21114, pdgid = -21114, charge = 1.0, mass = 1920.0, lifetime = 2.531585e-24, evtgenname = 'anti-Delta(1920)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1920)-', geantid = 21114, pdgid = 21114, charge = -1.0, mass = 1920.0, lifetime = 2.531585e-24, evtgenname = 'Delta(1920)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1910)~0', geantid = -21212, pdgid = -21212, charge = 0.0, mass = 1890.0, lifetime = 2.350758e-24, evtgenname = 'anti-Delta(1910)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1910)0', geantid = 21212, pdgid = 21212, charge = 0.0, mass = 1890.0, lifetime = 2.350758e-24, evtgenname = 'Delta(1910)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1700)~0', geantid = -21214, pdgid = -21214, charge = 0.0, mass = 1700.0, lifetime = 4.3880810000000005e-24, evtgenname = 'anti-N(1700)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1700)0', geantid = 21214, pdgid = 21214, charge = 0.0, mass = 1700.0, lifetime = 4.3880810000000005e-24, evtgenname = 'N(1700)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1535)~0', geantid = -22112, pdgid = -22112, charge = 0.0, mass = 1535.0, lifetime = 4.3880810000000005e-24, evtgenname = 'anti-N(1535)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1535)0', geantid = 22112, pdgid = 22112, charge = 0.0, mass = 1535.0, lifetime = 4.3880810000000005e-24, evtgenname = 'N(1535)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1920)~0', geantid = -22114, pdgid = -22114, charge = 0.0, mass = 1920.0, lifetime = 2.531585e-24, evtgenname = 'anti-Delta(1920)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1920)0', geantid = 22114, pdgid = 22114, charge = 0.0, mass = 1920.0, lifetime = 2.531585e-24, evtgenname = 'Delta(1920)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1910)~-', geantid = -22122, pdgid = -22122, charge = -1.0, mass = 1890.0, lifetime = 2.350758e-24, evtgenname = 'anti-Delta(1910)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1910)+', geantid = 22122, pdgid = 22122, charge = 1.0, mass = 1890.0, lifetime = 2.350758e-24, evtgenname = 'Delta(1910)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1700)~-', geantid = -22124, pdgid = -22124, charge = -1.0, mass = 1700.0, lifetime = 4.3880810000000005e-24, evtgenname = 'anti-N(1700)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1700)+', geantid = 22124, pdgid = 22124, charge = 1.0, mass = 1700.0, lifetime = 4.3880810000000005e-24, evtgenname = 'N(1700)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1535)~-', geantid = -22212, pdgid = -22212, charge = -1.0, mass = 1535.0, lifetime = 4.3880810000000005e-24, evtgenname = 'anti-N(1535)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1535)+', geantid = 22212, pdgid = 22212, charge = 1.0, mass = 1535.0, lifetime = 4.3880810000000005e-24, evtgenname = 'N(1535)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1920)~-', geantid = -22214, pdgid = -22214, charge = -1.0, mass = 1920.0, lifetime = 2.531585e-24, evtgenname = 'anti-Delta(1920)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1920)+', geantid = 22214, pdgid = 22214, charge = 1.0, mass = 1920.0, lifetime = 2.531585e-24, evtgenname = 'Delta(1920)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1910)~--', geantid = -22222, pdgid = -22222, charge = -2.0, mass = 1890.0, lifetime = 2.350758e-24, evtgenname = 'anti-Delta(1910)--', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1910)++', geantid = 22222, pdgid = 22222, charge = 2.0, mass = 1890.0, lifetime = 2.350758e-24, evtgenname = 'Delta(1910)++', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1920)~--', geantid = -22224, pdgid = -22224, charge = -2.0, mass = 1920.0, lifetime = 2.531585e-24, evtgenname = 'anti-Delta(1920)--', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1920)++', geantid = 22224, pdgid = 22224, charge = 2.0, mass = 1920.0, lifetime = 2.531585e-24, evtgenname = 'Delta(1920)++', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1750)~+', geantid = -23112, pdgid = -23112, charge = 1.0, mass = 1750.0, lifetime = 7.313469000000002e-24, evtgenname = 'anti-Sigma(1750)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1750)-', geantid = 23112, pdgid = 23112, charge = -1.0, mass = 1750.0, lifetime = 7.313469000000002e-24, evtgenname = 'Sigma(1750)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1940)~+', geantid = -23114, pdgid = -23114, charge = 1.0, mass = 1940.0, lifetime = 2.991874e-24, evtgenname = 'anti-Sigma(1940)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1940)-', geantid = 23114, pdgid = 23114, charge = -1.0, mass = 1940.0, lifetime = 2.991874e-24, evtgenname = 'Sigma(1940)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(1600)~0', geantid = -23122, pdgid = -23122, charge = 0.0, mass = 1600.0, lifetime = 4.3880810000000005e-24, evtgenname = 'anti-Lambda(1600)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(1600)0', geantid = 23122, pdgid = 23122, charge = 0.0, mass = 1600.0, lifetime = 4.3880810000000005e-24, evtgenname = 'Lambda(1600)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(1890)~0', geantid = -23124, pdgid = -23124, charge = 0.0, mass = 1890.0, lifetime = 6.5821220000000005e-24, evtgenname = 'anti-Lambda(1890)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(1890)0', geantid = 23124, pdgid = 23124, charge = 0.0, mass = 1890.0, lifetime = 6.5821220000000005e-24, evtgenname = 'Lambda(1890)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(2110)~0', geantid = -23126, pdgid = -23126, charge = 0.0, mass = 2110.0, lifetime = 3.2910610000000003e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(2110)0', geantid = 23126, pdgid = 23126, charge = 0.0, mass = 2110.0, lifetime = 3.2910610000000003e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1750)~0', geantid = -23212, pdgid = -23212, charge = 0.0, mass = 1750.0, lifetime = 7.313469000000002e-24, evtgenname = 'anti-Sigma(1750)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1750)0', geantid = 23212, pdgid = 23212, charge = 0.0, mass = 1750.0, lifetime = 7.313469000000002e-24, evtgenname = 'Sigma(1750)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1940)~0', geantid = -23214, pdgid = -23214, charge = 0.0, mass = 1940.0, lifetime = 2.991874e-24, evtgenname = 'anti-Sigma(1940)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1940)0', geantid = 23214, pdgid = 23214, charge = 0.0, mass = 1940.0, lifetime = 2.991874e-24, evtgenname = 'Sigma(1940)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1750)~-', geantid = -23222, pdgid = -23222, charge = -1.0, mass = 1750.0, lifetime = 7.313469000000002e-24, evtgenname = 'anti-Sigma(1750)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1750)+', geantid = 23222, pdgid = 23222, charge = 1.0, mass = 1750.0, lifetime = 7.313469000000002e-24, evtgenname = 'Sigma(1750)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1940)~-', geantid = -23224, pdgid = -23224, charge = -1.0, mass = 1940.0, lifetime = 2.991874e-24, evtgenname = 'anti-Sigma(1940)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(1940)+', geantid = 23224, pdgid = 23224, charge = 1.0, mass = 1940.0, lifetime = 2.991874e-24, evtgenname = 'Sigma(1940)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'rho(1700)0', geantid = 30113, pdgid = 30113, charge = 0.0, mass = 1720.0, lifetime = 2.6328490000000003e-24, evtgenname = 'rho(3S)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'rho(1700)-', geantid = -30213, pdgid = -30213, charge = -1.0, mass = 1720.0, lifetime = 2.6328490000000003e-24, evtgenname = 'rho(3S)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'rho(1700)+', geantid = 30213, pdgid = 30213, charge = 1.0, mass = 1720.0, lifetime = 2.6328490000000003e-24, evtgenname = 'rho(3S)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'omega(1650)', geantid = 30223, pdgid = 30223, charge = 0.0, mass = 1670.0, lifetime = 2.089563e-24, evtgenname = 'omega(1650)', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K*(1680)~0', geantid = -30313, pdgid = -30313, charge = 0.0, mass = 1717.0, lifetime = 2.0569130000000002e-24, evtgenname = "anti-K''*0", pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K*(1680)0', geantid = 30313, pdgid = 30313, charge = 0.0, mass = 1717.0, lifetime = 2.0569130000000002e-24, evtgenname = "K''*0", pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K*(1680)-', geantid = -30323, pdgid = -30323, charge = -1.0, mass = 1717.0, lifetime = 2.0569130000000002e-24, evtgenname = "K''*-", pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K*(1680)+', geantid = 30323, pdgid = 30323, charge = 1.0, mass = 1717.0, lifetime = 2.0569130000000002e-24, evtgenname = "K''*+", pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'anti-Xsd', geantid = -30343, pdgid = -30343, charge = 0.0, mass = 1600.0, lifetime = 0.0, evtgenname = 'anti-Xsd', pythiaid = -30343, maxwidth = 0.0),
- ParticleInfo(name = 'Xsd', geantid = 30343, pdgid = 30343, charge = 0.0, mass = 1600.0, lifetime = 0.0, evtgenname = 'Xsd', pythiaid = 30343, maxwidth = 0.0),
- ParticleInfo(name = 'anti-Xsu', geantid = -30353, pdgid = -30353, charge = -1.0, mass = 1600.0, lifetime = 0.0, evtgenname = 'anti-Xsu', pythiaid = -30353, maxwidth = 0.0),
- ParticleInfo(name = 'Xsu', geantid = 30353, pdgid = 30353, charge = 1.0, mass = 1600.0, lifetime = 0.0, evtgenname = 'Xsu', pythiaid = 30353, maxwidth = 0.0),
- ParticleInfo(name = 'anti-Xss', geantid = -30363, pdgid = -30363, charge = 0.0, mass = 1800.0, lifetime = 0.0, evtgenname = 'anti-Xss', pythiaid = -30363, maxwidth = 0.0),
- ParticleInfo(name = 'Xss', geantid = 30363, pdgid = 30363, charge = 0.0, mass = 1800.0, lifetime = 0.0, evtgenname = 'Xss', pythiaid = 30363, maxwidth = 0.0),
- ParticleInfo(name = 'psi(3770)', geantid = 30443, pdgid = 30443, charge = 0.0, mass = 3773.1499999999996, lifetime = 2.419898e-23, evtgenname = 'psi(3770)', pythiaid = 30443, maxwidth = 0.0),
- ParticleInfo(name = 'Upsilon_1(1D)', geantid = 30553, pdgid = 30553, charge = 0.0, mass = 10163.7, lifetime = 0.0, evtgenname = 'Upsilon_1(1D)', pythiaid = 30553, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1600)~+', geantid = -31114, pdgid = -31114, charge = 1.0, mass = 1600.0, lifetime = 2.0569130000000002e-24, evtgenname = 'anti-Delta(1600)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1600)-', geantid = 31114, pdgid = 31114, charge = -1.0, mass = 1600.0, lifetime = 2.0569130000000002e-24, evtgenname = 'Delta(1600)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1720)~0', geantid = -31214, pdgid = -31214, charge = 0.0, mass = 1720.0, lifetime = 2.6328490000000003e-24, evtgenname = 'anti-N(1720)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1720)0', geantid = 31214, pdgid = 31214, charge = 0.0, mass = 1720.0, lifetime = 2.6328490000000003e-24, evtgenname = 'N(1720)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1650)~0', geantid = -32112, pdgid = -32112, charge = 0.0, mass = 1655.0, lifetime = 4.701514e-24, evtgenname = 'anti-N(1650)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1650)0', geantid = 32112, pdgid = 32112, charge = 0.0, mass = 1655.0, lifetime = 4.701514e-24, evtgenname = 'N(1650)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1600)~0', geantid = -32114, pdgid = -32114, charge = 0.0, mass = 1600.0, lifetime = 2.0569130000000002e-24, evtgenname = 'anti-Delta(1600)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1600)0', geantid = 32114, pdgid = 32114, charge = 0.0, mass = 1600.0, lifetime = 2.0569130000000002e-24, evtgenname = 'Delta(1600)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1720)~-', geantid = -32124, pdgid = -32124, charge = -1.0, mass = 1720.0, lifetime = 2.6328490000000003e-24, evtgenname = 'anti-N(1720)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1720)+', geantid = 32124, pdgid = 32124, charge = 1.0, mass = 1720.0, lifetime = 2.6328490000000003e-24, evtgenname = 'N(1720)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1650)~-', geantid = -32212, pdgid = -32212, charge = -1.0, mass = 1655.0, lifetime = 4.701514e-24, evtgenname = 'anti-N(1650)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1650)+', geantid = 32212, pdgid = 32212, charge = 1.0, mass = 1655.0, lifetime = 4.701514e-24, evtgenname = 'N(1650)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1600)~-', geantid = -32214, pdgid = -32214, charge = -1.0, mass = 1600.0, lifetime = 2.0569130000000002e-24, evtgenname = 'anti-Delta(1600)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1600)+', geantid = 32214, pdgid = 32214, charge = 1.0, mass = 1600.0, lifetime = 2.0569130000000002e-24, evtgenname = 'Delta(1600)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1600)~--', geantid = -32224, pdgid = -32224, charge = -2.0, mass = 1600.0, lifetime = 2.0569130000000002e-24, evtgenname = 'anti-Delta(1600)--', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Delta(1600)++', geantid = 32224, pdgid = 32224, charge = 2.0, mass = 1600.0, lifetime = 2.0569130000000002e-24, evtgenname = 'Delta(1600)++', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(1670)~0', geantid = -33122, pdgid = -33122, charge = 0.0, mass = 1670.0, lifetime = 1.880606e-23, evtgenname = 'anti-Lambda(1670)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(1670)0', geantid = 33122, pdgid = 33122, charge = 0.0, mass = 1670.0, lifetime = 1.880606e-23, evtgenname = 'Lambda(1670)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1900)~0', geantid = -41214, pdgid = -41214, charge = 0.0, mass = 1850.0, lifetime = 0.0, evtgenname = 'anti-N(1900)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1900)0', geantid = 41214, pdgid = 41214, charge = 0.0, mass = 1850.0, lifetime = 0.0, evtgenname = 'N(1900)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1710)~0', geantid = -42112, pdgid = -42112, charge = 0.0, mass = 1710.0, lifetime = 6.5821220000000005e-24, evtgenname = 'anti-N(1710)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1710)0', geantid = 42112, pdgid = 42112, charge = 0.0, mass = 1710.0, lifetime = 6.5821220000000005e-24, evtgenname = 'N(1710)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1900)~-', geantid = -42124, pdgid = -42124, charge = -1.0, mass = 1850.0, lifetime = 0.0, evtgenname = 'anti-N(1900)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1900)+', geantid = 42124, pdgid = 42124, charge = 1.0, mass = 1850.0, lifetime = 0.0, evtgenname = 'N(1900)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1710)~-', geantid = -42212, pdgid = -42212, charge = -1.0, mass = 1710.0, lifetime = 6.5821220000000005e-24, evtgenname = 'anti-N(1710)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(1710)+', geantid = 42212, pdgid = 42212, charge = 1.0, mass = 1710.0, lifetime = 6.5821220000000005e-24, evtgenname = 'N(1710)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(1800)~0', geantid = -43122, pdgid = -43122, charge = 0.0, mass = 1800.0, lifetime = 2.194041e-24, evtgenname = 'anti-Lambda(1800)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(1800)0', geantid = 43122, pdgid = 43122, charge = 0.0, mass = 1800.0, lifetime = 2.194041e-24, evtgenname = 'Lambda(1800)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(2090)~0', geantid = -52114, pdgid = -52114, charge = 0.0, mass = 2000.0, lifetime = 0.0, evtgenname = 'anti-N(2090)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(2090)0', geantid = 52114, pdgid = 52114, charge = 0.0, mass = 2000.0, lifetime = 0.0, evtgenname = 'N(2090)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(2090)~-', geantid = -52214, pdgid = -52214, charge = -1.0, mass = 2000.0, lifetime = 0.0, evtgenname = 'anti-N(2090)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N(2090)+', geantid = 52214, pdgid = 52214, charge = 1.0, mass = 2000.0, lifetime = 0.0, evtgenname = 'N(2090)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(1810)~0', geantid = -53122, pdgid = -53122, charge = 0.0, mass = 1810.0, lifetime = 4.3880810000000005e-24, evtgenname = 'anti-Lambda(1810)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda(1810)0', geantid = 53122, pdgid = 53122, charge = 0.0, mass = 1810.0, lifetime = 4.3880810000000005e-24, evtgenname = 'Lambda(1810)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'pi(1300)0', geantid = 100111, pdgid = 100111, charge = 0.0, mass = 1300.0, lifetime = 1.64553e-24, evtgenname = 'pi(2S)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'rho(1450)0', geantid = 100113, pdgid = 100113, charge = 0.0, mass = 1465.0, lifetime = 1.64553e-24, evtgenname = 'rho(2S)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'pi(1300)-', geantid = -100211, pdgid = -100211, charge = -1.0, mass = 1300.0, lifetime = 1.64553e-24, evtgenname = 'pi(2S)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'pi(1300)+', geantid = 100211, pdgid = 100211, charge = 1.0, mass = 1300.0, lifetime = 1.64553e-24, evtgenname = 'pi(2S)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'rho(1450)-', geantid = -100213, pdgid = -100213, charge = -1.0, mass = 1465.0, lifetime = 1.64553e-24, evtgenname = 'rho(2S)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'rho(1450)+', geantid = 100213, pdgid = 100213, charge = 1.0, mass = 1465.0, lifetime = 1.64553e-24, evtgenname = 'rho(2S)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'eta(1295)', geantid = 100221, pdgid = 100221, charge = 0.0, mass = 1294.0, lifetime = 1.1967490000000002e-23, evtgenname = 'eta(2S)', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'omega(1420)', geantid = 100223, pdgid = 100223, charge = 0.0, mass = 1425.0, lifetime = 3.0614520000000003e-24, evtgenname = 'omega(2S)', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K(1460)~0', geantid = -100311, pdgid = -100311, charge = 0.0, mass = 1432.3999999999999, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K(1460)0', geantid = 100311, pdgid = 100311, charge = 0.0, mass = 1432.3999999999999, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K*(1410)~0', geantid = -100313, pdgid = -100313, charge = 0.0, mass = 1414.0, lifetime = 2.837122e-24, evtgenname = "anti-K'*0", pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K*(1410)0', geantid = 100313, pdgid = 100313, charge = 0.0, mass = 1414.0, lifetime = 2.837122e-24, evtgenname = "K'*0", pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K*_2(1980)~0', geantid = -100315, pdgid = -100315, charge = 0.0, mass = 1973.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K*_2(1980)0', geantid = 100315, pdgid = 100315, charge = 0.0, mass = 1973.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K(1460)-', geantid = -100321, pdgid = -100321, charge = -1.0, mass = 1432.3999999999999, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K(1460)+', geantid = 100321, pdgid = 100321, charge = 1.0, mass = 1432.3999999999999, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K*(1410)-', geantid = -100323, pdgid = -100323, charge = -1.0, mass = 1414.0, lifetime = 2.837122e-24, evtgenname = "K'*-", pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K*(1410)+', geantid = 100323, pdgid = 100323, charge = 1.0, mass = 1414.0, lifetime = 2.837122e-24, evtgenname = "K'*+", pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K*_2(1980)-', geantid = -100325, pdgid = -100325, charge = -1.0, mass = 1973.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'K*_2(1980)+', geantid = 100325, pdgid = 100325, charge = 1.0, mass = 1973.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'eta(1475)', geantid = 100331, pdgid = 100331, charge = 0.0, mass = 1476.0, lifetime = 7.743673e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'phi(1680)', geantid = 100333, pdgid = 100333, charge = 0.0, mass = 1680.0, lifetime = 4.3880810000000005e-24, evtgenname = 'phi(1680)', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'D(2S)-', geantid = -100411, pdgid = -100411, charge = -1.0, mass = 2580.0, lifetime = 0.0, evtgenname = 'D(2S)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'D(2S)+', geantid = 100411, pdgid = 100411, charge = 1.0, mass = 2580.0, lifetime = 0.0, evtgenname = 'D(2S)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'D*(2640)-', geantid = -100413, pdgid = -100413, charge = -1.0, mass = 2640.0, lifetime = 0.0, evtgenname = 'D*(2S)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'D*(2640)+', geantid = 100413, pdgid = 100413, charge = 1.0, mass = 2640.0, lifetime = 0.0, evtgenname = 'D*(2S)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'D(2S)~0', geantid = -100421, pdgid = -100421, charge = 0.0, mass = 2580.0, lifetime = 0.0, evtgenname = 'anti-D(2S)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'D(2S)0', geantid = 100421, pdgid = 100421, charge = 0.0, mass = 2580.0, lifetime = 0.0, evtgenname = 'D(2S)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'D*(2640)~0', geantid = -100423, pdgid = -100423, charge = 0.0, mass = 2640.0, lifetime = 0.0, evtgenname = 'anti-D*(2S)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'D*(2640)0', geantid = 100423, pdgid = 100423, charge = 0.0, mass = 2640.0, lifetime = 0.0, evtgenname = 'D*(2S)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'eta_c(2S)', geantid = 100441, pdgid = 100441, charge = 0.0, mass = 3639.4, lifetime = 6.582122000000001e-23, evtgenname = 'eta_c(2S)', pythiaid = 100441, maxwidth = 0.0),
- ParticleInfo(name = 'psi(2S)', geantid = 100443, pdgid = 100443, charge = 0.0, mass = 3686.109, lifetime = 2.2013780000000004e-21, evtgenname = 'psi(2S)', pythiaid = 100443, maxwidth = 0.0),
- ParticleInfo(name = 'chi_c2(2P)', geantid = 100445, pdgid = 100445, charge = 0.0, mass = 3927.2, lifetime = 2.742551e-23, evtgenname = 'chi_c2(2P)', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'eta_b(2S)', geantid = 100551, pdgid = 100551, charge = 0.0, mass = 9997.0, lifetime = 0.0, evtgenname = 'eta_b(2S)', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Upsilon(2S)', geantid = 100553, pdgid = 100553, charge = 0.0, mass = 10023.26, lifetime = 2.0581990000000003e-20, evtgenname = 'Upsilon(2S)', pythiaid = 100553, maxwidth = 0.0),
- ParticleInfo(name = 'chi_b2(2P)', geantid = 100555, pdgid = 100555, charge = 0.0, mass = 10268.65, lifetime = 0.0, evtgenname = 'chi_b2(2P)', pythiaid = 100555, maxwidth = 0.0),
- ParticleInfo(name = 'Upsilon_3(2D)', geantid = 100557, pdgid = 100557, charge = 0.0, mass = 10444.3, lifetime = 0.0, evtgenname = 'Upsilon_3(2D)', pythiaid = 100557, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(2250)~+', geantid = -103112, pdgid = -103112, charge = 1.0, mass = 2250.0, lifetime = 6.58e-24, evtgenname = 'anti-Sigma(2250)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(2250)-', geantid = 103112, pdgid = 103112, charge = -1.0, mass = 2250.0, lifetime = 6.58e-24, evtgenname = 'Sigma(2250)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(2250)~0', geantid = -103212, pdgid = -103212, charge = 0.0, mass = 2250.0, lifetime = 6.58e-24, evtgenname = 'anti-Sigma(2250)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(2250)0', geantid = 103212, pdgid = 103212, charge = 0.0, mass = 2250.0, lifetime = 6.58e-24, evtgenname = 'Sigma(2250)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(2250)~-', geantid = -103222, pdgid = -103222, charge = -1.0, mass = 2250.0, lifetime = 6.58e-24, evtgenname = 'anti-Sigma(2250)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Sigma(2250)+', geantid = 103222, pdgid = 103222, charge = 1.0, mass = 2250.0, lifetime = 6.58e-24, evtgenname = 'Sigma(2250)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi(1950)~+', geantid = -103316, pdgid = -103316, charge = 1.0, mass = 1950.0, lifetime = 1.0970200000000001e-23, evtgenname = 'anti-Xi(1950)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi(1950)-', geantid = 103316, pdgid = 103316, charge = -1.0, mass = 1950.0, lifetime = 1.0970200000000001e-23, evtgenname = 'Xi(1950)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi(1950)~0', geantid = -103326, pdgid = -103326, charge = 0.0, mass = 1950.0, lifetime = 1.0970200000000001e-23, evtgenname = 'anti-Xi(1950)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi(1950)0', geantid = 103326, pdgid = 103326, charge = 0.0, mass = 1950.0, lifetime = 1.0970200000000001e-23, evtgenname = 'Xi(1950)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda_c(2625)~-', geantid = -104124, pdgid = -104124, charge = -1.0, mass = 2628.11, lifetime = 0.0, evtgenname = 'anti-Lambda_c(2625)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda_c(2625)+', geantid = 104124, pdgid = 104124, charge = 1.0, mass = 2628.11, lifetime = 0.0, evtgenname = 'Lambda_c(2625)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_c(2815)~0', geantid = -104312, pdgid = -104312, charge = 0.0, mass = 2819.6, lifetime = 0.0, evtgenname = 'anti-Xi_c(2815)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_c(2815)0', geantid = 104312, pdgid = 104312, charge = 0.0, mass = 2819.6, lifetime = 0.0, evtgenname = 'Xi_c(2815)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_c(2790)~0', geantid = -104314, pdgid = -104314, charge = 0.0, mass = 2791.7999999999997, lifetime = 0.0, evtgenname = 'anti-Xi_c(2790)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_c(2790)0', geantid = 104314, pdgid = 104314, charge = 0.0, mass = 2791.7999999999997, lifetime = 0.0, evtgenname = 'Xi_c(2790)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_c(2815)~-', geantid = -104322, pdgid = -104322, charge = -1.0, mass = 2816.6000000000004, lifetime = 0.0, evtgenname = 'anti-Xi_c(2815)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_c(2815)+', geantid = 104322, pdgid = 104322, charge = 1.0, mass = 2816.6000000000004, lifetime = 0.0, evtgenname = 'Xi_c(2815)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_c(2790)~-', geantid = -104324, pdgid = -104324, charge = -1.0, mass = 2789.1, lifetime = 0.0, evtgenname = 'anti-Xi_c(2790)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi_c(2790)+', geantid = 104324, pdgid = 104324, charge = 1.0, mass = 2789.1, lifetime = 0.0, evtgenname = 'Xi_c(2790)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'chi_b0(2P)', geantid = 110551, pdgid = 110551, charge = 0.0, mass = 10232.5, lifetime = 0.0, evtgenname = 'chi_b0(2P)', pythiaid = 110551, maxwidth = 0.0),
- ParticleInfo(name = 'h_b(2P)', geantid = 110553, pdgid = 110553, charge = 0.0, mass = 10255.0, lifetime = 0.0, evtgenname = 'h_b(2P)', pythiaid = 110553, maxwidth = 0.0),
- ParticleInfo(name = 'eta_b2(2D)', geantid = 110555, pdgid = 110555, charge = 0.0, mass = 10441.0, lifetime = 0.0, evtgenname = 'eta_b2(2D)', pythiaid = 110555, maxwidth = 0.0),
- ParticleInfo(name = 'chi_b1(2P)', geantid = 120553, pdgid = 120553, charge = 0.0, mass = 10255.46, lifetime = 0.0, evtgenname = 'chi_b1(2P)', pythiaid = 120553, maxwidth = 0.0),
- ParticleInfo(name = 'Upsilon_2(2D)', geantid = 120555, pdgid = 120555, charge = 0.0, mass = 10440.6, lifetime = 0.0, evtgenname = 'Upsilon_2(2D)', pythiaid = 120555, maxwidth = 0.0),
- ParticleInfo(name = 'Upsilon_1(2D)', geantid = 130553, pdgid = 130553, charge = 0.0, mass = 10434.900000000001, lifetime = 0.0, evtgenname = 'Upsilon_1(2D)', pythiaid = 130553, maxwidth = 0.0),
- ParticleInfo(name = 'eta_b(3S)', geantid = 200551, pdgid = 200551, charge = 0.0, mass = 10335.0, lifetime = 0.0, evtgenname = 'eta_b(3S)', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Upsilon(3S)', geantid = 200553, pdgid = 200553, charge = 0.0, mass = 10355.2, lifetime = 3.2424250000000004e-20, evtgenname = 'Upsilon(3S)', pythiaid = 200553, maxwidth = 0.0),
- ParticleInfo(name = 'chi_b2(3P)', geantid = 200555, pdgid = 200555, charge = 0.0, mass = 10526.199999999999, lifetime = 0.0, evtgenname = 'chi_b2(3P)', pythiaid = 200555, maxwidth = 0.0),
- ParticleInfo(name = 'Xi(1690)~+', geantid = -203312, pdgid = -203312, charge = 1.0, mass = 1690.0, lifetime = 0.0, evtgenname = 'anti-Xi(1690)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi(1690)-', geantid = 203312, pdgid = 203312, charge = -1.0, mass = 1690.0, lifetime = 0.0, evtgenname = 'Xi(1690)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi(2030)~+', geantid = -203316, pdgid = -203316, charge = 1.0, mass = 2025.0, lifetime = 3.2910610000000004e-23, evtgenname = 'anti-Xi(2030)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi(2030)-', geantid = 203316, pdgid = 203316, charge = -1.0, mass = 2025.0, lifetime = 3.2910610000000004e-23, evtgenname = 'Xi(2030)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi(1690)~0', geantid = -203322, pdgid = -203322, charge = 0.0, mass = 1690.0, lifetime = 0.0, evtgenname = 'anti-Xi(1690)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi(1690)0', geantid = 203322, pdgid = 203322, charge = 0.0, mass = 1690.0, lifetime = 0.0, evtgenname = 'Xi(1690)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi(2030)~0', geantid = -203326, pdgid = -203326, charge = 0.0, mass = 2025.0, lifetime = 3.2910610000000004e-23, evtgenname = 'anti-Xi(2030)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Xi(2030)0', geantid = 203326, pdgid = 203326, charge = 0.0, mass = 2025.0, lifetime = 3.2910610000000004e-23, evtgenname = 'Xi(2030)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Omega(2250)~+', geantid = -203338, pdgid = -203338, charge = 1.0, mass = 2252.0, lifetime = 1.1967490000000002e-23, evtgenname = 'anti-Omega(2250)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Omega(2250)-', geantid = 203338, pdgid = 203338, charge = -1.0, mass = 2252.0, lifetime = 1.1967490000000002e-23, evtgenname = 'Omega(2250)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda_c(2880)~-', geantid = -204126, pdgid = -204126, charge = -1.0, mass = 2881.53, lifetime = 1.1348490000000002e-22, evtgenname = 'anti-Lambda_c(2880)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Lambda_c(2880)+', geantid = 204126, pdgid = 204126, charge = 1.0, mass = 2881.53, lifetime = 1.1348490000000002e-22, evtgenname = 'Lambda_c(2880)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'chi_b0(3P)', geantid = 210551, pdgid = 210551, charge = 0.0, mass = 10500.400000000001, lifetime = 0.0, evtgenname = 'chi_b0(3P)', pythiaid = 210551, maxwidth = 0.0),
- ParticleInfo(name = 'h_b(3P)', geantid = 210553, pdgid = 210553, charge = 0.0, mass = 10516.0, lifetime = 0.0, evtgenname = 'h_b(3P)', pythiaid = 210553, maxwidth = 0.0),
- ParticleInfo(name = 'chi_b1(3P)', geantid = 220553, pdgid = 220553, charge = 0.0, mass = 10515.7, lifetime = 0.0, evtgenname = 'chi_b1(3P)', pythiaid = 220553, maxwidth = 0.0),
- ParticleInfo(name = 'Upsilon(4S)', geantid = 300553, pdgid = 300553, charge = 0.0, mass = 10579.4, lifetime = 3.210791e-23, evtgenname = 'Upsilon(4S)', pythiaid = 300553, maxwidth = 0.0),
- ParticleInfo(name = '~d_Lbar', geantid = -1000001, pdgid = -1000001, charge = 0.3, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -1000001, maxwidth = 0.0),
- ParticleInfo(name = '~d_L', geantid = 1000001, pdgid = 1000001, charge = -0.3, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 1000001, maxwidth = 0.0),
- ParticleInfo(name = '~u_Lbar', geantid = -1000002, pdgid = -1000002, charge = -0.7, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -1000002, maxwidth = 0.0),
- ParticleInfo(name = '~u_L', geantid = 1000002, pdgid = 1000002, charge = 0.7, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 1000002, maxwidth = 0.0),
- ParticleInfo(name = '~s_Lbar', geantid = -1000003, pdgid = -1000003, charge = 0.3, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -1000003, maxwidth = 0.0),
- ParticleInfo(name = '~s_L', geantid = 1000003, pdgid = 1000003, charge = -0.3, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 1000003, maxwidth = 0.0),
- ParticleInfo(name = '~c_Lbar', geantid = -1000004, pdgid = -1000004, charge = -0.7, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -1000004, maxwidth = 0.0),
- ParticleInfo(name = '~c_L', geantid = 1000004, pdgid = 1000004, charge = 0.7, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 1000004, maxwidth = 0.0),
- ParticleInfo(name = '~b_1bar', geantid = -1000005, pdgid = -1000005, charge = 0.3, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -1000005, maxwidth = 0.0),
- ParticleInfo(name = '~b_1', geantid = 1000005, pdgid = 1000005, charge = -0.3, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 1000005, maxwidth = 0.0),
- ParticleInfo(name = '~t_1bar', geantid = -1000006, pdgid = -1000006, charge = -0.7, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -1000006, maxwidth = 0.0),
- ParticleInfo(name = '~t_1', geantid = 1000006, pdgid = 1000006, charge = 0.7, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 1000006, maxwidth = 0.0),
- ParticleInfo(name = '~e_L+', geantid = -1000011, pdgid = -1000011, charge = 1.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -1000011, maxwidth = 0.0),
- ParticleInfo(name = '~e_L-', geantid = 1000011, pdgid = 1000011, charge = -1.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 1000011, maxwidth = 0.0),
- ParticleInfo(name = '~nu_eLbar', geantid = -1000012, pdgid = -1000012, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -1000012, maxwidth = 0.0),
- ParticleInfo(name = '~nu_eL', geantid = 1000012, pdgid = 1000012, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 1000012, maxwidth = 0.0),
- ParticleInfo(name = '~mu_L+', geantid = -1000013, pdgid = -1000013, charge = 1.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -1000013, maxwidth = 0.0),
- ParticleInfo(name = '~mu_L-', geantid = 1000013, pdgid = 1000013, charge = -1.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 1000013, maxwidth = 0.0),
- ParticleInfo(name = '~nu_muLbar', geantid = -1000014, pdgid = -1000014, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -1000014, maxwidth = 0.0),
- ParticleInfo(name = '~nu_muL', geantid = 1000014, pdgid = 1000014, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 1000014, maxwidth = 0.0),
- ParticleInfo(name = '~tau_1+', geantid = -1000015, pdgid = -1000015, charge = 1.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -1000015, maxwidth = 0.0),
- ParticleInfo(name = '~tau_1-', geantid = 1000015, pdgid = 1000015, charge = -1.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 1000015, maxwidth = 0.0),
- ParticleInfo(name = '~nu_tauLbar', geantid = -1000016, pdgid = -1000016, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -1000016, maxwidth = 0.0),
- ParticleInfo(name = '~nu_tauL', geantid = 1000016, pdgid = 1000016, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 1000016, maxwidth = 0.0),
- ParticleInfo(name = '~g', geantid = 1000021, pdgid = 1000021, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 1000021, maxwidth = 0.0),
- ParticleInfo(name = '~chi_10', geantid = 1000022, pdgid = 1000022, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 1000022, maxwidth = 0.0),
- ParticleInfo(name = '~chi_20', geantid = 1000023, pdgid = 1000023, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 1000023, maxwidth = 0.0),
- ParticleInfo(name = '~chi_1-', geantid = -1000024, pdgid = -1000024, charge = -1.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -1000024, maxwidth = 0.0),
- ParticleInfo(name = '~chi_1+', geantid = 1000024, pdgid = 1000024, charge = 1.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 1000024, maxwidth = 0.0),
- ParticleInfo(name = '~chi_30', geantid = 1000025, pdgid = 1000025, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 1000025, maxwidth = 0.0),
- ParticleInfo(name = '~chi_40', geantid = 1000035, pdgid = 1000035, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 1000035, maxwidth = 0.0),
- ParticleInfo(name = '~chi_2-', geantid = -1000037, pdgid = -1000037, charge = -1.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -1000037, maxwidth = 0.0),
- ParticleInfo(name = '~chi_2+', geantid = 1000037, pdgid = 1000037, charge = 1.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 1000037, maxwidth = 0.0),
- ParticleInfo(name = '~Gravitino', geantid = 1000039, pdgid = 1000039, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 1000039, maxwidth = 0.0),
- ParticleInfo(name = '~d_Rbar', geantid = -2000001, pdgid = -2000001, charge = 0.3, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -2000001, maxwidth = 0.0),
- ParticleInfo(name = '~d_R', geantid = 2000001, pdgid = 2000001, charge = -0.3, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 2000001, maxwidth = 0.0),
- ParticleInfo(name = '~u_Rbar', geantid = -2000002, pdgid = -2000002, charge = -0.7, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -2000002, maxwidth = 0.0),
- ParticleInfo(name = '~u_R', geantid = 2000002, pdgid = 2000002, charge = 0.7, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 2000002, maxwidth = 0.0),
- ParticleInfo(name = '~s_Rbar', geantid = -2000003, pdgid = -2000003, charge = 0.3, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -2000003, maxwidth = 0.0),
- ParticleInfo(name = '~s_R', geantid = 2000003, pdgid = 2000003, charge = -0.3, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 2000003, maxwidth = 0.0),
- ParticleInfo(name = '~c_Rbar', geantid = -2000004, pdgid = -2000004, charge = -0.7, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -2000004, maxwidth = 0.0),
- ParticleInfo(name = '~c_R', geantid = 2000004, pdgid = 2000004, charge = 0.7, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 2000004, maxwidth = 0.0),
- ParticleInfo(name = '~b_2bar', geantid = -2000005, pdgid = -2000005, charge = 0.3, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -2000005, maxwidth = 0.0),
- ParticleInfo(name = '~b_2', geantid = 2000005, pdgid = 2000005, charge = -0.3, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 2000005, maxwidth = 0.0),
- ParticleInfo(name = '~t_2bar', geantid = -2000006, pdgid = -2000006, charge = -0.7, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -2000006, maxwidth = 0.0),
- ParticleInfo(name = '~t_2', geantid = 2000006, pdgid = 2000006, charge = 0.7, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 2000006, maxwidth = 0.0),
- ParticleInfo(name = '~e_R+', geantid = -2000011, pdgid = -2000011, charge = 1.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -2000011, maxwidth = 0.0),
- ParticleInfo(name = '~e_R-', geantid = 2000011, pdgid = 2000011, charge = -1.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 2000011, maxwidth = 0.0),
- ParticleInfo(name = '~nu_eRbar', geantid = -2000012, pdgid = -2000012, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -2000012, maxwidth = 0.0),
- ParticleInfo(name = '~nu_eR', geantid = 2000012, pdgid = 2000012, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 2000012, maxwidth = 0.0),
- ParticleInfo(name = '~mu_R+', geantid = -2000013, pdgid = -2000013, charge = 1.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -2000013, maxwidth = 0.0),
- ParticleInfo(name = '~mu_R-', geantid = 2000013, pdgid = 2000013, charge = -1.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 2000013, maxwidth = 0.0),
- ParticleInfo(name = '~nu_muRbar', geantid = -2000014, pdgid = -2000014, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -2000014, maxwidth = 0.0),
- ParticleInfo(name = '~nu_muR', geantid = 2000014, pdgid = 2000014, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 2000014, maxwidth = 0.0),
- ParticleInfo(name = '~tau_2+', geantid = -2000015, pdgid = -2000015, charge = 1.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -2000015, maxwidth = 0.0),
- ParticleInfo(name = '~tau_2-', geantid = 2000015, pdgid = 2000015, charge = -1.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 2000015, maxwidth = 0.0),
- ParticleInfo(name = '~nu_tauRbar', geantid = -2000016, pdgid = -2000016, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -2000016, maxwidth = 0.0),
- ParticleInfo(name = '~nu_tauR', geantid = 2000016, pdgid = 2000016, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 2000016, maxwidth = 0.0),
- ParticleInfo(name = 'pi_tc0', geantid = 3000111, pdgid = 3000111, charge = 0.0, mass = 110000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 3000111, maxwidth = 0.0),
- ParticleInfo(name = 'rho_tc0', geantid = 3000113, pdgid = 3000113, charge = 0.0, mass = 210000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 3000113, maxwidth = 0.0),
- ParticleInfo(name = 'pi_tc-', geantid = -3000211, pdgid = -3000211, charge = -1.0, mass = 110000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -3000211, maxwidth = 0.0),
- ParticleInfo(name = 'pi_tc+', geantid = 3000211, pdgid = 3000211, charge = 1.0, mass = 110000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 3000211, maxwidth = 0.0),
- ParticleInfo(name = 'rho_tc-', geantid = -3000213, pdgid = -3000213, charge = -1.0, mass = 210000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -3000213, maxwidth = 0.0),
- ParticleInfo(name = 'rho_tc+', geantid = 3000213, pdgid = 3000213, charge = 1.0, mass = 210000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 3000213, maxwidth = 0.0),
- ParticleInfo(name = "pi'_tc0", geantid = 3000221, pdgid = 3000221, charge = 0.0, mass = 110000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 3000221, maxwidth = 0.0),
- ParticleInfo(name = 'omega_tc', geantid = 3000223, pdgid = 3000223, charge = 0.0, mass = 210000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 3000223, maxwidth = 0.0),
- ParticleInfo(name = 'eta_tc0', geantid = 3000331, pdgid = 3000331, charge = 0.0, mass = 350000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 3000331, maxwidth = 0.0),
- ParticleInfo(name = 'V8_tc', geantid = 3100021, pdgid = 3100021, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 3100021, maxwidth = 0.0),
- ParticleInfo(name = 'pi_22_1_tc', geantid = 3100111, pdgid = 3100111, charge = 0.0, mass = 125000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 3100111, maxwidth = 0.0),
- ParticleInfo(name = 'rho_11_tc', geantid = 3100113, pdgid = 3100113, charge = 0.0, mass = 400000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 3100113, maxwidth = 0.0),
- ParticleInfo(name = 'pi_22_8_tc', geantid = 3200111, pdgid = 3200111, charge = 0.0, mass = 250000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 3200111, maxwidth = 0.0),
- ParticleInfo(name = 'rho_12_tc', geantid = 3200113, pdgid = 3200113, charge = 0.0, mass = 350000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 3200113, maxwidth = 0.0),
- ParticleInfo(name = 'rho_21_tc', geantid = 3300113, pdgid = 3300113, charge = 0.0, mass = 350000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 3300113, maxwidth = 0.0),
- ParticleInfo(name = 'rho_22_tc', geantid = 3400113, pdgid = 3400113, charge = 0.0, mass = 300000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 3400113, maxwidth = 0.0),
- ParticleInfo(name = 'd*bar', geantid = -4000001, pdgid = -4000001, charge = 0.3, mass = 400000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -4000001, maxwidth = 0.0),
- ParticleInfo(name = 'd*', geantid = 4000001, pdgid = 4000001, charge = -0.3, mass = 400000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 4000001, maxwidth = 0.0),
- ParticleInfo(name = 'u*bar', geantid = -4000002, pdgid = -4000002, charge = -0.7, mass = 400000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -4000002, maxwidth = 0.0),
- ParticleInfo(name = 'u*', geantid = 4000002, pdgid = 4000002, charge = 0.7, mass = 400000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 4000002, maxwidth = 0.0),
- ParticleInfo(name = 'e*bar+', geantid = -4000011, pdgid = -4000011, charge = 1.0, mass = 400000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -4000011, maxwidth = 0.0),
- ParticleInfo(name = 'e*-', geantid = 4000011, pdgid = 4000011, charge = -1.0, mass = 400000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 4000011, maxwidth = 0.0),
- ParticleInfo(name = 'nu*_ebar0', geantid = -4000012, pdgid = -4000012, charge = 0.0, mass = 400000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -4000012, maxwidth = 0.0),
- ParticleInfo(name = 'nu*_e0', geantid = 4000012, pdgid = 4000012, charge = 0.0, mass = 400000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 4000012, maxwidth = 0.0),
- ParticleInfo(name = 'Graviton*', geantid = 5000039, pdgid = 5000039, charge = 0.0, mass = 1000000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 5000039, maxwidth = 0.0),
- ParticleInfo(name = 'a_0(980)0', geantid = 9000111, pdgid = 9000111, charge = 0.0, mass = 980.0, lifetime = 8.776163e-24, evtgenname = 'a_00', pythiaid = 10111, maxwidth = 0.0),
- ParticleInfo(name = 'pi_1(1400)0', geantid = 9000113, pdgid = 9000113, charge = 0.0, mass = 1354.0, lifetime = 1.994582e-24, evtgenname = 'pi_1(1400)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'a_0(980)-', geantid = -9000211, pdgid = -9000211, charge = -1.0, mass = 980.0, lifetime = 8.776163e-24, evtgenname = 'a_0-', pythiaid = -10211, maxwidth = 0.0),
- ParticleInfo(name = 'a_0(980)+', geantid = 9000211, pdgid = 9000211, charge = 1.0, mass = 980.0, lifetime = 8.776163e-24, evtgenname = 'a_0+', pythiaid = 10211, maxwidth = 0.0),
- ParticleInfo(name = 'pi_1(1400)-', geantid = -9000213, pdgid = -9000213, charge = -1.0, mass = 1354.0, lifetime = 1.994582e-24, evtgenname = 'pi_1(1400)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'pi_1(1400)+', geantid = 9000213, pdgid = 9000213, charge = 1.0, mass = 1354.0, lifetime = 1.994582e-24, evtgenname = 'pi_1(1400)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'sigma_0', geantid = 9000221, pdgid = 9000221, charge = 0.0, mass = 475.0, lifetime = 1.196749e-24, evtgenname = 'sigma_0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'psi(4040)', geantid = 9000443, pdgid = 9000443, charge = 0.0, mass = 4038.9999999999995, lifetime = 8.227652000000001e-24, evtgenname = 'psi(4040)', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Upsilon(10860)', geantid = 9000553, pdgid = 9000553, charge = 0.0, mass = 10876.0, lifetime = 1.1967490000000002e-23, evtgenname = 'Upsilon(5S)', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'pi(1800)0', geantid = 9010111, pdgid = 9010111, charge = 0.0, mass = 1812.0, lifetime = 3.164482e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'pi_1(1600)0', geantid = 9010113, pdgid = 9010113, charge = 0.0, mass = 1662.0, lifetime = 2.7425510000000005e-24, evtgenname = 'pi_1(1600)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'pi(1800)-', geantid = -9010211, pdgid = -9010211, charge = -1.0, mass = 1812.0, lifetime = 3.164482e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'pi(1800)+', geantid = 9010211, pdgid = 9010211, charge = 1.0, mass = 1812.0, lifetime = 3.164482e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'pi_1(1600)-', geantid = -9010213, pdgid = -9010213, charge = -1.0, mass = 1662.0, lifetime = 2.7425510000000005e-24, evtgenname = 'pi_1(1600)-', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'pi_1(1600)+', geantid = 9010213, pdgid = 9010213, charge = 1.0, mass = 1662.0, lifetime = 2.7425510000000005e-24, evtgenname = 'pi_1(1600)+', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'f_0(980)', geantid = 9010221, pdgid = 9010221, charge = 0.0, mass = 990.0, lifetime = 9.403031e-24, evtgenname = 'f_0', pythiaid = 10221, maxwidth = 0.0),
- ParticleInfo(name = 'psi(4160)', geantid = 9010443, pdgid = 9010443, charge = 0.0, mass = 4191.0, lifetime = 9.403029000000001e-24, evtgenname = 'psi(4160)', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Upsilon(11020)', geantid = 9010553, pdgid = 9010553, charge = 0.0, mass = 11019.0, lifetime = 8.331800000000001e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'eta(1405)0', geantid = 9020221, pdgid = 9020221, charge = 0.0, mass = 1408.8, lifetime = 1.290612e-23, evtgenname = 'eta(1405)0', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'psi(4415)', geantid = 9020443, pdgid = 9020443, charge = 0.0, mass = 4421.0, lifetime = 1.061633e-23, evtgenname = 'psi(4415)', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'f_0(1500)', geantid = 9030221, pdgid = 9030221, charge = 0.0, mass = 1505.0, lifetime = 6.038644000000001e-24, evtgenname = 'f_0(1500)', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Z(4430)-', geantid = -9042413, pdgid = -9042413, charge = -1.0, mass = 4433.0, lifetime = 2.0763400000000002e-21, evtgenname = 'Z(4430)-', pythiaid = -9042413, maxwidth = 0.0),
- ParticleInfo(name = 'Z(4430)+', geantid = 9042413, pdgid = 9042413, charge = 1.0, mass = 4433.0, lifetime = 2.0763400000000002e-21, evtgenname = 'Z(4430)+', pythiaid = 9042413, maxwidth = 0.0),
- ParticleInfo(name = 'f_2(1950)', geantid = 9050225, pdgid = 9050225, charge = 0.0, mass = 1944.0, lifetime = 1.3945170000000001e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'f_2(2010)', geantid = 9060225, pdgid = 9060225, charge = 0.0, mass = 2011.0000000000002, lifetime = 3.2910610000000003e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'f_2(2300)', geantid = 9080225, pdgid = 9080225, charge = 0.0, mass = 2297.0, lifetime = 4.41753e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'f_2(2340)', geantid = 9090225, pdgid = 9090225, charge = 0.0, mass = 2339.0, lifetime = 2.063361e-24, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'nu_Re', geantid = 9900012, pdgid = 9900012, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 9900012, maxwidth = 0.0),
- ParticleInfo(name = 'nu_Rmu', geantid = 9900014, pdgid = 9900014, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 9900014, maxwidth = 0.0),
- ParticleInfo(name = 'nu_Rtau', geantid = 9900016, pdgid = 9900016, charge = 0.0, mass = 500000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 9900016, maxwidth = 0.0),
- ParticleInfo(name = 'Z_R0', geantid = 9900023, pdgid = 9900023, charge = 0.0, mass = 1200000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 9900023, maxwidth = 0.0),
- ParticleInfo(name = 'W_R-', geantid = -9900024, pdgid = -9900024, charge = -1.0, mass = 750000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -9900024, maxwidth = 0.0),
- ParticleInfo(name = 'W_R+', geantid = 9900024, pdgid = 9900024, charge = 1.0, mass = 750000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 9900024, maxwidth = 0.0),
- ParticleInfo(name = 'H_L--', geantid = -9900041, pdgid = -9900041, charge = -2.0, mass = 200000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -9900041, maxwidth = 0.0),
- ParticleInfo(name = 'H_L++', geantid = 9900041, pdgid = 9900041, charge = 2.0, mass = 200000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 9900041, maxwidth = 0.0),
- ParticleInfo(name = 'H_R--', geantid = -9900042, pdgid = -9900042, charge = -2.0, mass = 200000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = -9900042, maxwidth = 0.0),
- ParticleInfo(name = 'H_R++', geantid = 9900042, pdgid = 9900042, charge = 2.0, mass = 200000.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 9900042, maxwidth = 0.0),
- ParticleInfo(name = 'X_2(3872)', geantid = 9910445, pdgid = 9910445, charge = 0.0, mass = 3871.69, lifetime = 2.0763400000000002e-21, evtgenname = 'X_2(3872)', pythiaid = 9910445, maxwidth = 0.0),
- ParticleInfo(name = 'X_1(3872)', geantid = 9920443, pdgid = 9920443, charge = 0.0, mass = 3871.69, lifetime = 2.0763400000000002e-21, evtgenname = 'X_1(3872)', pythiaid = 9920443, maxwidth = 0.0),
- ParticleInfo(name = 'Intermediate', geantid = -99000000, pdgid = -99000000, charge = 0.0, mass = 0.0, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'geantino', geantid = 480000000, pdgid = 480000000, charge = 0.0, mass = 0.0, lifetime = 1000000000000000.0, evtgenname = 'geantino', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'deutron~', geantid = -1000010020, pdgid = -1000010020, charge = -1.0, mass = 1875.613, lifetime = 0.0, evtgenname = 'anti-deuteron', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'deuteron', geantid = 1000010020, pdgid = 1000010020, charge = 1.0, mass = 1875.613, lifetime = 1000000000000000.0, evtgenname = 'deuteron', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'triton~', geantid = -1000010030, pdgid = -1000010030, charge = -1.0, mass = 2809.25, lifetime = 0.0, evtgenname = 'anti-tritium', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'triton', geantid = 1000010030, pdgid = 1000010030, charge = 1.0, mass = 2809.25, lifetime = 1000000000000000.0, evtgenname = 'tritium', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'He3~[0.0]', geantid = -1000020030, pdgid = -1000020030, charge = -2.0, mass = 2809.23, lifetime = 0.0, evtgenname = 'anti-He3', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'He3[0.0]', geantid = 1000020030, pdgid = 1000020030, charge = 2.0, mass = 2809.23, lifetime = 1000000000000000.0, evtgenname = 'He3', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'alpha~', geantid = -1000020040, pdgid = -1000020040, charge = -2.0, mass = 3727.417, lifetime = 0.0, evtgenname = 'anti-alpha', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'alpha', geantid = 1000020040, pdgid = 1000020040, charge = 2.0, mass = 3727.417, lifetime = 1000000000000000.0, evtgenname = 'alpha', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Li7[0.0]', geantid = 1000030070, pdgid = 1000030070, charge = 3.0, mass = 6535.365, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Be8[0.0]', geantid = 1000040080, pdgid = 1000040080, charge = 4.0, mass = 7456.893, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Be9[0.0]', geantid = 1000040090, pdgid = 1000040090, charge = 4.0, mass = 8394.792000000001, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Be10[0.0]', geantid = 1000040100, pdgid = 1000040100, charge = 4.0, mass = 9327.545, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'B10[0.0]', geantid = 1000050100, pdgid = 1000050100, charge = 5.0, mass = 9326.989, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'B11[0.0]', geantid = 1000050110, pdgid = 1000050110, charge = 5.0, mass = 10255.101, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'B12[0.0]', geantid = 1000050120, pdgid = 1000050120, charge = 5.0, mass = 11191.295, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'C12[0.0]', geantid = 1000060120, pdgid = 1000060120, charge = 6.0, mass = 11174.9, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'C13[0.0]', geantid = 1000060130, pdgid = 1000060130, charge = 6.0, mass = 12112.545, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'C14[0.0]', geantid = 1000060140, pdgid = 1000060140, charge = 6.0, mass = 13043.934, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N14[0.0]', geantid = 1000070140, pdgid = 1000070140, charge = 7.0, mass = 13043.78, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N15[0.0]', geantid = 1000070150, pdgid = 1000070150, charge = 7.0, mass = 13043.778, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'N16[0.0]', geantid = 1000070160, pdgid = 1000070160, charge = 7.0, mass = 14909.585, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'O16[0.0]', geantid = 1000080160, pdgid = 1000080160, charge = 8.0, mass = 14895.099999999999, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'O17[0.0]', geantid = 1000080170, pdgid = 1000080170, charge = 8.0, mass = 15834.587000000001, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'O18[0.0]', geantid = 1000080180, pdgid = 1000080180, charge = 8.0, mass = 16766.108, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'O19[0.0]', geantid = 1000080190, pdgid = 1000080190, charge = 8.0, mass = 17701.716999999997, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'F19[0.0]', geantid = 1000090190, pdgid = 1000090190, charge = 9.0, mass = 17696.896, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Ne22[0.0]', geantid = 1000100220, pdgid = 1000100220, charge = 10.0, mass = 20484.841, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Ne23[0.0]', geantid = 1000100230, pdgid = 1000100230, charge = 10.0, mass = 21419.205, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Na24[0.0]', geantid = 1000110240, pdgid = 1000110240, charge = 11.0, mass = 22347.435, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Mg24[0.0]', geantid = 1000120240, pdgid = 1000120240, charge = 12.0, mass = 22341.92, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Mg25[0.0]', geantid = 1000120250, pdgid = 1000120250, charge = 12.0, mass = 23274.154, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Mg26[0.0]', geantid = 1000120260, pdgid = 1000120260, charge = 12.0, mass = 24202.626, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Mg27[0.0]', geantid = 1000120270, pdgid = 1000120270, charge = 12.0, mass = 25135.748, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Al27[0.0]', geantid = 1000130270, pdgid = 1000130270, charge = 13.0, mass = 25126.5, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Al28[0.0]', geantid = 1000130280, pdgid = 1000130280, charge = 13.0, mass = 26064.978, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Si28[0.0]', geantid = 1000140280, pdgid = 1000140280, charge = 14.0, mass = 26053.2, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Si29[0.0]', geantid = 1000140290, pdgid = 1000140290, charge = 14.0, mass = 26991.427000000003, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Si30[0.0]', geantid = 1000140300, pdgid = 1000140300, charge = 14.0, mass = 27920.383, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'P31[0.0]', geantid = 1000150310, pdgid = 1000150310, charge = 15.0, mass = 28851.869000000002, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Cl39[0.0]', geantid = 1000170390, pdgid = 1000170390, charge = 17.0, mass = 36298.46, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Cl40[0.0]', geantid = 1000170400, pdgid = 1000170400, charge = 17.0, mass = 37232.201, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Ar36[0.0]', geantid = 1000180360, pdgid = 1000180360, charge = 18.0, mass = 33503.549, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Ar40[0.0]', geantid = 1000180400, pdgid = 1000180400, charge = 18.0, mass = 37224.715000000004, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Cr50[0.0]', geantid = 1000240500, pdgid = 1000240500, charge = 24.0, mass = 46524.439, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Cr52[0.0]', geantid = 1000240520, pdgid = 1000240520, charge = 24.0, mass = 48370.1, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Cr53[0.0]', geantid = 1000240530, pdgid = 1000240530, charge = 24.0, mass = 49313.894, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Cr54[0.0]', geantid = 1000240540, pdgid = 1000240540, charge = 24.0, mass = 50243.741, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Mn55[0.0]', geantid = 1000250550, pdgid = 1000250550, charge = 25.0, mass = 51174.456999999995, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Fe54[0.0]', geantid = 1000260540, pdgid = 1000260540, charge = 26.0, mass = 50244.421, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Fe56[0.0]', geantid = 1000260560, pdgid = 1000260560, charge = 26.0, mass = 52103.056000000004, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Fe57[0.0]', geantid = 1000260570, pdgid = 1000260570, charge = 26.0, mass = 53034.975000000006, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Fe59[0.0]', geantid = 1000260590, pdgid = 1000260590, charge = 26.0, mass = 54897.48, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Ni58[0.0]', geantid = 1000280580, pdgid = 1000280580, charge = 28.0, mass = 53966.422, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Ni60[0.0]', geantid = 1000280600, pdgid = 1000280600, charge = 28.0, mass = 55825.164000000004, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Ni61[0.0]', geantid = 1000280610, pdgid = 1000280610, charge = 28.0, mass = 56756.909, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Ni62[0.0]', geantid = 1000280620, pdgid = 1000280620, charge = 28.0, mass = 57685.877, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Ni63[0.0]', geantid = 1000280630, pdgid = 1000280630, charge = 28.0, mass = 58618.605, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Ni64[0.0]', geantid = 1000280640, pdgid = 1000280640, charge = 28.0, mass = 59548.512, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Cu63[0.0]', geantid = 1000290630, pdgid = 1000290630, charge = 29.0, mass = 58618.6, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Cu65[0.0]', geantid = 1000290650, pdgid = 1000290650, charge = 29.0, mass = 60479.842, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Mo92[0.0]', geantid = 1000420920, pdgid = 1000420920, charge = 42.0, mass = 85610.63, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Mo95[0.0]', geantid = 1000420950, pdgid = 1000420950, charge = 42.0, mass = 88404.21, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Mo96[0.0]', geantid = 1000420960, pdgid = 1000420960, charge = 42.0, mass = 89334.621, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Mo97[0.0]', geantid = 1000420970, pdgid = 1000420970, charge = 42.0, mass = 90267.365, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Mo98[0.0]', geantid = 1000420980, pdgid = 1000420980, charge = 42.0, mass = 91198.287, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Mo100[0.0]', geantid = 1000421000, pdgid = 1000421000, charge = 42.0, mass = 93063.20300000001, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Pd108[0.0]', geantid = 1000461080, pdgid = 1000461080, charge = 46.0, mass = 100511.81599999999, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Au197[0.0]', geantid = 1000791970, pdgid = 1000791970, charge = 79.0, mass = 183433.36, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Pb204[0.0]', geantid = 1000822040, pdgid = 1000822040, charge = 82.0, mass = 189999.627, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Pb206[0.0]', geantid = 1000822060, pdgid = 1000822060, charge = 82.0, mass = 191863.937, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Pb207[0.0]', geantid = 1000822070, pdgid = 1000822070, charge = 82.0, mass = 192796.76499999998, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0),
- ParticleInfo(name = 'Pb208[0.0]', geantid = 1000822080, pdgid = 1000822080, charge = 82.0, mass = 193728.962, lifetime = 0.0, evtgenname = 'unknown', pythiaid = 0, maxwidth = 0.0)]
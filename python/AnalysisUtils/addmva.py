@@ -1,10 +1,32 @@
 from xml.etree import ElementTree
 from argparse import ArgumentParser
-import ROOT, os, multiprocessing
+import ROOT, os, multiprocessing, numpy
 from array import array
-from AnalysisUtils.treeutils import TreeFormula, is_tfile_ok
+from AnalysisUtils.treeutils import TreeFormula, is_tfile_ok, declare_cpp
 from multiprocessing import Pool
 
+# C++ loop to evaluate the MVA for each row of an array of variable values. The reader's
+# variables are bound to the addresses of the MVACalc's arrays, of type float or int.
+_cppevaluate = r'''
+#include "TMVA/Reader.h"
+
+namespace AnalysisUtils {
+  Long64_t evaluate_mva(TMVA::Reader* reader, const char* method, Long64_t nvars, const Long_t* addresses,
+                        const Long_t* isint, const double* values, Long64_t nentries, double* out) {
+    for (Long64_t i = 0; i < nentries; ++i) {
+      for (Long64_t j = 0; j < nvars; ++j) {
+        if (isint[j])
+          *reinterpret_cast<Int_t*>(addresses[j]) = Int_t(values[i * nvars + j]);
+        else
+          *reinterpret_cast<Float_t*>(addresses[j]) = Float_t(values[i * nvars + j]);
+      }
+      out[i] = reader->EvaluateMVA(method);
+    }
+    return nentries;
+  }
+}
+'''
+
 class MVACalc(object) :
     '''Class to calculate MVA variables from an xml file output by TMVA.'''
 
@@ -22,6 +44,8 @@ class MVACalc(object) :
         self.reader = ROOT.TMVA.Reader('Silent')
         self.treevars = {}
         self.tmvavararrays = {}
+        # The variables and spectators in the order they're given to the reader.
+        self.formulae = []
 
         weightvars = weightsroot.findall('Variables')[0].findall('Variable')
         for v in weightvars :
@@ -31,6 +55,7 @@ class MVACalc(object) :
             self.tmvavararrays[form] = array(vtype.lower(), [0])
             self.reader.AddVariable(form, self.tmvavararrays[form])
             self.treevars[form] = TreeFormula(form, form, inputtree)
+            self.formulae.append(form)
 
         spectatorvars = weightsroot.findall('Spectators')[0].findall('Spectator')
         for v in spectatorvars :
@@ -39,6 +64,7 @@ class MVACalc(object) :
             self.tmvavararrays[form] = array(vtype.lower(), [0])
             self.reader.AddSpectator(form, self.tmvavararrays[form])
             self.treevars[form] = TreeFormula(form, form, inputtree)
+            self.formulae.append(form)
 
         self.reader.BookMVA(self.weightsvar, self.weightsfile)
 
@@ -53,6 +79,24 @@ class MVACalc(object) :
             self.tmvavararrays[key][0] = treeval()
         return self.reader.EvaluateMVA(self.weightsvar)
 
+    def calc_mva_array(self, values) :
+        '''Calculate the MVA variable for each row of 'values', a 2D array with the values of
+        the variables and spectators in the order given by self.formulae, eg, from
+        treeutils.tree_array(tree, mvacalc.formulae). Returns a numpy array of the MVA values.'''
+        values = numpy.ascontiguousarray(values, dtype = numpy.float64)
+        mvavals = numpy.zeros(len(values))
+        if len(values) == 0 :
+            return mvavals
+        if values.shape[1] != len(self.formulae) :
+            raise ValueError('Expected {0} values per row, got {1}'.format(len(self.formulae), values.shape[1]))
+        declare_cpp(_cppevaluate)
+        arrays = [self.tmvavararrays[form] for form in self.formulae]
+        addresses = numpy.array([arr.buffer_info()[0] for arr in arrays], dtype = numpy.int64)
+        isint = numpy.array([arr.typecode == 'i' for arr in arrays], dtype = numpy.int64)
+        ROOT.AnalysisUtils.evaluate_mva(self.reader, self.weightsvar, len(arrays), addresses, isint,
+                                        values, len(values), mvavals)
+        return mvavals
+
 def make_mva_tree(inputtree, weightsfile, weightsvar, outputtree, outputfile, maxentries = -1, branchname = None) :
     '''Make a TTree containing the MVA variable values for the given input tree.'''
     mvacalc = MVACalc(inputtree, weightsfile, weightsvar)
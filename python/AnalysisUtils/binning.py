@@ -1,34 +1,133 @@
-import ROOT
+import ROOT, numpy
 from math import exp, log
+from AnalysisUtils.makeroodataset import roodataset_arrays
+from AnalysisUtils.treeutils import tree_array_chunks
 
 def equal_stats_binning(nbins, seq, minval = None, maxval = None):
-    '''Get bins with equal statistics from the given sequence of floats.'''
-    # Could do this more efficiently with std::lower_bound
-    vals = sorted(seq)
+    '''Get bins with equal statistics from the given sequence of floats. Returns the bin edges
+    and a list of the sorted values in each bin. As the values in each bin are returned, this
+    sorts all the values; use quantile_edges if only the edges are needed.'''
+    vals = numpy.sort(numpy.fromiter(seq, dtype = numpy.float64))
     if minval == None:
-        minval = min(vals)
+        minval = vals.min()
     if maxval == None:
-        maxval = max(vals)
-    nperbin = int(len(vals)/float(nbins))
-    bins = [minval]
-    istart = -1
-    iend = nperbin
-    for i in xrange(1, nbins) :
-        istart = i-1
-        iend = i + nperbin
-        bins.append((vals[iend] + vals[iend+1])/2.)
-        vals[istart:iend] = [vals[istart:iend]]
-    vals[istart+1:] = [vals[istart+1:]]
-    bins.append(maxval)
-    return bins, vals
-
-def roo_equal_stats_binning(nbins, dataset, variable) :
-    '''Get bins in 'variable' with equal stats.'''
+        maxval = vals.max()
+    # Each bin but the last has nperbin+1 values.
+    nperbin = int(len(vals)/float(nbins)) + 1
+    ends = [i * nperbin for i in xrange(1, nbins)]
+    bins = [minval] + [(vals[iend] + vals[iend+1])/2. for iend in ends] + [maxval]
+    return bins, [chunk.tolist() for chunk in numpy.split(vals, ends)]
+
+def quantile_edges(nbins, values, weights = None, minval = None, maxval = None):
+    '''Get the edges of nbins bins with equal sums of weights (or numbers of entries if no
+    weights are given) from arrays of values and weights. Each inner edge is midway between the
+    values either side of it.'''
+    values = numpy.asarray(values, dtype = numpy.float64)
+    if minval == None:
+        minval = values.min()
+    if maxval == None:
+        maxval = values.max()
+    if weights is None:
+        # Only the values either side of the edges need to be in place, so partition rather than sort.
+        ends = [int(i * len(values) / float(nbins)) for i in xrange(1, nbins)]
+        kth = sorted(set(ends + [iend - 1 for iend in ends]))
+        part = numpy.partition(values, kth)
+        inner = [(part[iend - 1] + part[iend])/2. for iend in ends]
+    else:
+        order = numpy.argsort(values, kind = 'mergesort')
+        sortedvals = values[order]
+        cumweights = numpy.cumsum(numpy.asarray(weights, dtype = numpy.float64)[order])
+        targets = cumweights[-1] * numpy.arange(1, nbins) / float(nbins)
+        ends = numpy.minimum(numpy.searchsorted(cumweights, targets, side = 'right'), len(values) - 1)
+        ends = numpy.maximum(ends, 1)
+        inner = list((sortedvals[ends - 1] + sortedvals[ends])/2.)
+    return [minval] + inner + [maxval]
+
+class QuantileSketch(object):
+    '''Approximate weighted quantiles of a stream of values with bounded memory. Values are kept
+    as weighted centroids; when there are more than maxsize, neighbouring centroids are merged so
+    that each holds about 1/maxsize of the total weight. The minimum and maximum are kept exactly.'''
+
+    def __init__(self, maxsize = 10000):
+        '''maxsize : the maximum number of centroids kept.'''
+        self.maxsize = maxsize
+        self.values = numpy.zeros(0)
+        self.weights = numpy.zeros(0)
+        self.minval = None
+        self.maxval = None
+
+    def fill(self, values, weights = None):
+        '''Add arrays of values and, optionally, weights.'''
+        values = numpy.asarray(values, dtype = numpy.float64).ravel()
+        if len(values) == 0:
+            return
+        if weights is None:
+            weights = numpy.ones(len(values))
+        weights = numpy.asarray(weights, dtype = numpy.float64).ravel()
+        self.minval = values.min() if self.minval is None else min(self.minval, values.min())
+        self.maxval = values.max() if self.maxval is None else max(self.maxval, values.max())
+        values = numpy.append(self.values, values)
+        weights = numpy.append(self.weights, weights)
+        order = numpy.argsort(values, kind = 'mergesort')
+        self.values = values[order]
+        self.weights = weights[order]
+        if len(self.values) > self.maxsize:
+            self.compress()
+
+    def compress(self):
+        '''Merge the centroids into at most maxsize centroids of about equal weight.'''
+        cumweights = numpy.cumsum(self.weights)
+        total = cumweights[-1]
+        # Group by the cumulative weight at the middle of each centroid.
+        groups = numpy.minimum(((cumweights - self.weights/2.)/total * self.maxsize).astype(numpy.int64),
+                               self.maxsize - 1)
+        sumweights = numpy.bincount(groups, weights = self.weights, minlength = self.maxsize)
+        sumvalues = numpy.bincount(groups, weights = self.weights * self.values, minlength = self.maxsize)
+        used = sumweights != 0.
+        self.values = sumvalues[used]/sumweights[used]
+        self.weights = sumweights[used]
+
+    def quantiles(self, probs):
+        '''Get the approximate values at the given fractions of the total weight.'''
+        probs = numpy.asarray(probs, dtype = numpy.float64)
+        if len(self.values) == 0:
+            return numpy.full(probs.shape, numpy.nan)
+        cumweights = numpy.cumsum(self.weights) - self.weights/2.
+        points = numpy.concatenate([[0.], cumweights/numpy.sum(self.weights), [1.]])
+        values = numpy.concatenate([[self.minval], self.values, [self.maxval]])
+        return numpy.interp(probs, points, values)
+
+    def equal_stats_binning(self, nbins, minval = None, maxval = None):
+        '''Get the edges of nbins bins with approximately equal sums of weights.'''
+        if minval == None:
+            minval = self.minval
+        if maxval == None:
+            maxval = self.maxval
+        return [minval] + list(self.quantiles(numpy.arange(1, nbins)/float(nbins))) + [maxval]
+
+def tree_equal_stats_binning(nbins, tree, formula, weight = None, selection = None, minval = None,
+                             maxval = None, chunksize = 100000, maxsize = 10000):
+    '''Get bins with approximately equal statistics in the formula on the TTree (eg, a DataChain)
+    using a QuantileSketch, filled in chunks so that the values don't all need to be in memory.
+    'weight' is an optional formula for the weights.'''
+    sketch = QuantileSketch(maxsize)
+    formulae = [formula] + ([weight] if weight else [])
+    for entries, vals in tree_array_chunks(tree, formulae, selection = selection, chunksize = chunksize):
+        sketch.fill(vals[:, 0], vals[:, 1] if weight else None)
+    return sketch.equal_stats_binning(nbins, minval, maxval)
+
+def roo_equal_stats_binning(nbins, dataset, variable, weighted = False) :
+    '''Get bins in 'variable' with equal stats. Returns the bin edges and a list of the sorted values
+    in each bin (see equal_stats_binning). If weighted = True, the bins have equal sums of the
+    dataset's weights (see quantile_edges), and the list of values is None.'''
 
     if isinstance(variable, ROOT.TObject) :
         variable = variable.GetName()
-    return equal_stats_binning(nbins, (dataset.get(i)[variable].getVal() for i in xrange(dataset.numEntries())),
-                               dataset.get(0)[variable].getMin(), dataset.get(0)[variable].getMax())
+    values, weights = roodataset_arrays(dataset, [variable])
+    minval, maxval = dataset.get(0)[variable].getMin(), dataset.get(0)[variable].getMax()
+    if weighted :
+        return quantile_edges(nbins, values[:, 0], weights, minval, maxval), None
+    return equal_stats_binning(nbins, values[:, 0], minval, maxval)
 
 def exponential_binning(nbins, tmin, tmax, tau) :
     '''Get bins with exponentially increasing width.'''
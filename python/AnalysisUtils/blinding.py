@@ -1,7 +1,9 @@
 '''Tools for blinding datasets.'''
 
-import ROOT
-from AnalysisUtils.treeutils import TreeBranchAdder, search_branches, make_chain, tree_loop
+import ROOT, numpy, os
+from AnalysisUtils.treeutils import TreeBranchAdder, search_branches, make_chain, tree_loop, tree_entries, \
+    tree_array_instances, fill_tree_from_arrays, leaf_dtype
+from AnalysisUtils.parallel import parallel_map
 
 def generate_blinding_seed(seed = 0, seedmax = long(1e15)) :
     rndm = ROOT.TRandom3(seed)
@@ -15,6 +17,7 @@ class BlindingParameter(object) :
         self.__value = value
 
     def blind(self, val) :
+        '''Blind a value, or a numpy array of values.'''
         return val + self.__value
 
 class GaussBlindingParameter(BlindingParameter) :
@@ -79,6 +82,7 @@ class GaussScaleBlindingPar(GaussBlindingParameter) :
         super(GaussScaleBlindingPar, self).__init__(seed, mu, sigma, nsigmarange, verbose, maxattempts)
 
     def blind(self, value) :
+        '''Blind a value, or a numpy array of values.'''
         return (value - self.__offset) * self._BlindingParameter__value + self.__offset
 
     def __repr__(self) :
@@ -88,49 +92,119 @@ class GaussScaleBlindingPar(GaussBlindingParameter) :
                         self.verbose, self.maxattempts, self.__offset)
 
 
-def blind_tree(blindingpar, fout, tree, branches, selection = '', extraparsandbranches = {}) :
-    '''Blind branches in the given TTree with the given blinding scale and save the resulting TTree
-    to fout.
-    blindingpar: the BlindingParameter instance used to blind.
-    fout: the name of the output file.
-    tree: the TTree to be blinded.
-    branches: a list of the names of branches to be blinded.
-    selection: Selection to apply when copying the TTree for blinding.
-    extraparsandbranches: dict of blindingpar : [branches] for branches to blind with other parameters.'''
-
-    parsandbranches = dict(extraparsandbranches)
-    parsandbranches[blindingpar] = branches
-
+def _blind_tree(parsandbranches, fout, tree, selection, chunksize) :
+    '''Blind branches in a single TTree, see blind_tree.'''
     fout = ROOT.TFile.Open(fout, 'recreate')
     for par, branches in parsandbranches.items() :
         for branch in branches :
             tree.SetBranchStatus(branch, False)
     treeout = tree.CopyTree(selection)
-    branchadders = []
-    treebranches = []
+    blinded = []
+    lengthbuffers = {}
     for blindingpar, branches in parsandbranches.items() :
         for branch in branches :
             tree.SetBranchStatus(branch, True)
             br = tree.GetBranch(branch)
-            if not branch :
+            if not br :
                 raise ValueError("Couldn't find branch named {0} in TTree {1}!".format(branch, tree.GetName()))
-            treebranches.append(br)
-            leaf = tree.GetLeaf(branch)
-            branchadder = TreeBranchAdder\
-        .copy_branch(tree, branch, treeout,
-                     (lambda blindingpar, leaf : [blindingpar.blind(leaf.GetValue(k)) \
-                                                      for k in xrange(leaf.GetLen())]),
-                     filllength = False, args = (blindingpar, leaf))
-            branchadders.append(branchadder)
-    
-    for i in tree_loop(tree, selection) :
-        for branch in treebranches :
-            branch.GetEntry(i)
-        for adder in branchadders :
-            adder.set_value()
-            adder.fill()
+            branchadder = TreeBranchAdder.copy_branch(tree, branch, treeout, None, filllength = False)
+            # The length branches of variable length arrays were already filled by CopyTree, but
+            # need the length of each entry when the array branches are filled.
+            lenleaf = tree.GetLeaf(branch).GetLeafCount()
+            lenname = lenleaf.GetName() if lenleaf else None
+            if lenname and not lenname in lengthbuffers :
+                lengthbuffers[lenname] = numpy.zeros(1, dtype = leaf_dtype(lenleaf))
+                treeout.SetBranchAddress(lenname, lengthbuffers[lenname])
+            blinded.append((blindingpar, branch, branchadder, lenname))
+
+    entries = tree_entries(tree, selection)
+    for ifirst in xrange(0, len(entries), chunksize) :
+        chunk = entries[ifirst:ifirst + chunksize]
+        buffers = []
+        arrays = []
+        filledlengths = set()
+        for blindingpar, branch, adder, lenname in blinded :
+            values, lengths = tree_array_instances(tree, branch, len(adder.values), entries = chunk)
+            buffers.append(adder.values)
+            arrays.append(blindingpar.blind(values))
+            if lenname and not lenname in filledlengths :
+                buffers.append(lengthbuffers[lenname])
+                arrays.append(lengths)
+                filledlengths.add(lenname)
+        fill_tree_from_arrays(treeout, buffers, arrays, [adder.branch for blindingpar, branch, adder, lenname in blinded])
     treeout.Write()
     fout.Close()
+    return True
+
+def _file_chains(tree) :
+    '''Get a function returning a TTree for each file of the TChain, with the same aliases and friends,
+    for blinding the files in parallel. DataChains use get_subset. For other TChains, the aliases are
+    copied, and friends must be TChains of the same number of files, whose corresponding file is
+    added as a friend. Returns None if the friends can't be split like this.'''
+    if hasattr(tree, 'get_subset') :
+        return tree.get_subset
+    nfiles = tree.GetListOfFiles().GetEntries()
+    friends = list(tree.GetListOfFriends()) if tree.GetListOfFriends() else []
+    for friend in friends :
+        friendtree = friend.GetTree()
+        if not isinstance(friendtree, ROOT.TChain) or friendtree.GetListOfFiles().GetEntries() != nfiles :
+            return None
+    aliases = list(tree.GetListOfAliases()) if tree.GetListOfAliases() else []
+    def file_chain(ifile) :
+        elm = tree.GetListOfFiles().At(ifile)
+        chain = make_chain(elm.GetName(), elm.GetTitle())
+        for alias in aliases :
+            chain.SetAlias(alias.GetName(), alias.GetTitle())
+        for friend in friends :
+            friendelm = friend.GetTree().GetListOfFiles().At(ifile)
+            chain.AddFriend(make_chain(friendelm.GetName(), friendelm.GetTitle()), friend.GetName())
+        return chain
+    return file_chain
+
+def blind_tree(blindingpar, fout, tree, branches, selection = '', extraparsandbranches = {}, nthreads = 1,
+               chunksize = 100000) :
+    '''Blind branches in the given TTree with the given blinding scale and save the resulting TTree
+    to fout.
+    blindingpar: the BlindingParameter instance used to blind.
+    fout: the name of the output file.
+    tree: the TTree to be blinded.
+    branches: a list of the names of branches to be blinded.
+    selection: Selection to apply when copying the TTree for blinding.
+    extraparsandbranches: dict of blindingpar : [branches] for branches to blind with other parameters.
+    nthreads: if > 1 and the TTree is a TChain of several files, each file is blinded in parallel
+      then the outputs are merged. The aliases and friends of the TChain are used for each file
+      (see _file_chains), if this isn't possible the TTree is blinded serially.
+    chunksize: number of entries for which the branches are read and blinded at once.'''
+
+    parsandbranches = dict(extraparsandbranches)
+    parsandbranches[blindingpar] = branches
+
+    if nthreads <= 1 or not isinstance(tree, ROOT.TChain) or tree.GetListOfFiles().GetEntries() < 2 :
+        return _blind_tree(parsandbranches, fout, tree, selection, chunksize)
+    file_chain = _file_chains(tree)
+    if not file_chain :
+        print 'blind_tree: the friends of TChain {0!r} can\'t be split by file, so blinding it serially'\
+            .format(tree.GetName())
+        return _blind_tree(parsandbranches, fout, tree, selection, chunksize)
+
+    nfiles = tree.GetListOfFiles().GetEntries()
+    zfill = len(str(nfiles))
+    outputs = [fout + '.part' + str(i).zfill(zfill) + '.root' for i in xrange(nfiles)]
+    try :
+        parallel_map(lambda ifile, output : _blind_tree(parsandbranches, output, file_chain(ifile),
+                                                        selection, chunksize),
+                     list(enumerate(outputs)), nthreads = nthreads)
+        merger = ROOT.TFileMerger(False)
+        for output in outputs :
+            merger.AddFile(output)
+        merger.OutputFile(fout, 'recreate')
+        if not merger.Merge() :
+            raise OSError('Failed to merge blinded files into ' + fout)
+    finally :
+        for output in outputs :
+            if os.path.exists(output) :
+                os.remove(output)
+    return True
 
 def blind_tree_with_scale_main() :
     from argparse import ArgumentParser
@@ -157,6 +231,10 @@ def blind_tree_with_scale_main() :
     parser.add_argument('--extraparsandbranches', help = 'Dict of blindingpar : [branches] for other '
                         'branches to blind. It should be a string that can be passed to eval',
                         default = '{}')
+    parser.add_argument('--nthreads', default = 1, type = int,
+                        help = 'Number of processes used to blind the input files in parallel.')
+    parser.add_argument('--chunksize', default = 100000, type = int,
+                        help = 'Number of entries for which the branches are read and blinded at once.')
 
     args = parser.parse_args()
     par = GaussScaleBlindingPar(args.seed, args.mu, args.sigma, args.offset, args.nsigmarange, not args.quiet,
@@ -180,4 +258,5 @@ def blind_tree_with_scale_main() :
     if extraparsandbranches :
         print 'Also blinding:', extraparsandbranches
 
-    blind_tree(par, args.outputfile, intree, branches, args.selection, extraparsandbranches)
+    blind_tree(par, args.outputfile, intree, branches, args.selection, extraparsandbranches,
+               nthreads = args.nthreads, chunksize = args.chunksize)
@@ -1,5 +1,6 @@
-from AnalysisUtils.treeutils import TreePVector, get_unique_events, tree_loop
-import ROOT
+from AnalysisUtils.treeutils import TreePVector, get_unique_events, tree_loop, tree_array, fill_tree_from_arrays
+from AnalysisUtils.parallel import parallel_map
+import ROOT, numpy
 from array import array
 from ROOT import TLorentzVector
 
@@ -16,6 +17,23 @@ def get_pvectors(tree, parts, **kwargs) :
             pvecs[part].append(form.vector())
     return pvecs
 
+def get_pvector_arrays(tree, parts, selection = None, pform = '{partname}_P{comp}') :
+    '''Get the momentum vectors of the given particles from the TTree as a dict of arrays
+    of shape (number of entries, 4), with columns (E, px, py, pz), optionally only for entries
+    passing the selection (a string or a TEventList).'''
+    pvecs = {part : None for part in parts}
+    for part in pvecs :
+        pvecs[part] = tree_array(tree, [pform.format(partname = part, comp = comp) for comp in 'EXYZ'],
+                                 selection = selection)
+    return pvecs
+
+def offset_pvector_arrays(pvecs, offset) :
+    '''Get the arrays of pvectors from the given dict of arrays (from get_pvector_arrays)
+    from offset events, as offset_pvectors.'''
+    nevts = len(pvecs.values()[0])
+    indices = numpy.arange(nevts)
+    return {part : parr[(indices + (offset + 1) * j) % nevts] for j, (part, parr) in enumerate(pvecs.items())}
+
 def offset_pvectors(pvecs, offset) :
     '''Get sets of pvectors from the given dict of lists of p vectors (from get_pvectors)
     from offset events. The pvectors are selected using indices (i+(offset+1)*j) % nevts
@@ -28,12 +46,30 @@ def offset_pvectors(pvecs, offset) :
         yield _pvecs
     
 def total_mass(pvecs) :
-    '''Get the total mass from the dict of p vectors.'''
+    '''Get the total mass from the dict of p vectors. These can either be TLorentzVectors, or
+    arrays of (E, px, py, pz) (from get_pvector_arrays) in which case an array of masses
+    is returned. As for TLorentzVector.M(), the mass is negative if the mass squared is negative.'''
+    if isinstance(pvecs.values()[0], numpy.ndarray) :
+        pvec = numpy.zeros(pvecs.values()[0].shape)
+        for vec in pvecs.values() :
+            pvec += vec
+        mag2 = pvec[:, 0] * pvec[:, 0] - (pvec[:, 1] * pvec[:, 1] + pvec[:, 2] * pvec[:, 2] + pvec[:, 3] * pvec[:, 3])
+        return numpy.where(mag2 < 0., -numpy.sqrt(numpy.abs(mag2)), numpy.sqrt(numpy.abs(mag2)))
     pvec = TLorentzVector()
     for vec in pvecs.values() :
         pvec += vec
     return pvec.M()
 
+def combination_values(combination, pvecs) :
+    '''Get the array of values of a combination for the dict of arrays of p vectors. If the combination
+    isn't 'vectorised', its function is called with TLorentzVectors for each set of p vectors.'''
+    if combination.get('vectorised', False) :
+        return numpy.asarray(combination['function'](pvecs), dtype = numpy.float64)
+    function = combination['function']
+    nevts = len(pvecs.values()[0])
+    return numpy.array([function({part : TLorentzVector(parr[i, 1], parr[i, 2], parr[i, 3], parr[i, 0]) \
+                                      for part, parr in pvecs.items()}) for i in xrange(nevts)], dtype = numpy.float64)
+
 def wrong_event_masses(tree, outputfile, nbins, massvar, parts, **kwargs) :
     '''Calculate the mass of combinations of particles from different events. Unique
     events are selected using eventNumber and runNumber. Different branches can be used
@@ -42,7 +78,13 @@ def wrong_event_masses(tree, outputfile, nbins, massvar, parts, **kwargs) :
     iteration is run with an offset between events of 0. The pvectors are selected using
     indices (i+(offset+1)*j) % nevts where i = event index and j = particle index.
     Additional iterations can be run by passing a list of offsets using the 'offsets'
-    keyword.'''
+    keyword, or enough offsets to get 'targetstats' combinations in range. Extra combinations of
+    the particles' p vectors can be given as a dict with the 'combinations' keyword, with elements
+    name : {'function' : function, 'xmin' : xmin, 'xmax' : xmax}. If 'vectorised' : True is also
+    given, the function is passed a dict of arrays of (E, px, py, pz) for all events at once (see
+    get_pvector_arrays) and should return an array of values, otherwise it's passed a dict of
+    TLorentzVectors for each combination. The offsets are run in parallel using up to the number of
+    processes given by the 'nthreads' keyword (default 1).'''
 
     closefile = False
     if isinstance(outputfile, str) :
@@ -55,55 +97,63 @@ def wrong_event_masses(tree, outputfile, nbins, massvar, parts, **kwargs) :
     uniquelist = get_unique_events(tree, selection = kwargs.get('selection', None),
                                    checkbranches = kwargs.get('checkbranches', ('eventNumber', 'runNumber')))
     print 'Selected', uniquelist.GetN(), 'unique events from TTree', tree.GetName()
-    pvecs = get_pvectors(tree, parts, selection = uniquelist)
+    pvecs = get_pvector_arrays(tree, parts, selection = uniquelist)
 
     combinations = kwargs.get('combinations', {})
     if not 'totalmass' in combinations :
-        combinations['totalmass'] = {'function' : total_mass}
+        combinations['totalmass'] = {'function' : total_mass, 'vectorised' : True}
     combinations['totalmass'].update({'xmin' : massvar['xmin'],
                                       'xmax' : massvar['xmax']})
 
     histos = {name : ROOT.TH1F(name, '', nbins, vals['xmin'], vals['xmax']) for name, vals in combinations.items()}
 
     requireall = kwargs.get('requireall', True)
-    if requireall :
-        select = lambda vals : all(combinations[name]['xmin'] <= v and v <= combinations[name]['xmax'] \
-                                       for name, v in vals.items())
-    else :
-        select = lambda vals : any(combinations[name]['xmin'] <= v and v <= combinations[name]['xmax'] \
-                                       for name, v in vals.items())
 
     outtree = ROOT.TTree(kwargs.get('treename', 'wrongmasstree'), kwargs.get('treename', 'wrongmasstree'))
+    names = list(combinations)
     branches = {}
-    for name in combinations :
+    for name in names :
         brancharr = array('f', [0.])
         branch = outtree.Branch(name, brancharr, name + '/F')
         branches[name] = brancharr
     offsetarr = array('i', [0])
     outtree.Branch('offset', offsetarr, 'offset/I')
 
-    def run_offset(offset) :
-        offsetarr[0] = offset
-        for _pvecs in offset_pvectors(pvecs, offset) :
-            combvals = {name : vals['function'](_pvecs) for name, vals in combinations.items()}
-            if not select(combvals) :
-                continue
-            for name, v in combvals.items() :
-                branches[name][0] = v
-                histos[name].Fill(v)
-            outtree.Fill()
+    def offset_values(offset) :
+        '''Get the values of the combinations that pass the selection for an offset.'''
+        _pvecs = offset_pvector_arrays(pvecs, offset)
+        combvals = {name : combination_values(vals, _pvecs) for name, vals in combinations.items()}
+        inrange = [(combinations[name]['xmin'] <= v) & (v <= combinations[name]['xmax']) for name, v in combvals.items()]
+        if requireall :
+            select = numpy.logical_and.reduce(inrange)
+        else :
+            select = numpy.logical_or.reduce(inrange)
+        return {name : v[select] for name, v in combvals.items()}
+
+    def fill(offset, combvals) :
+        '''Fill the histos and TTree with the values for an offset.'''
+        nvals = len(combvals[names[0]])
+        if nvals == 0 :
+            return
+        for name, v in combvals.items() :
+            histos[name].FillN(nvals, v, numpy.ones(nvals))
+        fill_tree_from_arrays(outtree, [branches[name] for name in names] + [offsetarr],
+                              [combvals[name] for name in names] + [numpy.full(nvals, offset)])
 
     offsets = kwargs.get('offsets', range(1))
     if 'targetstats' in kwargs :
-        run_offset(0)
+        fill(0, offset_values(0))
         nper = histos['totalmass'].GetEntries()
         noff = int(kwargs['targetstats']/histos['totalmass'].GetEntries()) + 1
         offsets = range(1, noff)
         print 'Got', nper, 'entries from offset=0'
         print 'Will use', noff-1, 'more offsets to obtain', kwargs['targetstats'], 'entries'
 
-    for offset in offsets :
-        run_offset(offset)
+    # The combinations for each offset can be calculated in parallel, then the results are
+    # filled in order.
+    results = parallel_map(offset_values, [(offset,) for offset in offsets], nthreads = kwargs.get('nthreads', 1))
+    for offset, combvals in zip(offsets, results) :
+        fill(offset, combvals)
 
     for obj in [outtree,] + list(histos.values()) :
         obj.Write()
@@ -2,15 +2,18 @@
 
 from __future__ import print_function
 from AnalysisUtils.RooFit import RooFit
-import os, ROOT, pprint, cppyy, glob, re, multiprocessing, datetime, sys
-from AnalysisUtils.makeroodataset import make_roodataset, make_roodatahist
+import os, ROOT, pprint, cppyy, glob, re, multiprocessing, datetime, sys, time, random, hashlib, types
+import numpy
+from AnalysisUtils.makeroodataset import make_roodataset, make_roodatahist, roodataset_arrays, fill_histo
 from AnalysisUtils.treeutils import make_chain, set_prefix_aliases, check_formula_compiles, is_tfile_ok, copy_tree,\
-    TreeBranchAdder, tree_loop, TreeFormula, TreeFormulaList, tree_mean, tree_iter
+    TreeBranchAdder, fill_branch_adders, fill_tree_from_arrays, tree_array, tree_loop, TreeFormula, TreeFormulaList, tree_mean, tree_iter
 from array import array
 from copy import deepcopy
 from multiprocessing import Pool
 from AnalysisUtils.stringformula import NamedFormula, NamedFormulae, StringFormula
 from AnalysisUtils.datacache import DataCache
+from AnalysisUtils.parallel import parallel_map
+from AnalysisUtils.fit import cmdarg_key
 from AnalysisUtils.selection import AND, OR, product
 
 def _is_ok(tree, fout, selection):
@@ -42,6 +45,40 @@ def _parallel_filter(tree, ifile, iend, selection, outputdir, outputname, nthrea
                        fname = fout, write = True)
     return bool(cptree)
 
+def _code_key(code):
+    '''Get a key for a code object from its bytecode, names and constants (including nested code).'''
+    return (code.co_code, code.co_names,
+            tuple(_code_key(const) if isinstance(const, types.CodeType) else repr(const) for const in code.co_consts))
+
+def _value_key(val):
+    '''Get a key for a TreeBranchAdder argument. Functions are identified by their name and code, and
+    the values they close over or are bound to. Other values use their repr, so values whose repr isn't
+    fixed (eg, includes their address) give a different key each time.'''
+    if isinstance(val, types.MethodType):
+        return ('method', _value_key(val.im_func), repr(val.im_self))
+    if isinstance(val, types.FunctionType):
+        closure = []
+        for cell in val.func_closure or ():
+            try:
+                closure.append(_value_key(cell.cell_contents))
+            except ValueError:
+                closure.append(None)
+        return (val.__module__, val.__name__, _code_key(val.func_code), tuple(closure),
+                _value_key(val.func_defaults))
+    if isinstance(val, (list, tuple)):
+        return tuple(_value_key(v) for v in val)
+    if isinstance(val, dict):
+        return tuple(sorted((k, _value_key(v)) for k, v in val.items()))
+    return repr(val)
+
+def friend_config_key(treename, adderkwargs):
+    '''Get the md5 hash of the configuration of a friend tree written by DataChain.add_friend_tree:
+    the tree name and the arguments of the TreeBranchAdders, including their functions.'''
+    if isinstance(adderkwargs, dict):
+        adderkwargs = [dict(kwargs, name = name) for name, kwargs in adderkwargs.items()]
+    key = [treename] + sorted(_value_key(kwargs) for kwargs in adderkwargs)
+    return hashlib.md5(repr(key)).hexdigest()
+
 class DataChain(ROOT.TChain):
     '''Wrapper for TChain to add useful functionality, also makes sure that its file gets closed
     when it's deleted.'''
@@ -382,33 +419,101 @@ class DataChain(ROOT.TChain):
         friendlist.Remove(friendelm)
         return friend
 
+    def _write_friend_tree(self, fname, treename, adderkwargs, chunksize):
+        '''Write a friend tree to the given file using TreeBranchAdders. The configuration of the adders
+        (see friend_config_key) is saved in the file as a TNamed called 'FriendConfig'.'''
+        configkey = friend_config_key(treename, adderkwargs)
+        fout = ROOT.TFile.Open(fname, 'recreate')
+        treeout = ROOT.TTree(treename, treename)
+        if isinstance(adderkwargs, dict):
+            adders = [TreeBranchAdder(treeout, name = name, **kwargs) for name, kwargs in adderkwargs.items()]
+        else:
+            adders = [TreeBranchAdder(treeout, **kwargs) for kwargs in adderkwargs]
+        arraymode = [adder.columns is not None for adder in adders]
+        if all(arraymode):
+            fill_branch_adders(self, treeout, adders, chunksize = chunksize)
+        elif any(arraymode):
+            fout.Close()
+            raise ValueError('Can\'t mix TreeBranchAdders in array mode and entry mode!')
+        else:
+            for i in tree_loop(self):
+                for adder in adders:
+                    adder.set_value()
+                treeout.Fill()
+        treeout.Write()
+        ROOT.TNamed('FriendConfig', configkey).Write()
+        fout.Close()
+        return True
+
+    def is_friend_file_up_to_date(self, fname, ifile, configkey = None):
+        '''Check if the friend file for the file with index ifile is OK and newer than the file. If
+        configkey is given, the file must also have been written with the same configuration
+        (see friend_config_key).'''
+        if not (os.path.exists(fname) and is_tfile_ok(fname)
+                and os.path.getmtime(fname) >= os.path.getmtime(self.files[ifile])):
+            return False
+        if None == configkey:
+            return True
+        fin = ROOT.TFile.Open(fname)
+        config = fin.Get('FriendConfig')
+        uptodate = bool(config) and config.GetTitle() == configkey
+        fin.Close()
+        return uptodate
+
     def add_friend_tree(self, friendname, adderkwargs, treename = None, perfile = False,
-                        makedir = True, zfill = 4):
+                        makedir = True, zfill = 4, chunksize = 100000, overwrite = False,
+                        nthreads = multiprocessing.cpu_count()):
         '''Add a friend tree to the given dataset.
         friendname = name of the friend dataset
         adderkwargs = list or dict of dicts to be passed as arguments to TreeBranchAdder instances (excluding
           the tree argument)
         treename = name of the friend TTree (default friendname + 'Tree')
-        makedir & zfill are passed to frield_file_name.'''
+        makedir & zfill are passed to frield_file_name.
+        If all the adders are in array mode (with 'columns' given), the friend tree is filled in chunks
+        of chunksize entries (see treeutils.fill_branch_adders), otherwise it's filled entry by entry.
+        If perfile = True, one friend file is written per file of the dataset, using up to nthreads
+        processes in parallel. In this case the adders must be in array mode, so that they're evaluated
+        on each file rather than the whole dataset. Files whose friend file is newer than them and was
+        written with the same tree name and adder arguments (see friend_config_key) are skipped, unless
+        overwrite = True. Note that the values that the adders' functions close over or are bound to are
+        compared by their repr, and global variables they use aren't compared, so if these change
+        use overwrite = True. Friends with a different number of files to the dataset aren't available
+        per file, so a ValueError is raised if any of the columns fail to compile without them.'''
         # Remove the friend if it's currently in the friends list.
         self.remove_friend(friendname)
 
         if None == treename:
             treename = friendname + 'Tree'
-        fout = ROOT.TFile.Open(self.friend_file_name(friendname, treename,
-                                                     makedir = makedir, zfill = zfill), 'recreate')
-        treeout = ROOT.TTree(treename, treename)
-        if isinstance(adderkwargs, dict):
-            adders = [TreeBranchAdder(treeout, name = name, **kwargs) for name, kwargs in adderkwargs.items()]
-        else:
-            adders = [TreeBranchAdder(treeout, **kwargs) for kwargs in adderkwargs]
-        for i in tree_loop(self):
-            for adder in adders:
-                adder.set_value()
-            treeout.Fill()
-        treeout.Write()
-        fout.Close()
-        return True
+        if not perfile:
+            return self._write_friend_tree(self.friend_file_name(friendname, treename,
+                                                                 makedir = makedir, zfill = zfill),
+                                           treename, adderkwargs, chunksize)
+
+        adderlist = adderkwargs.values() if isinstance(adderkwargs, dict) else adderkwargs
+        if not all(kwargs.get('columns', None) for kwargs in adderlist):
+            raise ValueError('TreeBranchAdders must be in array mode (with \'columns\' given) to add friends per file!')
+        fnames = [self.friend_file_name(friendname, treename, ifile, makedir, zfill)
+                  for ifile in xrange(self.nfiles())]
+        configkey = friend_config_key(treename, adderkwargs)
+        ifiles = [ifile for ifile, fname in enumerate(fnames)
+                  if overwrite or not self.is_friend_file_up_to_date(fname, ifile, configkey)]
+        # Friends with a different number of files aren't available per file, so check that the
+        # columns don't need them before starting.
+        skipped = [name for name in self.get_ignorefriends_perfile([friendname], warning = False)
+                   if name != friendname]
+        if ifiles and skipped:
+            tree = self.get_subset(ifiles[0], ignorefriends = [friendname], ignoreperfile = True)
+            failed = [column for kwargs in adderlist for column in kwargs['columns']
+                      if not check_formula_compiles(column, tree)]
+            if failed:
+                raise ValueError('Columns {0!r} can\'t be evaluated per file for friend {1!r}, possibly as '
+                                 'they use friends {2!r} with a different number of files to {3!r}!'\
+                                     .format(failed, friendname, skipped, self.name))
+        print('Writing', len(ifiles), 'of', len(fnames), 'friend files for', friendname)
+        def write_file(ifile):
+            tree = self.get_subset(ifile, ignorefriends = [friendname])
+            return tree._write_friend_tree(fnames[ifile], treename, adderkwargs, chunksize)
+        return all(parallel_map(write_file, [(ifile,) for ifile in ifiles], nthreads = nthreads))
 
     def selected_file_name(self, makedir = False) :
         '''Get the name of the file containing the TTree of range and selection
@@ -416,6 +521,50 @@ class DataChain(ROOT.TChain):
         return self.friend_file_name('SelectedTree', 'SelectedTree',
                                      makedir = makedir)
 
+    def _write_friend_arrays(self, fname, treename, arrays, types, ifirst, iend):
+        '''Write a friend tree with branches filled from entries ifirst to iend of the arrays.'''
+        fout = ROOT.TFile.Open(fname, 'recreate')
+        treeout = ROOT.TTree(treename, treename)
+        adders = []
+        for name, vals in arrays.items():
+            length = 1 if vals.ndim == 1 else vals.shape[1]
+            adders.append(TreeBranchAdder(treeout, name, None, type = types.get(name, 'f'), length = length,
+                                          maxlength = length))
+        fill_tree_from_arrays(treeout, [adder.values for adder in adders],
+                              [vals[ifirst:iend] for vals in arrays.values()])
+        treeout.Write()
+        fout.Close()
+        return True
+
+    def add_friend_arrays(self, friendname, arrays, treename = None, types = {}, perfile = False,
+                          makedir = True, zfill = 4, nthreads = multiprocessing.cpu_count()):
+        '''Add a friend tree with branches filled from arrays with one row per entry of this dataset.
+        friendname = name of the friend dataset
+        arrays = dict of branch names and 1D or 2D numpy arrays of values
+        treename = name of the friend TTree (default friendname + 'Tree')
+        types = dict of branch names and types (default 'f')
+        If perfile = True, one friend file is written per file of the dataset, using up to nthreads
+        processes in parallel. makedir & zfill are passed to friend_file_name.'''
+        arrays = {name : numpy.asarray(vals) for name, vals in arrays.items()}
+        nentries = self.GetEntries()
+        for name, vals in arrays.items():
+            if len(vals) != nentries:
+                raise ValueError('Array for branch {0!r} has {1} entries, but dataset {2!r} has {3}!'\
+                                 .format(name, len(vals), self.name, nentries))
+        self.remove_friend(friendname)
+        if None == treename:
+            treename = friendname + 'Tree'
+        if not perfile:
+            return self._write_friend_arrays(self.friend_file_name(friendname, treename, makedir = makedir,
+                                                                   zfill = zfill),
+                                             treename, arrays, types, 0, nentries)
+        # The tree offsets are set once the number of entries is known.
+        offsets = [self.GetTreeOffset()[ifile] for ifile in xrange(self.nfiles())] + [nentries]
+        def write_file(ifile):
+            return self._write_friend_arrays(self.friend_file_name(friendname, treename, ifile, makedir, zfill),
+                                             treename, arrays, types, offsets[ifile], offsets[ifile+1])
+        return all(parallel_map(write_file, [(ifile,) for ifile in xrange(self.nfiles())], nthreads = nthreads))
+
     def check_consistency(self):
         '''Check that all files exist, are unique, contain the required TTree, and all the TTrees have 
         the same branches.'''
@@ -576,6 +725,18 @@ class DataChain(ROOT.TChain):
         dsname = cache.args[0].dataset_name()
         return getattr(cache, dsname)
 
+    def dataset_entries(self, update = False, suffix = '', **kwargs):
+        '''Get the array of the entry numbers of this dataset that are in the RooDataSet (from get_dataset
+        with the same arguments), using the SelectedTree written when the RooDataSet is made.'''
+        cache = self.dataset_cache(update, suffix, **kwargs)
+        # Make sure the RooDataSet and SelectedTree have been made.
+        getattr(cache, cache.args[0].dataset_name())
+        fselected = ROOT.TFile.Open(cache.args[0].selected_file_name())
+        selectedtree = fselected.Get('SelectedTree')
+        passed = tree_array(selectedtree, ['inrange_all && selection_pass'])[:, 0]
+        fselected.Close()
+        return numpy.flatnonzero(passed)
+
     def GetListOfAliases(self):
         '''Override GetListOfAliases and set ROOT.kMustCleanup = False on the list (otherwise python
         tries to delete it).'''
@@ -832,8 +993,9 @@ class DataChain(ROOT.TChain):
             return self.get_functor('selection', self.selection)
         return lambda : 1.
 
-    def get_functor_list(self, variables):
-        '''Get a TreeFormulaList for the given variables.'''
+    def variable_formulae(self, variables):
+        '''Get the formulae to use for the given variables: the names of known variables (which are
+        aliases) or else the variables themselves.'''
         _vars = []
         for var in variables:
             var = self.variables.get_var(var)
@@ -841,7 +1003,11 @@ class DataChain(ROOT.TChain):
                 _vars.append(var.name)
             except AttributeError:
                 _vars.append(var)
-        return TreeFormulaList(self, *_vars)
+        return _vars
+
+    def get_functor_list(self, variables):
+        '''Get a TreeFormulaList for the given variables.'''
+        return TreeFormulaList(self, *self.variable_formulae(variables))
 
     def add_weight(self, weight):
         '''Append a weight to the selection.'''
@@ -947,16 +1113,19 @@ class DataLibrary(object) :
         return self.get_data(dataname, build = False).friend_file_name(friendname, treename, number, makedir, zfill)
 
     def add_friend_tree(self, dataname, friendname, adderkwargs, 
-                        tree = None, treename = None, perfile = False, makedir = True, zfill = 4):
+                        tree = None, treename = None, perfile = False, makedir = True, zfill = 4,
+                        chunksize = 100000, overwrite = False, nthreads = multiprocessing.cpu_count()):
         '''Add a friend tree to the given dataset.
         friendname = name of the friend dataset
         adderkwargs = list of dicts to be passed as arguments to TreeBranchAdder instances (excluding
           the tree argument)
         treename = name of the friend TTree (default friendname + 'Tree')
-        makedir & zfill are passed to frield_file_name.'''
+        makedir & zfill are passed to frield_file_name. The other arguments are as for
+        DataChain.add_friend_tree.'''
         if None == tree:
             tree = self.get_data(dataname)
-        tree.add_friend_tree(friendname, adderkwargs, treename, perfile, makedir, zfill)
+        return tree.add_friend_tree(friendname, adderkwargs, treename, perfile, makedir, zfill, chunksize,
+                                    overwrite, nthreads)
 
     def selected_file_name(self, dataname, makedir = False) :
         '''Get the name of the file containing the TTree of range and selection
@@ -1120,12 +1289,15 @@ class BinnedFitData(object) :
         self.bins2 = bins2
         self.selections = {}
         self.catvals = {}
+        # Bin names for each tuple of bin indices.
+        self.binindices = {}
         if not binvariable2 :
             zlen = len(str(len(self.bins)-1))
             for ibin, (binmin, binmax) in enumerate(zip(self.bins[:-1], self.bins[1:])) :
                 binname = name + '_bin_' + str(ibin).zfill(zlen)
                 self.selections[binname] = {binvariable.GetName() : (binmin, binmax)}
                 self.catvals[binname] = name + '_bin' + str(ibin).zfill(zlen)
+                self.binindices[(ibin,)] = binname
         else :
             nbins = len(self.bins)-1
             nbins2 = len(self.bins2)-1
@@ -1139,10 +1311,13 @@ class BinnedFitData(object) :
                     self.selections[binname] = {binvariable.GetName() : (binmin, binmax),
                                                 binvariable2.GetName() : (binmin2, binmax2)}
                     self.catvals[binname] = name + '_bin' + str(ibin * nbins2 + ibin2).zfill(zlencat)
+                    self.binindices[(ibin, ibin2)] = binname
         self.binvar = None
         self.datasets = {}
         self.meanvals = {}
         self.datahist = None
+        self.fitresults = {}
+        self.fittimes = {}
 
         #print(self.selections)
 
@@ -1160,29 +1335,51 @@ class BinnedFitData(object) :
         histmap = cppyy.makeClass('std::map<std::string, RooDataHist*>')()
         Histpair = cppyy.makeClass('pair<const string,RooDataHist*>')
 
+        # Assign each entry to a bin, then fill the histos and sum the bin variables for all bins
+        # from the dataset's arrays.
+        binvariables = [self.binvariable.GetName()]
+        binedges = [self.bins]
+        if self.binvariable2 :
+            binvariables.append(self.binvariable2.GetName())
+            binedges.append(self.bins2)
+        values, weights = roodataset_arrays(self.roodata, [self.variable.GetName()] + binvariables)
+        ibins = numpy.zeros(len(values), dtype = numpy.int64)
+        inbins = numpy.ones(len(values), dtype = bool)
+        for ivar, edges in enumerate(binedges) :
+            ivarbins = numpy.searchsorted(numpy.asarray(edges, dtype = numpy.float64), values[:, ivar + 1],
+                                          side = 'right') - 1
+            inbins &= (ivarbins >= 0) & (ivarbins < len(edges) - 1)
+            ibins = ibins * (len(edges) - 1) + ivarbins
+        # Sort the entries by bin, keeping them in order within each bin.
+        ibins[~inbins] = -1
+        binorder = numpy.argsort(ibins, kind = 'mergesort')
+        sortedbins = ibins[binorder]
+        histos = {}
+        sums = {}
+        sumweights = {}
+        nbins2 = len(self.bins2) - 1 if self.binvariable2 else 1
+        for binindices, binname in self.binindices.items() :
+            ibin = binindices[0] * nbins2 + (binindices[1] if len(binindices) > 1 else 0)
+            start, end = numpy.searchsorted(sortedbins, [ibin, ibin + 1])
+            binentries = binorder[start:end]
+            binweights = weights[binentries]
+            histos[binname] = fill_histo(ROOT.TH1F(binname + '_histo', '', self.nbinsx, self.xmin, self.xmax),
+                                         values[binentries, 0], binweights)
+            sums[binname] = [numpy.sum(values[binentries, ivar + 1] * binweights)
+                             for ivar in xrange(len(binvariables))]
+            sumweights[binname] = numpy.sum(binweights)
+
         for binname, selection in self.selections.items() :
             # Make the dataset for the bin.
             catval = self.catvals[binname]
-            datahist = make_roodatahist(binname, self.roodata, self.variable, selection = selection,
-                                        nbins = self.nbinsx, xmin = self.xmin, xmax = self.xmax)
+            datahist = ROOT.RooDataHist(binname, binname, ROOT.RooArgList(self.variable), histos[binname])
             datahist.Write()
             self.datasets[binname] = datahist
             histmap.insert(Histpair(catval, datahist))
 
-            # Calculate the mean values of the bin variables for the bin.
-            meanvals = {name : 0. for name in selection}
-            n = 0
-            for i in xrange(self.roodata.numEntries()) :
-                args = self.roodata.get(i)
-                if not all(cut[0] <= args[name].getVal() < cut[1] for name, cut in selection.items()) :
-                    continue
-                weight = self.roodata.weight()
-                for name in selection :
-                    meanvals[name] += args[name].getVal() * weight
-                n += weight
-            if n > 0 :
-                for name in selection :
-                    meanvals[name] /= n
+            # The mean values of the bin variables for the bin.
+            n = sumweights[binname]
+            meanvals = {name : float(binsum / n if n > 0 else binsum) for name, binsum in zip(binvariables, sums[binname])}
             self.meanvals[binname] = meanvals
         self.datahist = ROOT.RooDataHist(self.name, self.name, ROOT.RooArgList(self.variable),
                                          self.binvar, histmap)
@@ -1222,6 +1419,78 @@ class BinnedFitData(object) :
         '''Get the sorted list of bin names.'''
         return sorted(self.catvals.keys())
 
+    def fits_file_name(self) :
+        '''Get the name of the file to save the per-bin fit results to.'''
+        return os.path.join(os.path.dirname(self.outputfname), self.name + '_BinFits.root')
+
+    def fit_bin(self, binname, workspacefile, workspacename, pdfname, fitopts = (), seed = 0) :
+        '''Fit the PDF of the given name, loaded from the RooWorkspace in workspacefile, to the RooDataHist
+        for the bin. The random seed is set before the fit. Returns the RooFitResult and the time taken.'''
+        fws = ROOT.TFile.Open(workspacefile)
+        workspace = fws.Get(workspacename)
+        fws.Close()
+        if not workspace :
+            raise ValueError('File {0!r} doesn\'t contain a workspace called {1!r}!'.format(workspacefile,
+                                                                                           workspacename))
+        pdf = workspace.pdf(pdfname)
+        if not pdf :
+            raise ValueError('Workspace {0!r} doesn\'t contain a PDF called {1!r}!'.format(workspacename, pdfname))
+        ROOT.RooRandom.randomGenerator().SetSeed(seed)
+        start = time.time()
+        result = pdf.fitTo(self.datasets[binname], RooFit.Save(True), *fitopts)
+        return result, time.time() - start
+
+    def fit_bins(self, workspacefile, workspacename, pdfnames, fitopts = (), nthreads = multiprocessing.cpu_count(),
+                 seed = 0, update = False) :
+        '''Fit each bin independently, using up to nthreads processes in parallel. Each process loads the PDF
+        from the RooWorkspace in workspacefile, so it should be saved there first (eg, by deleting the
+        Workspace instance). pdfnames is either a dict of bin names or category values and PDF names, or the
+        name of the PDF to use for all bins. The bins are fitted in an order shuffled using the seed, and the
+        random seed for the fit in each bin is seed + the bin's index in bin_names(), so the results are
+        repeatable. The results are saved to fits_file_name() and retrieved from there if the arguments are
+        the same, unless update = True. Returns dicts of the RooFitResults and the fit times for each bin.'''
+        if not self.datasets :
+            self.get()
+        binnames = self.bin_names()
+        if isinstance(pdfnames, str) :
+            pdfnames = {binname : pdfnames for binname in binnames}
+        catbins = {catval : binname for binname, catval in self.catvals.items()}
+        pdfnames = {catbins.get(name, name) : pdfname for name, pdfname in pdfnames.items()}
+        config = repr((os.path.abspath(workspacefile), workspacename, sorted(pdfnames.items()),
+                       [cmdarg_key(opt) for opt in fitopts], seed))
+        fname = self.fits_file_name()
+
+        if not update and is_tfile_ok(fname) :
+            fin = ROOT.TFile.Open(fname)
+            fconfig = fin.Get('config')
+            if fconfig and fconfig.GetTitle() == config :
+                results = {binname : fin.Get(binname + '_fitresult') for binname in pdfnames}
+                times = eval(fin.Get('fittimes').GetTitle())
+                fin.Close()
+                if all(results.values()) :
+                    self.fitresults, self.fittimes = results, times
+                    return results, times
+            else :
+                fin.Close()
+
+        order = [binname for binname in binnames if binname in pdfnames]
+        random.Random(seed).shuffle(order)
+        def fit(binname) :
+            return self.fit_bin(binname, workspacefile, workspacename, pdfnames[binname], fitopts,
+                                seed + binnames.index(binname))
+        fits = parallel_map(fit, [(binname,) for binname in order], nthreads = nthreads)
+        results = {binname : result for binname, (result, fittime) in zip(order, fits)}
+        times = {binname : fittime for binname, (result, fittime) in zip(order, fits)}
+
+        fout = ROOT.TFile.Open(fname, 'recreate')
+        for binname, result in results.items() :
+            result.Write(binname + '_fitresult')
+        ROOT.TNamed('fittimes', repr(times)).Write()
+        ROOT.TNamed('config', config).Write()
+        fout.Close()
+        self.fitresults, self.fittimes = results, times
+        return results, times
+
     def make_roosimultaneous(self, pdfs, pref = '') :
         '''Make a RooSimultaneous in the bin category variable and add the given PDFs. 'pdfs' should be a dict
         with keys the category names (as given by categories() or bin_names()) and values the PDFs for each category value.'''
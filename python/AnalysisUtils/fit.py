@@ -1,6 +1,9 @@
 from AnalysisUtils.RooFit import RooFit
-import ROOT
-from AnalysisUtils.treeutils import random_string, TreeFormula, TreeBranchAdder, tree_loop
+import ROOT, numpy, multiprocessing, hashlib, os
+from AnalysisUtils.treeutils import random_string, TreeFormula, TreeBranchAdder, tree_loop, tree_array_chunks
+from AnalysisUtils.makeroodataset import roodataset_arrays
+from AnalysisUtils.workspace import to_list
+from AnalysisUtils.datacache import DataCache
 
 def multi_gauss(workspace, name, variable, mean, sigmas, sigmamax, sigmaerror = 0.5,
                 fracerror = 0.05, meanwindow = 100., meanerror = 1.) :
@@ -119,11 +122,30 @@ def sideband_subtraction_weight(pdf, variable, signalmin, signalmax, bkgmin, bkg
     bkgint = sum(integral(pdf, variable, xmin, xmax) for xmin, xmax in bkgints)
     return -signalint/bkgint
 
+def sideband_subtraction_weights(values, selected, signalints, bkgints, sidebandweight) :
+    '''Get the array of sideband subtraction weights for arrays of variable values and whether
+    they pass the selection: 1 in the signal intervals, sidebandweight in the background intervals,
+    and 0 otherwise.'''
+    def in_intervals(intervals) :
+        inints = numpy.zeros(len(values), dtype = bool)
+        for xmin, xmax in intervals :
+            inints |= (xmin <= values) & (values < xmax)
+        return inints
+    insig = selected & in_intervals(signalints)
+    inbkg = selected & ~insig & in_intervals(bkgints)
+    return numpy.where(insig, 1., numpy.where(inbkg, sidebandweight, 0.))
+
 def add_sideband_subtraction_weights(datalib, datasetname, treename, branchname,
                                      pdf, variable, signalmin, signalmax, bkgmin, bkgmax,
                                      extrabkgints = (), extrasigints = (),
-                                     datasetsel = 'inrange_all && selection_pass') :
-    '''Add sideband subtraction weights to a dataset using the given PDF, variable and ranges.'''
+                                     datasetsel = 'inrange_all && selection_pass',
+                                     perfile = False, nthreads = multiprocessing.cpu_count(),
+                                     chunksize = 100000) :
+    '''Add sideband subtraction weights to a dataset using the given PDF, variable and ranges.
+    The weights are calculated over the whole dataset, read in chunks of chunksize entries, so
+    datasetsel can use friends with a different number of files, such as the SelectedTree. If
+    perfile = True, one friend file is written per file of the dataset, using up to nthreads
+    processes in parallel (see DataChain.add_friend_arrays).'''
 
     signalints = [(signalmin, signalmax)] + list(extrasigints)
     bkgints = [(bkgmin, bkgmax)] + list(extrabkgints)
@@ -132,29 +154,169 @@ def add_sideband_subtraction_weights(datalib, datasetname, treename, branchname,
                                                  extrabkgints, extrasigints)
 
     tree = datalib.get_data(datasetname)
-    treevar = TreeFormula(variable.GetName(), variable.GetName(), tree)
-    selvar = TreeFormula('sel_' + random_string(), datasetsel, tree)
-    
-    foutname = datalib.friend_file_name(datasetname, treename, treename, makedir = True)
-    fout = ROOT.TFile.Open(foutname, 'recreate')
-    treeout = ROOT.TTree(treename, treename)
-    weight = 0.
-    weightbranch = TreeBranchAdder(treeout, branchname, lambda : [weight])
-    
-    for i in tree_loop(tree) :
-        val = treevar()
-        if not selvar() :
-            weight = 0.
-        elif any(xmin <= val < xmax for xmin, xmax in signalints) :
-            weight = 1.
-        elif any(xmin <= val < xmax for xmin, xmax in bkgints) :
-            weight = sidebandweight
-        else :
-            weight = 0.
-        weightbranch.set_value()
-        treeout.Fill()
-    treeout.Write()
-    fout.Close()
+    weights = numpy.zeros(tree.GetEntries())
+    for entries, colvals in tree_array_chunks(tree, [variable.GetName(), datasetsel], chunksize = chunksize) :
+        weights[entries] = sideband_subtraction_weights(colvals[:, 0], colvals[:, 1] != 0., signalints, bkgints,
+                                                        sidebandweight)
+    # The weights depend on the PDF, so existing files are always overwritten.
+    return tree.add_friend_arrays(treename, {branchname : weights}, treename = treename, perfile = perfile,
+                                  nthreads = nthreads)
+
+def splot_weights(dataset, pdf, yields, fitopts = ()) :
+    '''Fit the extended PDF to the dataset and calculate sWeights for the given yields (RooRealVars or
+    their names) with RooStats.SPlot. The dataset isn't modified. Returns a dict of arrays of the
+    sWeights for each entry in the dataset, with keys the yield names + '_sw'.'''
+    yieldlist = ROOT.RooArgList()
+    for yieldvar in yields :
+        if isinstance(yieldvar, str) :
+            name = yieldvar
+            yieldvar = pdf.getVariables().find(name)
+            if not yieldvar :
+                raise ValueError('PDF {0!r} has no yield {1!r}!'.format(pdf.GetName(), name))
+        yieldlist.add(yieldvar)
+    dataset = ROOT.RooDataSet(dataset, dataset.GetName() + '_splot')
+    pdf.fitTo(dataset, RooFit.Extended(True), *fitopts)
+    splot = ROOT.RooStats.SPlot(dataset.GetName(), dataset.GetTitle(), dataset, pdf, yieldlist)
+    names = [yieldvar.GetName() + '_sw' for yieldvar in yieldlist]
+    values, weights = roodataset_arrays(dataset, names)
+    return {name : values[:, i] for i, name in enumerate(names)}
+
+def add_splot_weights(tree, pdf, yields, friendname = 'sWeights', fitopts = (), perfile = False,
+                      nthreads = multiprocessing.cpu_count(), datasetkwargs = {}) :
+    '''Calculate sWeights for the RooDataSet of the DataChain 'tree' (from get_dataset, using
+    datasetkwargs) using splot_weights, and add them as a friend to the tree, with branches named
+    as the yields + '_sw'. Entries that aren't in the RooDataSet have zero weight. perfile and nthreads
+    are passed to DataChain.add_friend_arrays.'''
+    dataset = tree.get_dataset(**datasetkwargs)
+    entries = tree.dataset_entries(**datasetkwargs)
+    if len(entries) != dataset.numEntries() :
+        raise ValueError('{0} entries of {1!r} pass the selection, but its RooDataSet has {2}!'\
+                         .format(len(entries), tree.name, dataset.numEntries()))
+    sweights = splot_weights(dataset, pdf, yields, fitopts)
+    nentries = tree.GetEntries()
+    arrays = {}
+    for name, vals in sweights.items() :
+        arrays[name] = numpy.zeros(nentries)
+        arrays[name][entries] = vals
+    return tree.add_friend_arrays(friendname, arrays, perfile = perfile, nthreads = nthreads)
+
+def cmdarg_key(cmdarg) :
+    '''Get a tuple identifying a RooCmdArg by its name and values (not the objects it holds, except by name).'''
+    objs = tuple(cmdarg.getObject(i).GetName() if cmdarg.getObject(i) else None for i in xrange(2))
+    return (cmdarg.GetName(), cmdarg.getInt(0), cmdarg.getInt(1), cmdarg.getDouble(0), cmdarg.getDouble(1),
+            tuple(cmdarg.getString(i) for i in xrange(3)), objs)
+
+def _print_args(arg) :
+    '''Get the output of RooAbsArg::printArgs: the servers of the arg with their roles (eg, mean or sigma)
+    and any other arguments, such as formula expressions.'''
+    stream = ROOT.std.stringstream()
+    arg.printArgs(stream)
+    return stream.str()
+
+def _server_names(arg) :
+    '''Get the names of the servers of a RooAbsArg, in order.'''
+    iterator = arg.serverIterator()
+    names = []
+    server = iterator.Next()
+    while server :
+        names.append(server.GetName())
+        server = iterator.Next()
+    return tuple(names)
+
+def pdf_key(pdf, data) :
+    '''Get a canonical description of the structure of the PDF, its observables in the data and
+    the values, ranges and constness of its parameters. Each component is described by its name,
+    class and title, its servers and their roles, and any formula expressions (see _print_args),
+    and the order of its servers (eg, which coefficient goes with which PDF in a RooAddPdf).'''
+    components = sorted((comp.GetName(), comp.ClassName(), comp.GetTitle(), _print_args(comp),
+                         _server_names(comp))
+                        for comp in to_list(pdf.getComponents()))
+    def var_key(var) :
+        if isinstance(var, ROOT.RooRealVar) :
+            return (var.GetName(), var.ClassName(), repr(var.getVal()), repr(var.getMin()), repr(var.getMax()),
+                    var.isConstant())
+        return (var.GetName(), var.ClassName(), repr(var.getVal()), var.isConstant())
+    observables = sorted(var_key(var) for var in to_list(pdf.getObservables(data)))
+    parameters = sorted(var_key(var) for var in to_list(pdf.getParameters(data)))
+    return (components, observables, parameters)
+
+def data_fingerprint(data, observables) :
+    '''Get an md5 hash of the values of the observables (names or RooAbsArgs) and the weights of
+    a RooDataSet or RooDataHist.'''
+    values, weights = roodataset_arrays(data, observables)
+    md5 = hashlib.md5()
+    md5.update(numpy.ascontiguousarray(values).tostring())
+    md5.update(numpy.ascontiguousarray(weights).tostring())
+    return md5.hexdigest()
+
+def fit_key(pdf, data, constraints = (), fitopts = ()) :
+    '''Get an md5 hash identifying a fit of the PDF to the data, with the given constraint PDFs and
+    fit options (RooCmdArgs).'''
+    observables = sorted(var.GetName() for var in to_list(pdf.getObservables(data)))
+    key = (pdf_key(pdf, data), data.numEntries(), data_fingerprint(data, observables),
+           sorted(pdf_key(constraint, data) for constraint in constraints),
+           [cmdarg_key(opt) for opt in fitopts])
+    return hashlib.md5(repr(key)).hexdigest()
+
+def _fit_cache_name(pdf, key) :
+    '''Get the name of the fit cache for the PDF with the given fit key.'''
+    return 'FitCache_' + pdf.GetName() + '_' + key
+
+def _fit_link_file_name(pdf, key, cachedir) :
+    '''Get the name of the file that links a fit key to the key of another fit cache (see cached_fit).'''
+    return os.path.join(cachedir, _fit_cache_name(pdf, key) + '.link')
+
+def fit_cache(pdf, data, cachedir, constraints = (), fitopts = (), name = None, **kwargs) :
+    '''Get a DataCache for a fit of the PDF to the data (see cached_fit). It's stored in cachedir in a file
+    named by the fit_key, so it's found again if the PDF, its initial parameter values, the constraints,
+    the data and the fit options are the same. If the key is linked to another fit's key, because the
+    initial values are the post-fit values of that fit (see cached_fit), that fit's cache is used.
+    The cache has the RooFitResult as 'result' and a dict of the post-fit (value, error) of each
+    parameter as 'paramvalues'. kwargs are passed to the DataCache constructor.'''
+    key = fit_key(pdf, data, constraints, fitopts)
+    linkname = _fit_link_file_name(pdf, key, cachedir)
+    if os.path.exists(linkname) :
+        with open(linkname) as flink :
+            key = flink.read().strip()
+    if not name :
+        name = _fit_cache_name(pdf, key)
+    if not os.path.exists(cachedir) :
+        os.makedirs(cachedir)
+    def fit_pdf(key) :
+        opts = [RooFit.Save(True)] + list(fitopts)
+        if constraints :
+            constraintset = ROOT.RooArgSet()
+            for constraint in constraints :
+                constraintset.add(constraint)
+            opts.append(RooFit.ExternalConstraints(constraintset))
+        result = pdf.fitTo(data, *opts)
+        paramvalues = {var.GetName() : (var.getVal(), var.getError()) for var in to_list(pdf.getParameters(data))
+                       if isinstance(var, ROOT.RooRealVar)}
+        return {'result' : result, 'paramvalues' : paramvalues}
+    kwargs['args'] = (key,)
+    return DataCache(name, os.path.join(cachedir, name + '.root'), ['result', 'paramvalues'], fit_pdf, **kwargs)
+
+def cached_fit(pdf, data, cachedir, constraints = (), fitopts = (), update = False) :
+    '''Fit the PDF to the data, or retrieve the result of the same fit from the cache in cachedir, and set the
+    PDF's parameters to their post-fit values and errors. Returns the RooFitResult.
+    As the post-fit values are set, if they're then saved (eg, in a Workspace) the next fit starts from them,
+    which gives a different fit_key. So the key with the post-fit values is linked to the cache of this
+    fit, and fitting again from them uses the same cache, assuming it'd converge to the same minimum.
+    Use update = True to refit.'''
+    cache = fit_cache(pdf, data, cachedir, constraints, fitopts, update = update)
+    result = cache.result
+    params = pdf.getParameters(data)
+    for name, (val, error) in cache.paramvalues.items() :
+        var = params.find(name)
+        if var :
+            var.setVal(val)
+            var.setError(error)
+    cachekey = cache.args[0]
+    postfitkey = fit_key(pdf, data, constraints, fitopts)
+    if postfitkey != cachekey :
+        with open(_fit_link_file_name(pdf, postfitkey, cachedir), 'w') as flink :
+            flink.write(cachekey + '\n')
+    return result
 
 def normalised_exp_TF1(name, xmin, xmax, ncand = None, mean = None):
     '''Get a TF1 of a normalised expo with parameters for the number of canidates and the mean.'''
@@ -3,10 +3,81 @@
 '''Functionality needed to make a RooDataSet from a TTree.'''
 
 from AnalysisUtils.RooFit import RooFit
-import ROOT
-from AnalysisUtils.treeutils import TreeFormula, make_chain, TreeBranchAdder
+import ROOT, numpy
+from AnalysisUtils.treeutils import TreeFormula, make_chain, TreeBranchAdder, declare_cpp
 from AnalysisUtils.stringformula import NamedFormula
 
+# C++ loop to copy the values of variables and the weights from a RooAbsData. RooAbsData::get(i)
+# loads entry i into the same RooArgSet, so the variables only need to be found once. This works
+# for any data store.
+_cppdatasetvalues = r'''
+#include "RooAbsData.h"
+#include "RooArgSet.h"
+#include "RooAbsReal.h"
+#include "RooAbsCategory.h"
+#include <vector>
+#include <string>
+
+namespace AnalysisUtils {
+  // Fill 'out' row-wise with nentries x nvariables values, and 'weights' with the weight of each
+  // entry. Returns the number of entries, or -1 - the index of a variable that isn't found.
+  Long64_t roodataset_values(RooAbsData* data, const std::vector<std::string>& names, double* out,
+                             double* weights) {
+    const RooArgSet* args = data->get();
+    const size_t nvars = names.size();
+    std::vector<RooAbsReal*> reals(nvars, 0);
+    std::vector<RooAbsCategory*> cats(nvars, 0);
+    for (size_t j = 0; j < nvars; ++j) {
+      RooAbsArg* arg = args->find(names[j].c_str());
+      reals[j] = dynamic_cast<RooAbsReal*>(arg);
+      cats[j] = dynamic_cast<RooAbsCategory*>(arg);
+      if (!reals[j] && !cats[j])
+        return -1 - Long64_t(j);
+    }
+    const Long64_t nentries = data->numEntries();
+    for (Long64_t i = 0; i < nentries; ++i) {
+      data->get(i);
+      for (size_t j = 0; j < nvars; ++j)
+        out[i * nvars + j] = reals[j] ? reals[j]->getVal() : cats[j]->getIndex();
+      weights[i] = data->weight();
+    }
+    return nentries;
+  }
+}
+'''
+
+def roodataset_arrays(roodata, variables) :
+    '''Get the values of the variables (names or RooAbsArgs) for each entry of the RooDataSet (or
+    RooDataHist) as a 2D numpy array with one column per variable, and the array of the weights.'''
+    declare_cpp(_cppdatasetvalues)
+    names = ROOT.std.vector('string')()
+    for var in variables :
+        names.push_back(var if isinstance(var, str) else var.GetName())
+    values = numpy.zeros((roodata.numEntries(), len(names)))
+    weights = numpy.zeros(roodata.numEntries())
+    result = ROOT.AnalysisUtils.roodataset_values(roodata, names, values, weights)
+    if result < 0 :
+        raise ValueError('Dataset {0!r} doesn\'t contain variable {1!r}!'.format(roodata.GetName(),
+                                                                                 names[-1 - result]))
+    return values, weights
+
+def selection_mask(values, names, selection) :
+    '''Get the mask of rows in the 2D array of values (with columns given by names) passing the
+    selection, a dict with variable names as keys and (min, max) as values.'''
+    mask = numpy.ones(len(values), dtype = bool)
+    for var, cut in selection.items() :
+        vals = values[:, names.index(var)]
+        mask &= (cut[0] <= vals) & (vals < cut[1])
+    return mask
+
+def fill_histo(histo, values, weights) :
+    '''Fill a histogram from arrays of values and weights.'''
+    values = numpy.ascontiguousarray(values, dtype = numpy.float64)
+    weights = numpy.ascontiguousarray(weights, dtype = numpy.float64)
+    if len(values) > 0 :
+        histo.FillN(len(values), values, weights)
+    return histo
+
 class TreeVar(NamedFormula) :
     '''Proxy class between a variable, or function of variables, in a TTree and a RooRealVar.'''
 
@@ -169,14 +240,10 @@ def make_roodataset(dataname, datatitle, tree, nentries = -1, selection = '',
 def make_roodatahist(name, roodata, variable, selection = None, nbins = 100, xmin = None, xmax = None) :
     '''Make a 1D binned RooDataHist from an unbinned RooDataSet for the give variable.
     'selection' can be a dictionary with variable names as keys and (min, max) as values,
-    or a function that expects a RooArgSet and returns a bool.'''
+    or a function that expects a RooArgSet and returns a bool. For a dictionary, the values
+    are extracted from the dataset with roodataset_arrays, otherwise the selection is called
+    for each entry.'''
 
-    if not selection :
-        selection = lambda args : True
-    elif isinstance(selection, dict) :
-        _selection = selection
-        selection = lambda args : all(cut[0] <= args[var].getVal() < cut[1] for var, cut in _selection.items())
-    
     if None == xmin :
         xmin = variable.getMin()
     if None == xmax :
@@ -184,11 +251,19 @@ def make_roodatahist(name, roodata, variable, selection = None, nbins = 100, xmi
 
     varname = variable.GetName()
     h = ROOT.TH1F(name + '_histo', '', nbins, xmin, xmax)
-    for i in xrange(roodata.numEntries()) :
-        args = roodata.get(i)
-        if not selection(args) :
-            continue
-        h.Fill(args[varname].getVal(), roodata.weight())
+    if callable(selection) :
+        for i in xrange(roodata.numEntries()) :
+            args = roodata.get(i)
+            if not selection(args) :
+                continue
+            h.Fill(args[varname].getVal(), roodata.weight())
+    else :
+        if not selection :
+            selection = {}
+        names = [varname] + [var for var in selection if var != varname]
+        values, weights = roodataset_arrays(roodata, names)
+        mask = selection_mask(values, names, selection)
+        fill_histo(h, values[mask, 0], weights[mask])
     return ROOT.RooDataHist(name, name, ROOT.RooArgList(variable), h)
 
 def main() :
@@ -0,0 +1,149 @@
+'''Utilities for running tasks in parallel in a process pool.'''
+
+from __future__ import print_function
+import multiprocessing, random, os, csv
+from multiprocessing import Pool
+from AnalysisUtils.Silence import Silence
+
+# Tasks to be run in the worker processes. These are inherited by the workers when the
+# pool is forked, so the functions and their arguments don't need to be picklable (eg,
+# TTrees, TreeFormulas or lambdas). Only the return values are sent back via pickling.
+_tasks = []
+
+def _call(function, args, kwargs, logfile = None) :
+    '''Call the function, optionally redirecting its output to a log file.'''
+    if not logfile :
+        return function(*args, **kwargs)
+    logdir = os.path.dirname(os.path.abspath(logfile))
+    if not os.path.exists(logdir) :
+        os.makedirs(logdir)
+    with Silence(stdout = logfile, stderr = logfile) :
+        return function(*args, **kwargs)
+
+def _run_task(itask, logfile) :
+    '''Run a task in a worker process.'''
+    # Each worker inherits the random state of the parent, so reseed to avoid, eg, temporary
+    # files with the same names from random_string in different workers.
+    random.seed()
+    function, args, kwargs = _tasks[itask]
+    return _call(function, args, kwargs, logfile)
+
+def parallel_map(function, argslist, nthreads = multiprocessing.cpu_count(), logfiles = None,
+                 callback = None) :
+    '''Call function(*args) for each args in argslist, using a pool of at most nthreads processes.
+    Elements of argslist can also be dicts, in which case they're passed as keyword arguments. If
+    logfiles is given it should be a list of file names of the same length as argslist, and the
+    output of each task is redirected to the corresponding file. If callback is given it's called
+    with the index of the task and its return value as each task completes. Returns the list of
+    return values in the same order as argslist. If nthreads <= 1 the tasks are run serially in this process.'''
+    global _tasks
+
+    tasks = []
+    for args in argslist :
+        if isinstance(args, dict) :
+            tasks.append((function, (), args))
+        else :
+            tasks.append((function, tuple(args), {}))
+    if not logfiles :
+        logfiles = [None] * len(tasks)
+
+    if nthreads <= 1 or len(tasks) <= 1 :
+        results = []
+        for itask, (func, args, kwargs) in enumerate(tasks) :
+            result = _call(func, args, kwargs, logfiles[itask])
+            if callback :
+                callback(itask, result)
+            results.append(result)
+        return results
+
+    # The tasks have to be set before the pool is made so that they're inherited by the workers.
+    _tasks = tasks
+    try :
+        pool = Pool(processes = min(nthreads, len(tasks)))
+        procs = []
+        for itask in xrange(len(tasks)) :
+            if callback :
+                _callback = (lambda itask : (lambda result : callback(itask, result)))(itask)
+            else :
+                _callback = None
+            procs.append(pool.apply_async(_run_task, (itask, logfiles[itask]), callback = _callback))
+        pool.close()
+        success = True
+        for itask, proc in enumerate(procs) :
+            proc.wait()
+            procsuccess = proc.successful()
+            if not procsuccess :
+                print('ERROR: parallel_map: task', itask, 'failed', end = '')
+                if logfiles[itask] :
+                    print(', see', logfiles[itask], end = '')
+                print()
+            success = success and procsuccess
+        pool.join()
+        if not success :
+            # Raise the exception from the first failed task.
+            for proc in procs :
+                if not proc.successful() :
+                    proc.get()
+        return [proc.get() for proc in procs]
+    finally :
+        _tasks = []
+
+def _format_value(val) :
+    '''Format a value for a ResultsTable, using repr for floats so they're stored exactly.'''
+    if isinstance(val, float) :
+        return repr(val)
+    return str(val)
+
+def _parse_value(val) :
+    '''Convert a value read from a ResultsTable back to an int or float, if possible.'''
+    for valtype in int, float :
+        try :
+            return valtype(val)
+        except ValueError :
+            pass
+    return val
+
+class ResultsTable(object) :
+    '''A CSV table of the results of tasks. Rows are appended to the file as they're added, so if
+    the tasks are interrupted, the ones that are already done can be skipped when they're
+    restarted.'''
+
+    def __init__(self, fname, columns, keycolumns) :
+        '''fname : name of the CSV file.
+        columns : names of the columns.
+        keycolumns : names of the columns that identify a task.'''
+        self.fname = fname
+        self.columns = list(columns)
+        self.keycolumns = list(keycolumns)
+
+    def key(self, row) :
+        '''Get the key identifying the task of a row (or dict of the key columns).'''
+        return tuple(_format_value(row[col]) for col in self.keycolumns)
+
+    def rows(self) :
+        '''Get the rows in the file as dicts.'''
+        if not os.path.exists(self.fname) :
+            return []
+        with open(self.fname) as fin :
+            return [{col : _parse_value(val) for col, val in row.items()} for row in csv.DictReader(fin)]
+
+    def done_keys(self) :
+        '''Get the set of keys of the tasks that are already in the file.'''
+        return set(self.key(row) for row in self.rows())
+
+    def is_done(self, row) :
+        '''Check if the task for the given row (or dict of the key columns) is already in the file.'''
+        return self.key(row) in self.done_keys()
+
+    def add(self, row) :
+        '''Append a row (a dict of column values) to the file.'''
+        newfile = not os.path.exists(self.fname)
+        if newfile :
+            outdir = os.path.dirname(os.path.abspath(self.fname))
+            if not os.path.exists(outdir) :
+                os.makedirs(outdir)
+        with open(self.fname, 'a') as fout :
+            writer = csv.DictWriter(fout, self.columns)
+            if newfile :
+                writer.writeheader()
+            writer.writerow({col : _format_value(row[col]) for col in self.columns})
@@ -1,6 +1,9 @@
 '''Utilities for plotting output.'''
 
-import ROOT, subprocess
+import ROOT, subprocess, os, hashlib, multiprocessing
+from AnalysisUtils.parallel import parallel_map
+from AnalysisUtils.workspace import to_list
+from AnalysisUtils.fit import data_fingerprint, cmdarg_key
 
 # Colours, marker and line styles for histos, so you can assign them in a loop.
 goodcolours = (ROOT.kBlack, ROOT.kBlue, ROOT.kRed, ROOT.kGreen+2, ROOT.kMagenta+1, ROOT.kCyan+1,
@@ -152,3 +155,136 @@ def set_y_range(histo, padding = 0.1, symmetric = False, ignorezero = False):
     else:
         histo.GetYaxis().SetRangeUser(ymin, ymax)
     return ymin, ymax
+
+def input_fingerprint(obj):
+    '''Get a string that changes when the given plot input changes: the creation time of a DataCache,
+    the final parameters of a RooFitResult, the modification time of a file, the files and their
+    modification times for a TTree, the hash of the values and weights of a RooDataSet or RooDataHist
+    (see fit.data_fingerprint), the name and values of a RooCmdArg (see fit.cmdarg_key), the values
+    of the variables of a RooAbsArg, the class and name of other TObjects, the name of a function,
+    the fingerprints of the elements of a list, tuple or dict, or else the repr of the object.'''
+    if hasattr(obj, 'ctime') and hasattr(obj, 'fname'):
+        return 'DataCache:' + obj.fname + ':' + str(obj.ctime)
+    if isinstance(obj, ROOT.RooFitResult):
+        pars = obj.floatParsFinal()
+        return 'RooFitResult:' + repr((obj.status(), obj.minNll(),
+                                       [(pars.at(i).GetName(), pars.at(i).getVal(), pars.at(i).getError())
+                                        for i in xrange(pars.getSize())]))
+    if isinstance(obj, str) and os.path.exists(obj):
+        return 'File:' + obj + ':' + repr(os.path.getmtime(obj))
+    if isinstance(obj, (list, tuple)):
+        return repr([input_fingerprint(elm) for elm in obj])
+    if isinstance(obj, dict):
+        return repr(sorted((key, input_fingerprint(val)) for key, val in obj.items()))
+    if isinstance(obj, ROOT.TTree):
+        if isinstance(obj, ROOT.TChain):
+            files = [elm.GetTitle() for elm in obj.GetListOfFiles()]
+        else:
+            files = [obj.GetDirectory().GetFile().GetName()] if obj.GetDirectory() and obj.GetDirectory().GetFile() else []
+        return 'TTree:' + obj.GetName() + ':' + input_fingerprint(files) + ':' + repr(getattr(obj, 'selection', None))
+    if isinstance(obj, ROOT.RooCmdArg):
+        return 'RooCmdArg:' + repr(cmdarg_key(obj))
+    if isinstance(obj, ROOT.RooAbsData):
+        observables = [var.GetName() for var in to_list(obj.get()) if isinstance(var, ROOT.RooAbsReal)]
+        return obj.ClassName() + ':' + obj.GetName() + ':' + data_fingerprint(obj, observables)
+    if isinstance(obj, ROOT.RooAbsArg):
+        values = sorted((var.GetName(), var.getVal()) for var in to_list(obj.getVariables())
+                        if isinstance(var, ROOT.RooAbsReal))
+        return obj.ClassName() + ':' + obj.GetName() + ':' + repr(values)
+    if isinstance(obj, ROOT.TObject):
+        return obj.ClassName() + ':' + obj.GetName()
+    if callable(obj) and hasattr(obj, '__name__'):
+        return 'Function:' + getattr(obj, '__module__', '') + '.' + obj.__name__
+    return repr(obj)
+
+def plot_fingerprint(spec):
+    '''Get the md5 hash of the function, inputs, arguments, formats and canvas size of a plot spec
+    (see render_plots).'''
+    function = spec['function']
+    key = [function.__module__ + '.' + function.__name__, spec.get('key', '')]
+    key += [input_fingerprint(obj) for obj in spec.get('inputs', ())]
+    key += [input_fingerprint(list(spec.get('args', ()))), input_fingerprint(spec.get('kwargs', {})),
+            tuple(spec.get('formats', ('pdf',))), tuple(spec.get('canvsize', ()))]
+    return hashlib.md5(repr(key)).hexdigest()
+
+def _plot_files(spec):
+    '''Get the output file names of a plot spec.'''
+    return [spec['name'] + '.' + fmt for fmt in spec.get('formats', ('pdf',))]
+
+def _stamp_file(spec):
+    '''Get the name of the file that records the fingerprint of the last render of a plot.'''
+    return spec['name'] + '.plotstamp'
+
+def is_plot_up_to_date(spec, fingerprint = None):
+    '''Check if the output files of a plot exist and were rendered with the same inputs.'''
+    if not all(os.path.exists(fname) for fname in _plot_files(spec) + [_stamp_file(spec)]):
+        return False
+    if None == fingerprint:
+        fingerprint = plot_fingerprint(spec)
+    with open(_stamp_file(spec)) as fstamp:
+        return fstamp.read().strip() == fingerprint
+
+def render_plot(spec):
+    '''Render a single plot spec in batch mode and save it in each format (see render_plots).'''
+    batch = ROOT.gROOT.IsBatch()
+    ROOT.gROOT.SetBatch(True)
+    try:
+        outdir = os.path.dirname(os.path.abspath(spec['name']))
+        if not os.path.exists(outdir):
+            os.makedirs(outdir)
+        canv = ROOT.TCanvas(os.path.basename(spec['name']), '', *spec.get('canvsize', ()))
+        canv.cd()
+        result = spec['function'](*spec.get('args', ()), **spec.get('kwargs', {}))
+        if isinstance(result, dict) and isinstance(result.get('canv', None), ROOT.TCanvas):
+            canv = result['canv']
+        elif isinstance(result, ROOT.TCanvas):
+            canv = result
+        for fname in _plot_files(spec):
+            if fname.endswith('.eps'):
+                save_eps(canv, fname)
+            else:
+                canv.SaveAs(fname)
+    finally:
+        # Plots rendered in this process (eg, with nthreads = 1) leave the batch mode as it was.
+        ROOT.gROOT.SetBatch(batch)
+    return _plot_files(spec)
+
+def render_plots(specs, nthreads = multiprocessing.cpu_count(), update = False, logfiles = None):
+    '''Render a list of plots in batch mode using up to nthreads processes. Each plot spec is a dict with:
+      name : output file name without the extension.
+      function : the function that draws the plot. It's called with a new TCanvas as the current pad, and
+        can either draw on it or return a TCanvas (or a dict containing one as 'canv', eg, from plot_fit).
+      args, kwargs : optional arguments for the function.
+      inputs : optional list of the inputs the plot depends on (eg, DataCaches, RooFitResults, file names).
+      key : optional string that's also used to identify the plot's inputs (eg, the options).
+      formats : optional list of file formats (default ('pdf',)).
+      canvsize : optional (width, height) of the TCanvas.
+    Plots whose output files exist and whose function, inputs, arguments (see input_fingerprint), formats
+    and canvas size haven't changed since they were last rendered are skipped, unless update = True. Returns the list of the names of the plots that were rendered.'''
+    fingerprints = [plot_fingerprint(spec) for spec in specs]
+    todo = [i for i, (spec, fingerprint) in enumerate(zip(specs, fingerprints))
+            if update or not is_plot_up_to_date(spec, fingerprint)]
+    print 'Rendering', len(todo), 'of', len(specs), 'plots'
+    def record(itask, result):
+        spec = specs[todo[itask]]
+        with open(_stamp_file(spec), 'w') as fstamp:
+            fstamp.write(fingerprints[todo[itask]] + '\n')
+    if logfiles:
+        logfiles = [logfiles[i] for i in todo]
+    parallel_map(render_plot, [(specs[i],) for i in todo], nthreads = nthreads, logfiles = logfiles,
+                 callback = record)
+    return [specs[i]['name'] for i in todo]
+
+def fit_plot_spec(name, pdf, data, fitresult = None, formats = ('pdf',), **kwargs):
+    '''Get a plot spec (see render_plots) for plot_fit of the PDF over the data, saved as name
+    in each of the formats. The PDF's parameter values and the data are fingerprinted, along
+    with the fit result, if given. kwargs are passed to plot_fit.'''
+    return dict(name = name, function = plot_fit, args = (pdf, data), kwargs = kwargs,
+                inputs = [fitresult] if fitresult else [], formats = tuple(formats))
+
+def save_fit_plot(name, pdf, data, fitresult = None, formats = ('pdf',), update = False, **kwargs):
+    '''Plot the fit of the PDF to the data with plot_fit and save it as name in each of the formats,
+    unless it's up to date (see render_plots and fit_plot_spec), in which case it's skipped. The plot is
+    rendered in batch mode in this process. Returns True if the plot was rendered.'''
+    spec = fit_plot_spec(name, pdf, data, fitresult, formats, **kwargs)
+    return bool(render_plots([spec], nthreads = 1, update = update))
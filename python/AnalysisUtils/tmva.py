@@ -1,9 +1,11 @@
-import ROOT, os
+import ROOT, os, multiprocessing, numpy, hashlib, itertools, random, time
 from ROOT import TMVA
 from AnalysisUtils.treeutils import tree_iter, random_string, copy_tree, TreeBranchAdder, TreeFormula, tree_loop, \
-    TreeFormulaList, get_aliases
+    TreeFormulaList, get_aliases, tree_array_chunks, fill_tree_from_arrays, tree_file_info, is_tfile_ok, \
+    tree_ranges
 from AnalysisUtils.selection import AND, NOT
 from AnalysisUtils.addmva import MVACalc
+from AnalysisUtils.parallel import parallel_map, ResultsTable
 
 class TMVAOptions(object) :
     '''Wrapper for options passed to TMVA.'''
@@ -48,6 +50,18 @@ class TMVAOptions(object) :
                 self.args += (arg,)
         self.kwargs.update(kwargs)
 
+def _variable_ranges(tree, variables, selection, quantile) :
+    '''Get the ranges of the variables, in the format required by DataCache.'''
+    return {'ranges' : tree_ranges(tree, variables, selection, quantile)}
+
+def _get_variable_ranges(tree, variables, selection, quantile) :
+    '''Get the ranges of the variables on the tree, using a DataCache if it's a DataChain.'''
+    args = (variables, selection, quantile)
+    if not hasattr(tree, 'get_cache') :
+        return _variable_ranges(tree, *args)['ranges']
+    name = 'TMVAVariableRanges_' + hashlib.md5(repr(args)).hexdigest()
+    return tree.get_cache(name, ['ranges'], _variable_ranges, args = args).ranges
+
 class TMVADataLoader(object) :
     '''Wrapper for TMVA.DataLoader.'''
 
@@ -56,7 +70,8 @@ class TMVADataLoader(object) :
                  signalcut = '', backgroundcut = '',
                  signalglobalweight = 1., backgroundglobalweight = 1.,
                  name = 'dataset', splitoptions = None, trainingcut = '',
-                 testingcut = '', prepare = False) :
+                 testingcut = '', prepare = False, usecache = True, cachedir = None,
+                 cutrangequantile = None) :
         '''signaltree : the signal TTree.
         backgroundtree : the background TTree.
         variables : list of training variables. These can just be the variable expressions as strings, or
@@ -71,6 +86,16 @@ class TMVADataLoader(object) :
         backgroundglobalweight : global weight for the background.
         name : name of the TMVA.DataLoader instance.
         splitoptions : options for TMVA.DataLoader.PrepareTrainingAndTestTree. If None the default is used.
+        trainingcut : selection for the training sample. If not given, NOT(testingcut) is used.
+        testingcut : selection for the testing sample. If not given, NOT(trainingcut) is used.
+          If either is given, the signal and background trees are copied with the training
+          and testing selections applied.
+        usecache : if True, the copies of the trees made with the training and testing cuts are
+          kept and reused whenever the input files, cuts, used leaves and weights are the same.
+        cachedir : directory for the cached trees. By default, the cache directory of the signal
+          tree is used if it's a DataChain, else 'DataLoaderCache' in the current directory.
+        cutrangequantile : if given, the cut ranges for Cuts methods are from the quantile to
+          1 - quantile values of the variables, rather than the min to max (see get_cut_range_opts).
         '''
 
         if None == splitoptions :
@@ -139,12 +164,12 @@ class TMVADataLoader(object) :
         # applying these cuts.
         if self.trainingcut :
             pwd = ROOT.gROOT.CurrentDirectory()
-            self.tmpfile = ROOT.TFile.Open(os.path.abspath('DataLoader_' + random_string() + '.root'), 'recreate')
-            self.tmpfile.cd()
             signal_usedleaves, background_usedleaves = self.used_leaves()
             usedleaves = {'Signal' : signal_usedleaves, 'Background' : background_usedleaves}
             aliases = {'Signal' : get_aliases(self.signaltree), 'Background' : get_aliases(self.backgroundtree)}
+            fname = self.split_cache_file(usedleaves)
             addtreeargs = []
+            treecuts = []
             for name in 'Signal', 'Background' :
                 lname = name.lower()
                 namecut = getattr(self, lname + 'cut')
@@ -152,21 +177,39 @@ class TMVADataLoader(object) :
                     classname = self.name + '_' + name + '_' + tname + '_'
                     cut = AND(*filter(None, [namecut, cut]))
                     tree = getattr(self, lname + 'tree')
-                    seltree, copyfriends = copy_tree(tree,
-                                                     selection = cut,
-                                                     keepbranches = usedleaves[name],
-                                                     rename = (lambda name : classname + name.replace('/', '_')),
-                                                     write = True,
-                                                     returnfriends = True
-                                                     )
-                    addtreeargs.append((seltree.GetName(), name, getattr(self, lname + 'globalweight'),
-                                        ROOT.TCut(''), ttype))
+                    treecuts.append((tree, cut, name, classname))
+                    addtreeargs.append((classname + tree.GetName().replace('/', '_'), name,
+                                        getattr(self, lname + 'globalweight'), ROOT.TCut(''), ttype))
                 weight = getattr(self, lname + 'weight')
                 if weight :
                     self.dataloader.SetWeightExpression(weight, name)
 
-            fname = self.tmpfile.GetName()
-            self.tmpfile.Close()
+            if fname and self._is_split_cache_ok(fname, [args[0] for args in addtreeargs]) :
+                print 'Using cached training and testing trees from', fname
+            else :
+                # Write to a temporary file then move it, so an incomplete file is never
+                # picked up as a valid cache by another job.
+                if fname :
+                    writefname = fname + '.' + random_string() + '.tmp'
+                else :
+                    writefname = os.path.abspath('DataLoader_' + random_string() + '.root')
+                self.tmpfile = ROOT.TFile.Open(writefname, 'recreate')
+                self.tmpfile.cd()
+                for tree, cut, name, classname in treecuts :
+                    copy_tree(tree,
+                              selection = cut,
+                              keepbranches = usedleaves[name],
+                              rename = (lambda name : classname + name.replace('/', '_')),
+                              write = True,
+                              returnfriends = True
+                              )
+                self.tmpfile.Close()
+                if fname :
+                    os.rename(writefname, fname)
+                else :
+                    fname = writefname
+                    self.removetmpfile = True
+
             self.tmpfile = ROOT.TFile.Open(fname)
             for args in addtreeargs :
                 tree = self.tmpfile.Get(args[0])
@@ -193,18 +236,25 @@ class TMVADataLoader(object) :
                                                   str(self.splitoptions))
         return True
 
-    def get_cut_range_opts(self) :
-        '''Get the options for cut ranges, so they stay within the range of the data.'''
+    def get_cut_range_opts(self, quantile = None) :
+        '''Get the options for cut ranges, so they stay within the range of the data. The ranges of all
+        variables are found in one pass over each of the signal and background trees. If quantile
+        is given (or cutrangequantile was given to the constructor), the quantile and 1 - quantile
+        values are used rather than the min and max. If the trees are DataChains, the ranges are 
+        cached using their DataCaches.'''
 
+        if None == quantile :
+            quantile = self.cutrangequantile
         print 'Calculating variable ranges.'
         datasetinfo = self.dataloader.GetDataSetInfo()
+        variables = [str(varinfo.GetExpression()) for varinfo in datasetinfo.GetVariableInfos()]
+        signalranges = _get_variable_ranges(self.signaltree, variables, self.signalcut, quantile)
+        backgroundranges = _get_variable_ranges(self.backgroundtree, variables, self.backgroundcut, quantile)
         cutrangeopts = TMVAOptions()
-        for ivar, varinfo in enumerate(datasetinfo.GetVariableInfos()) :
-            varmin = min(min(tree_iter(self.signaltree, str(varinfo.GetExpression()), self.signalcut)), 
-                         min(tree_iter(self.backgroundtree, str(varinfo.GetExpression()), self.backgroundcut)))
-            varmax = max(max(tree_iter(self.signaltree, str(varinfo.GetExpression()), self.signalcut)), 
-                         max(tree_iter(self.backgroundtree, str(varinfo.GetExpression()), self.backgroundcut)))
-            print 'Range of', varinfo.GetExpression(), varmin, varmax
+        for ivar, (var, sigrange, bkgrange) in enumerate(zip(variables, signalranges, backgroundranges)) :
+            varmin = min(sigrange[0], bkgrange[0])
+            varmax = max(sigrange[1], bkgrange[1])
+            print 'Range of', var, varmin, varmax
             varbuffer = (varmax - varmin)*0.05
             cutrangeopts.update(**{'CutRangeMin[{0}]'.format(ivar) : varmin - varbuffer,
                                    'CutRangeMax[{0}]'.format(ivar) : varmax + varbuffer})
@@ -221,10 +271,56 @@ class TMVADataLoader(object) :
         forms = filter(None, forms)
         return TreeFormulaList(self.signaltree, *forms).used_leaves(), TreeFormulaList(self.backgroundtree, *forms).used_leaves()
 
+    def split_cache_file(self, usedleaves) :
+        '''Get the name of the file used to cache the training and testing trees, given the dict of
+        leaves used for 'Signal' and 'Background'. The name depends on the input files (and their
+        modification times), cuts, used leaves and weights, so the cache is reused by any
+        DataLoader with the same inputs, eg, when training different methods. Returns None
+        if the cache can't be used.'''
+        if not self.usecache :
+            return None
+        key = [self.name, self.trainingcut, self.testingcut]
+        for name in 'Signal', 'Background' :
+            lname = name.lower()
+            tree = getattr(self, lname + 'tree')
+            fileinfo = tree_file_info(tree)
+            # Trees in memory could change without us knowing, so don't cache them.
+            if None == fileinfo :
+                return None
+            key += [fileinfo, getattr(self, lname + 'cut'), getattr(self, lname + 'weight'),
+                    sorted(usedleaves[name]), sorted(get_aliases(tree).items())]
+        cachedir = self.cachedir
+        if not cachedir :
+            if hasattr(self.signaltree, 'cache_directory') :
+                cachedir = self.signaltree.cache_directory()
+            else :
+                cachedir = 'DataLoaderCache'
+        cachedir = os.path.abspath(cachedir)
+        if not os.path.exists(cachedir) :
+            try :
+                os.makedirs(cachedir)
+            except OSError :
+                # Could've been made by another process in the meantime.
+                if not os.path.exists(cachedir) :
+                    raise
+        return os.path.join(cachedir, 'DataLoader_' + self.name + '_' + hashlib.md5(repr(key)).hexdigest() + '.root')
+
+    @staticmethod
+    def _is_split_cache_ok(fname, treenames) :
+        '''Check if the cache file exists and contains all the required trees.'''
+        if not os.path.exists(fname) or not is_tfile_ok(fname) :
+            return False
+        tfile = ROOT.TFile.Open(fname)
+        ok = all(isinstance(tfile.Get(name), ROOT.TTree) for name in treenames)
+        tfile.Close()
+        return ok
+
     def __del__(self) :
         if hasattr(self, 'tmpfile') :
             self.tmpfile.Close()
-            os.remove(self.tmpfile.GetName())
+            # Cached trees are kept for the next time.
+            if getattr(self, 'removetmpfile', False) :
+                os.remove(self.tmpfile.GetName())
 
 class TMVAClassifier(object) :
     '''Run TMVA classification algos.'''
@@ -425,6 +521,9 @@ class TMVAClassifier(object) :
         # Evaluate MVAs
         factory.EvaluateAllMethods()    
 
+        # Keep the ROC integrals on the testing sample.
+        self.rocintegrals = dict((m, factory.GetROCIntegral(self.dataloader.dataloader, m)) for m in methods)
+
         # Save the output.
         outputfile.Close()
     
@@ -520,46 +619,198 @@ class KFoldClassifier(object) :
             classifiers.append(opts)
         self.classifiers = tuple(classifiers)
 
-    def train_and_test(self) :
-        '''Train and test the classifiers on all folds.'''
-        results = []
-        for opts in self.classifiers :
-            results.append(opts['classifier'].train_and_test())
-        return results
-
-    def add_mva(self, inputtree, method, outputfile, outputtree, branchname = None) :
+    def log_file(self, ifold) :
+        '''Get the name of the log file used for the given fold when training in parallel.'''
+        classifier = self.classifiers[ifold]['classifier']
+        return os.path.abspath(os.path.join(classifier.weightsdir, classifier.name + '.log'))
+
+    def train_and_test(self, nthreads = 1) :
+        '''Train and test the classifiers on all folds. If nthreads > 1, the folds are trained in
+        parallel in separate processes, using at most nthreads at a time. In this case the output
+        of each fold is written to the file given by log_file. Returns the list of (weightsfiles, 
+        classfiles) for each fold.'''
+        if nthreads <= 1 :
+            results = []
+            for opts in self.classifiers :
+                results.append(opts['classifier'].train_and_test())
+            return results
+
+        logfiles = [self.log_file(i) for i in xrange(len(self.classifiers))]
+        for i, logfile in enumerate(logfiles) :
+            print 'Training fold', i, 'with output to', logfile
+        return parallel_map(lambda classifier : classifier.train_and_test(),
+                            [(opts['classifier'],) for opts in self.classifiers],
+                            nthreads = nthreads, logfiles = logfiles,
+                            callback = (lambda i, result : self._print_fold_done(i, result)))
+
+    def _print_fold_done(self, ifold, result) :
+        '''Print the output files of a fold that's finished training.'''
+        weightsfiles, classfiles = result
+        print 'Fold', ifold, 'finished training'
+        for method in sorted(weightsfiles) :
+            print '  ', method, ':', weightsfiles[method], classfiles[method]
+
+    def weights_files(self, method, suffix = '.weights.xml') :
+        '''Get the list of weights files for the given method for all folds.'''
+        return [opts['classifier'].weights_file(method, suffix) for opts in self.classifiers]
+
+    def add_mva(self, inputtree, method, outputfile, outputtree, branchname = None, chunksize = 100000) :
         '''Make a TTree with the MVA values, selecting the weights file according 
-        to the fold that each entry belongs to.'''
-
-        foldselectors = [TreeFormula('selform_' + str(i), opts['testingcut'], inputtree) \
-                             for i, opts in enumerate(self.classifiers)]
-        def select_fold() :
-            for i, sel in enumerate(foldselectors) :
-                if sel() :
-                    return i
-            return -1
+        to the fold that each entry belongs to. Entries that don't pass any of the testing
+        cuts get a value of -999 and a fold of -1. The input tree is processed in chunks of
+        chunksize entries: the fold of each entry is found from the testing cuts, then all
+        entries in the same fold are evaluated together with that fold's MVA.'''
 
         mvacalcs = [MVACalc(inputtree, opts['classifier'].weights_file(method), method) \
                         for i, opts in enumerate(self.classifiers)]
 
-        ientry = 0
-        def get_mva() :
-            i = select_fold()
-            if i < 0 :
-                return [-999.]
-            return [mvacalcs[i].calc_mva(ientry)]
+        # Evaluate the testing cuts and the variables of all folds together, with each
+        # variable only evaluated once.
+        nfolds = len(self.classifiers)
+        columns = [opts['testingcut'] for opts in self.classifiers]
+        for mvacalc in mvacalcs :
+            for form in mvacalc.formulae :
+                if not form in columns[nfolds:] :
+                    columns.append(form)
+        varcolumns = [[columns.index(form, nfolds) for form in mvacalc.formulae] for mvacalc in mvacalcs]
 
         if not branchname :
             branchname = method
         
         outputfile = ROOT.TFile.Open(outputfile, 'recreate')
         outputtree = ROOT.TTree(outputtree, outputtree)
-        mvabranch = TreeBranchAdder(outputtree, branchname, get_mva)
-        foldbranch = TreeBranchAdder(outputtree, branchname + '_fold', lambda : [select_fold()],
-                                     type = 'i')
-        for ientry in tree_loop(inputtree) :
-            mvabranch.set_value()
-            foldbranch.set_value()
-            outputtree.Fill()
+        mvabranch = TreeBranchAdder(outputtree, branchname, None)
+        foldbranch = TreeBranchAdder(outputtree, branchname + '_fold', None, type = 'i')
+        for entries, values in tree_array_chunks(inputtree, columns, chunksize = chunksize) :
+            # The fold is the first testing cut that's passed, as in the per-entry selection.
+            passcuts = (values[:, :nfolds] != 0)
+            folds = numpy.where(passcuts.any(axis = 1), passcuts.argmax(axis = 1), -1)
+            mvavals = numpy.full(len(entries), -999.)
+            for i, mvacalc in enumerate(mvacalcs) :
+                infold = (folds == i)
+                if infold.any() :
+                    mvavals[infold] = mvacalc.calc_mva_array(values[infold][:, varcolumns[i]])
+            fill_tree_from_arrays(outputtree, (mvabranch.values, foldbranch.values), (mvavals, folds))
         outputtree.Write()
         outputfile.Close()
+
+class TMVAScan(object) :
+    '''Scan the options of a TMVA method, training a TMVAClassifier for each set of options
+    in parallel, and record the ROC integral and training time of each in a results table.'''
+
+    def __init__(self, method, datakwargs, classifierkwargs, grid = None, randomspec = None,
+                 npoints = 10, seed = 0, baseoptions = None, outputdir = 'TMVAScan') :
+        '''method : the name of the method to scan. If it's not one of the predefined methods in
+          TMVAClassifier, baseoptions should be the full arguments to TMVA.Factory.BookMethod,
+          (type, name, options).
+        datakwargs : the dict of arguments used to initialise the TMVADataLoaders.
+        classifierkwargs : the dict of arguments used to initialise the TMVAClassifiers.
+        grid : dict of option name : list of values. Every combination of values is trained.
+        randomspec : dict of option name : values, for a random search. Values can be a list,
+          in which case one is chosen at random, or a (min, max) tuple, in which case a value is
+          chosen uniformly in the range (as an int if min and max are ints).
+        npoints : number of random points to train for a random search.
+        seed : random seed for the random search.
+        baseoptions : options for the method that aren't scanned. If None the default options are used.
+        outputdir : directory for the output of each point and the results table.
+        '''
+        if not grid and not randomspec :
+            raise ValueError('Either grid or randomspec must be given!')
+        if None == baseoptions :
+            baseoptions = TMVAClassifier.defaultopts[method].copy()
+        if isinstance(baseoptions, str) :
+            baseoptions = TMVAOptions.from_string(baseoptions)
+        if isinstance(baseoptions, TMVAOptions) :
+            baseoptions = (TMVAClassifier.methodtypes[method], method, baseoptions)
+        elif not isinstance(baseoptions[-1], TMVAOptions) :
+            baseoptions = tuple(baseoptions[:-1]) + (TMVAOptions.from_string(baseoptions[-1]),)
+
+        self.method = method
+        self.datakwargs = dict(datakwargs)
+        self.datakwargs['prepare'] = False
+        self.classifierkwargs = dict(classifierkwargs)
+        self.baseoptions = tuple(baseoptions)
+        self.outputdir = os.path.abspath(outputdir)
+        if grid :
+            self.parameters = sorted(grid)
+            self.points = [dict(zip(self.parameters, vals)) \
+                               for vals in itertools.product(*[grid[name] for name in self.parameters])]
+        else :
+            self.parameters = sorted(randomspec)
+            rndm = random.Random(seed)
+            self.points = []
+            for i in xrange(npoints) :
+                point = {}
+                for name in self.parameters :
+                    vals = randomspec[name]
+                    if isinstance(vals, tuple) :
+                        if all(isinstance(val, (int, long)) for val in vals) :
+                            point[name] = rndm.randint(*vals)
+                        else :
+                            point[name] = rndm.uniform(*vals)
+                    else :
+                        point[name] = rndm.choice(vals)
+                self.points.append(point)
+        self.results = ResultsTable(os.path.join(self.outputdir, 'results.csv'),
+                                    ['point'] + self.parameters + ['rocintegral', 'traintime'],
+                                    ['point'] + self.parameters)
+
+    def point_name(self, ipoint) :
+        '''Get the name used for the output directory of the given point.'''
+        return 'point_' + str(ipoint).zfill(len(str(len(self.points)-1)))
+
+    def weightsdir(self, ipoint) :
+        '''Get the weights directory for the given point.'''
+        return os.path.join(self.outputdir, self.point_name(ipoint))
+
+    def log_file(self, ipoint) :
+        '''Get the log file for the given point.'''
+        return os.path.join(self.weightsdir(ipoint), self.point_name(ipoint) + '.log')
+
+    def method_args(self, ipoint) :
+        '''Get the arguments for TMVA.Factory.BookMethod for the given point.'''
+        return self.baseoptions[:-1] + (self.baseoptions[-1].copy(**self.points[ipoint]),)
+
+    def classifier(self, ipoint) :
+        '''Get the TMVAClassifier for the given point.'''
+        kwargs = dict(self.classifierkwargs)
+        kwargs['dataloader'] = TMVADataLoader(**self.datakwargs)
+        kwargs['methods'] = {self.method : self.method_args(ipoint)}
+        kwargs['weightsdir'] = self.weightsdir(ipoint)
+        return TMVAClassifier(**kwargs)
+
+    def train_point(self, ipoint) :
+        '''Train the classifier for the given point and return its row of the results table.'''
+        classifier = self.classifier(ipoint)
+        start = time.time()
+        classifier.train_and_test()
+        row = dict(self.points[ipoint])
+        row.update(point = ipoint, rocintegral = classifier.rocintegrals[self.method],
+                   traintime = time.time() - start)
+        return row
+
+    def _add_result(self, ipoint, row) :
+        '''Add the result of a point to the results table.'''
+        print 'Point', row['point'], 'finished: ROC integral', row['rocintegral'], 'in', row['traintime'], 's'
+        self.results.add(row)
+
+    def run(self, nthreads = multiprocessing.cpu_count()) :
+        '''Train all the points that aren't already in the results table, using at most nthreads
+        processes, and return the rows of the results table.'''
+        donekeys = self.results.done_keys()
+        todo = [i for i, point in enumerate(self.points) \
+                    if not self.results.key(dict(point, point = i)) in donekeys]
+        print 'Training', len(todo), 'of', len(self.points), 'points of', self.method, 'scan'
+        if todo :
+            # Make the training and testing split once, so all points share it.
+            if self.datakwargs.get('trainingcut') or self.datakwargs.get('testingcut') :
+                TMVADataLoader(**self.datakwargs).prepare()
+            # In parallel the results are recorded in the main process as each point finishes.
+            parallel_map(lambda ipoint : self.train_point(ipoint), [(i,) for i in todo],
+                         nthreads = nthreads, logfiles = [self.log_file(i) for i in todo],
+                         callback = (lambda i, row : self._add_result(todo[i], row)))
+        return self.results.rows()
+
+    def best(self) :
+        '''Get the row of the results table with the largest ROC integral.'''
+        return max(self.results.rows(), key = lambda row : row['rocintegral'])
@@ -0,0 +1,161 @@
+'''Generate and fit toys in parallel for pull and bias studies.'''
+
+from AnalysisUtils.RooFit import RooFit
+import ROOT, os, multiprocessing, time, math, hashlib
+from AnalysisUtils.parallel import parallel_map, ResultsTable
+from AnalysisUtils.fit import pdf_key, cmdarg_key
+
+class ToyStudy(object) :
+    '''Generate toys from a PDF in a RooWorkspace and fit them, recording the fitted values, errors and
+    pulls of the parameters in a results table. The workspace is saved to the output directory once,
+    and each toy loads it from there, so every toy starts from the same parameter values, which are
+    also the generated values. The toys are run in parallel, each with a seed determined by the
+    study's seed and the toy's index, so they're repeatable. Results are added to the table as each
+    toy finishes, and toys that are already in the table are skipped, so partial runs can be resumed,
+    or extended by increasing ntoys. A fingerprint of the PDFs and options is saved with the workspace,
+    and resuming with a different one raises a ValueError, so results of different studies aren't mixed.'''
+
+    def __init__(self, workspace, genpdf, observables, parameters, nevents, fitpdf = None, extended = True,
+                 ntoys = 100, seed = 0, outputdir = 'ToyStudy', genopts = (), fitopts = ()) :
+        '''workspace : the AnalysisUtils.workspace.Workspace instance, or RooWorkspace, containing the PDFs.
+        genpdf : name of the PDF to generate the toys from.
+        observables : names of the observables to generate.
+        parameters : names of the parameters to record.
+        nevents : number of events to generate per toy.
+        fitpdf : name of the PDF to fit the toys with (default genpdf).
+        extended : if True, the number of events generated is Poisson distributed around nevents.
+        ntoys : number of toys.
+        seed : random seed for the study. Each toy's seed is determined by this and its index (see toy_seed).
+        outputdir : directory for the workspace file and the results table.
+        genopts : extra RooCmdArgs for RooAbsPdf.generate.
+        fitopts : extra RooCmdArgs for RooAbsPdf.fitTo.
+        '''
+        if not isinstance(workspace, ROOT.RooWorkspace) :
+            workspace = workspace.workspace
+        self.workspacename = workspace.GetName()
+        self.genpdf = genpdf
+        self.fitpdf = fitpdf if fitpdf else genpdf
+        self.observables = list(observables)
+        self.parameters = list(parameters)
+        self.nevents = nevents
+        self.extended = extended
+        self.ntoys = ntoys
+        self.seed = seed
+        self.outputdir = os.path.abspath(outputdir)
+        self.genopts = tuple(genopts)
+        self.fitopts = tuple(fitopts)
+        if not os.path.exists(self.outputdir) :
+            os.makedirs(self.outputdir)
+        # Resumed studies use the workspace that's already saved, if it was saved for the same study.
+        fingerprint = self.fingerprint(workspace)
+        if not os.path.exists(self.workspace_file_name()) :
+            workspace.writeToFile(self.workspace_file_name())
+            with open(self.fingerprint_file_name(), 'w') as fkey :
+                fkey.write(fingerprint + '\n')
+        elif not os.path.exists(self.fingerprint_file_name()) :
+            raise ValueError('Workspace file {0!r} exists but has no fingerprint file {1!r}, so can\'t check it\'s '
+                             'for the same study!'.format(self.workspace_file_name(), self.fingerprint_file_name()))
+        else :
+            with open(self.fingerprint_file_name()) as fkey :
+                savedfingerprint = fkey.read().strip()
+            if savedfingerprint != fingerprint :
+                raise ValueError('The PDFs or options of the study don\'t match those of the workspace saved in {0!r}! '
+                                 'Use a different outputdir for a different study.'.format(self.outputdir))
+        columns = ['toy', 'seed', 'nevents', 'status', 'covqual', 'minnll', 'fittime']
+        for par in self.parameters :
+            columns += [par, par + '_err', par + '_gen', par + '_pull']
+        self.results = ResultsTable(os.path.join(self.outputdir, 'results.csv'), columns, ['toy'])
+
+    def workspace_file_name(self) :
+        '''Get the name of the file the workspace is saved to.'''
+        return os.path.join(self.outputdir, 'workspace.root')
+
+    def fingerprint_file_name(self) :
+        '''Get the name of the file the fingerprint of the study is saved to.'''
+        return os.path.join(self.outputdir, 'workspace.key')
+
+    def fingerprint(self, workspace) :
+        '''Get the md5 hash of the PDFs (see fit.pdf_key), observables, parameters and options of the study.'''
+        observables = ROOT.RooArgSet()
+        for obs in self.observables :
+            observables.add(workspace.var(obs))
+        key = (self.genpdf, pdf_key(workspace.pdf(self.genpdf), observables),
+               self.fitpdf, pdf_key(workspace.pdf(self.fitpdf), observables),
+               self.observables, self.parameters, self.nevents, self.extended, self.seed,
+               [cmdarg_key(opt) for opt in self.genopts], [cmdarg_key(opt) for opt in self.fitopts])
+        return hashlib.md5(repr(key)).hexdigest()
+
+    def toy_seed(self, itoy) :
+        '''Get the random seed for the given toy from the hash of the study's seed and the toy's index,
+        so it doesn't depend on ntoys (never 0, which would give a random seed).'''
+        return int(hashlib.md5(repr((self.seed, itoy))).hexdigest()[:8], 16) or 1
+
+    def load_workspace(self) :
+        '''Load the saved workspace.'''
+        fws = ROOT.TFile.Open(self.workspace_file_name())
+        workspace = fws.Get(self.workspacename)
+        fws.Close()
+        if not workspace :
+            raise ValueError('File {0!r} doesn\'t contain a workspace called {1!r}!'\
+                                 .format(self.workspace_file_name(), self.workspacename))
+        return workspace
+
+    def run_toy(self, itoy) :
+        '''Generate and fit the given toy and return its row of the results table.'''
+        workspace = self.load_workspace()
+        genpdf = workspace.pdf(self.genpdf)
+        fitpdf = workspace.pdf(self.fitpdf)
+        observables = ROOT.RooArgSet()
+        for obs in self.observables :
+            observables.add(workspace.var(obs))
+        genvals = {par : workspace.var(par).getVal() for par in self.parameters}
+
+        seed = self.toy_seed(itoy)
+        ROOT.RooRandom.randomGenerator().SetSeed(seed)
+        data = genpdf.generate(observables, self.nevents, RooFit.Extended(self.extended), *self.genopts)
+        start = time.time()
+        result = fitpdf.fitTo(data, RooFit.Save(True), RooFit.PrintLevel(-1), *self.fitopts)
+        row = dict(toy = itoy, seed = seed, nevents = data.numEntries(), status = result.status(),
+                   covqual = result.covQual(), minnll = result.minNll(), fittime = time.time() - start)
+        for par in self.parameters :
+            var = workspace.var(par)
+            err = var.getError()
+            row.update({par : var.getVal(), par + '_err' : err, par + '_gen' : genvals[par],
+                        par + '_pull' : (var.getVal() - genvals[par])/err if err > 0 else float('nan')})
+        return row
+
+    def _add_result(self, row) :
+        '''Add the result of a toy to the results table.'''
+        print 'Toy', row['toy'], 'finished: status', row['status'], 'in', row['fittime'], 's'
+        self.results.add(row)
+
+    def run(self, nthreads = multiprocessing.cpu_count()) :
+        '''Run all the toys that aren't already in the results table, using at most nthreads processes,
+        and return the rows of the results table.'''
+        donekeys = self.results.done_keys()
+        todo = [itoy for itoy in xrange(self.ntoys) if not self.results.key({'toy' : itoy}) in donekeys]
+        print 'Running', len(todo), 'of', self.ntoys, 'toys'
+        # In parallel the results are recorded in the main process as each toy finishes.
+        parallel_map(lambda itoy : self.run_toy(itoy), [(itoy,) for itoy in todo], nthreads = nthreads,
+                     callback = (lambda i, row : self._add_result(row)))
+        return sorted(self.results.rows(), key = lambda row : row['toy'])
+
+    def pull_summary(self, goodfits = True) :
+        '''Get the mean and standard deviation of the pulls, and the mean bias (fitted - generated value), of
+        each parameter. If goodfits = True, only toys whose fits converged with a full accurate covariance
+        matrix are used.'''
+        rows = self.results.rows()
+        if goodfits :
+            rows = [row for row in rows if row['status'] == 0 and row['covqual'] == 3]
+        summary = {}
+        for par in self.parameters :
+            pulls = [row[par + '_pull'] for row in rows if not math.isnan(row[par + '_pull'])]
+            biases = [row[par] - row[par + '_gen'] for row in rows]
+            if not pulls :
+                summary[par] = None
+                continue
+            mean = sum(pulls)/len(pulls)
+            std = math.sqrt(sum((pull - mean)**2 for pull in pulls)/len(pulls))
+            summary[par] = {'pullmean' : mean, 'pullstd' : std, 'bias' : sum(biases)/len(biases),
+                            'ntoys' : len(pulls)}
+        return summary
@@ -1,10 +1,147 @@
 '''Functions for working with TTrees.'''
 
-import ROOT, pprint, re, random, string
+import ROOT, pprint, re, random, string, numpy, os, hashlib
 from array import array
 from AnalysisUtils.stringformula import NamedFormula, StringFormula
 from AnalysisUtils.Silence import Silence
 
+# C++ helpers for evaluating TTreeFormulas and filling TTrees from arrays without a python
+# call per entry. These are declared to the interpreter the first time they're needed.
+# Arrays of entry numbers, lengths and addresses are passed as numpy int64 arrays, so use
+# Long_t (which matches their buffer type) rather than Long64_t.
+_cpphelpers = r'''
+#include "TTree.h"
+#include "TTreeFormula.h"
+#include "TObjArray.h"
+#include "TBranch.h"
+#include "TEventList.h"
+#include "TLeaf.h"
+#include <cstring>
+#include <vector>
+
+namespace AnalysisUtils {
+
+  // Evaluate the formulae for each of the given entries, filling 'out' row-wise with
+  // nentries x nformulae values. Returns the number of entries evaluated.
+  Long64_t eval_formulae(TTree* tree, TObjArray* forms, const Long_t* entries, Long64_t nentries,
+                         double* out) {
+    const Int_t nforms = forms->GetEntriesFast();
+    for (Long64_t i = 0; i < nentries; ++i) {
+      if (tree->LoadTree(entries[i]) < 0)
+        return i;
+      for (Int_t j = 0; j < nforms; ++j) {
+        TTreeFormula* form = static_cast<TTreeFormula*>(forms->UncheckedAt(j));
+        form->GetNdata();
+        out[i * nforms + j] = form->EvalInstance();
+      }
+    }
+    return nentries;
+  }
+
+  // Evaluate all instances of the formula for each of the given entries, filling 'out' row-wise
+  // with nentries x maxlength values and 'lengths' with the number of instances for each entry.
+  Long64_t eval_formula_instances(TTree* tree, TTreeFormula* form, const Long_t* entries,
+                                  Long64_t nentries, Long64_t maxlength, double* out, Long_t* lengths) {
+    for (Long64_t i = 0; i < nentries; ++i) {
+      if (tree->LoadTree(entries[i]) < 0)
+        return i;
+      Long64_t n = form->GetNdata();
+      if (n > maxlength)
+        n = maxlength;
+      lengths[i] = n;
+      for (Long64_t j = 0; j < n; ++j)
+        out[i * maxlength + j] = form->EvalInstance(j);
+    }
+    return nentries;
+  }
+
+  // Read the values of a single-leaf branch directly for each of the given entries, copying
+  // rowsize bytes per entry to the array at address 'out' (unused elements are zero) and the
+  // number of elements to 'lengths'. The branch address is reset afterwards. Returns the number
+  // of entries read, which is less than nentries if an entry is out of range, the branch isn't
+  // found, or an entry has more elements than fit in a row.
+  Long64_t read_branch_values(TTree* tree, const char* branchname, const Long_t* entries, Long64_t nentries,
+                              Long64_t rowsize, Long_t out, Long_t* lengths) {
+    std::vector<char> buffer(rowsize);
+    char* outrows = reinterpret_cast<char*>(out);
+    TTree* current = 0;
+    TBranch* branch = 0;
+    TLeaf* leaf = 0;
+    TLeaf* countleaf = 0;
+    Long64_t i = 0;
+    for (; i < nentries; ++i) {
+      Long64_t local = tree->LoadTree(entries[i]);
+      if (local < 0)
+        break;
+      if (tree->GetTree() != current) {
+        if (branch)
+          branch->ResetAddress();
+        current = tree->GetTree();
+        branch = current->GetBranch(branchname);
+        if (!branch)
+          break;
+        leaf = static_cast<TLeaf*>(branch->GetListOfLeaves()->At(0));
+        countleaf = leaf->GetLeafCount();
+        if (!countleaf && leaf->GetLen() * leaf->GetLenType() > rowsize)
+          break;
+        branch->SetAddress(&buffer[0]);
+      }
+      std::memset(&buffer[0], 0, rowsize);
+      if (countleaf)
+        countleaf->GetBranch()->GetEntry(local);
+      if (countleaf && Long64_t(countleaf->GetValue()) * leaf->GetLenStatic() * leaf->GetLenType() > rowsize)
+        break;
+      branch->GetEntry(local);
+      lengths[i] = leaf->GetLen();
+      std::memcpy(outrows + i * rowsize, &buffer[0], rowsize);
+    }
+    if (branch)
+      branch->ResetAddress();
+    return i;
+  }
+
+  // Copy the entry numbers in the TEventList to 'out'.
+  void event_list_entries(TEventList* evtlist, Long_t* out) {
+    if (evtlist->GetN() > 0)
+      std::memcpy(out, evtlist->GetList(), evtlist->GetN() * sizeof(Long64_t));
+  }
+
+  // Add the entry numbers to the TEventList.
+  void fill_event_list(TEventList* evtlist, const Long_t* entries, Long64_t nentries) {
+    for (Long64_t i = 0; i < nentries; ++i)
+      evtlist->Enter(entries[i]);
+  }
+
+  // Copy rows from the source arrays to the branch buffers for each entry, then fill either
+  // the given branches or the whole tree if 'branches' is empty.
+  Long64_t fill_from_arrays(TTree* tree, TObjArray* branches, Long64_t nbuffers, const Long_t* buffers,
+                            const Long_t* sources, const Long_t* rowsizes, Long64_t nentries) {
+    const Int_t nbranches = branches->GetEntriesFast();
+    for (Long64_t i = 0; i < nentries; ++i) {
+      for (Long64_t j = 0; j < nbuffers; ++j)
+        std::memcpy(reinterpret_cast<char*>(buffers[j]),
+                    reinterpret_cast<const char*>(sources[j]) + i * rowsizes[j], rowsizes[j]);
+      if (nbranches == 0)
+        tree->Fill();
+      else
+        for (Int_t j = 0; j < nbranches; ++j)
+          static_cast<TBranch*>(branches->UncheckedAt(j))->Fill();
+    }
+    return nentries;
+  }
+}
+'''
+
+_declaredcpp = set()
+
+def declare_cpp(code) :
+    '''Declare the C++ code to the interpreter, if it hasn't been already.'''
+    if code in _declaredcpp :
+        return
+    if not ROOT.gInterpreter.Declare(code) :
+        raise RuntimeError('Failed to declare C++ code:\n' + code)
+    _declaredcpp.add(code)
+
 def random_string(n = 6, chars = string.ascii_uppercase + string.ascii_lowercase) :
     '''Generate a random string of length n.'''
     return ''.join(random.choice(chars) for _ in xrange(n))
@@ -20,6 +157,36 @@ def is_tfile_ok(tfile) :
         tfile.Close()
     return ok
 
+def tree_file_info(tree) :
+    '''Get a tuple identifying the TTree, the files it's read from and its friends, including the
+    size and modification time of local files, so it changes if any of the files are updated.
+    Returns None if the TTree (or any of its friends) isn't read from a file.'''
+    if isinstance(tree, ROOT.TChain) :
+        fnames = [elm.GetTitle() for elm in tree.GetListOfFiles()]
+    else :
+        tfile = tree.GetCurrentFile()
+        if not tfile :
+            return None
+        fnames = [tfile.GetName()]
+    files = []
+    for fname in fnames :
+        if os.path.exists(fname) :
+            stat = os.stat(fname)
+            files.append((os.path.abspath(fname), stat.st_size, stat.st_mtime))
+        else :
+            files.append((fname,))
+    friends = []
+    friendlist = tree.GetListOfFriends()
+    if friendlist :
+        # See copy_tree.
+        friendlist.SetBit(ROOT.kMustCleanup, False)
+        for elm in friendlist :
+            friendinfo = tree_file_info(elm.GetTree())
+            if None == friendinfo :
+                return None
+            friends.append(friendinfo)
+    return (tree.GetName(), tuple(files), tuple(friends))
+
 def make_chain(treename, *fnames, **kwargs) :
     '''Make a TChain from a tree name and a list of file names.'''
     Chain = kwargs.get('Class', ROOT.TChain)
@@ -61,83 +228,184 @@ def identifier(tree, i, *branches) :
         vals.append((branch, branchvals))
     return repr(vals)
 
-def match_trees(inputtree, extratree, outputfile, *branches) :
+def _key_widths(trees, branches) :
+    '''Get the number of elements of each of the given branches to use in the keys of all the
+    trees, and whether to include their lengths: the maximum length over the trees, and True for
+    array or variable length branches, so keys of different trees have the same columns.'''
+    widths = []
+    for branch in branches :
+        width = 1
+        isarray = False
+        for tree in trees :
+            leaf = tree.GetLeaf(branch)
+            if leaf.GetLeafCount() :
+                width = max(width, leaf.GetLeafCount().GetMaximum())
+                isarray = True
+            else :
+                width = max(width, leaf.GetLen())
+                isarray = isarray or leaf.GetLen() > 1
+        widths.append((width, isarray))
+    return widths
+
+def _key_array(tree, branches, widths = None) :
+    '''Get a 2D array with the values of all elements of the given branches for each entry in
+    the tree, as used by identifier. Array and variable length branches also include their length,
+    and are padded with zeros to the widths given by _key_widths (default those of this tree).'''
+    if widths is None :
+        widths = _key_widths([tree], branches)
+    columns = []
+    for branch, (width, isarray) in zip(branches, widths) :
+        if isarray :
+            vals, lengths = tree_array_instances(tree, branch, width)
+            columns += [lengths.astype(numpy.float64)[:,None], vals]
+        else :
+            columns.append(tree_array(tree, [branch]))
+    return numpy.hstack(columns)
+
+def _sorted_keys(keys, *extrakeys) :
+    '''Get the order that sorts the rows of keys, and whether each sorted row differs from the
+    previous one. extrakeys are used to order rows with equal keys. NaN values are equal to each
+    other (they're sorted last, so are grouped together).'''
+    order = numpy.lexsort(list(extrakeys) + [keys[:,i] for i in reversed(xrange(keys.shape[1]))])
+    sortedkeys = keys[order]
+    newkey = numpy.ones(len(keys), dtype = bool)
+    diff = (sortedkeys[1:] != sortedkeys[:-1]) & ~(numpy.isnan(sortedkeys[1:]) & numpy.isnan(sortedkeys[:-1]))
+    newkey[1:] = numpy.any(diff, axis = 1)
+    return order, newkey
+
+def match_entries(inputkeys, extrakeys) :
+    '''Get the index of the row in extrakeys that matches each row in inputkeys (both 2D arrays
+    with one row per entry and the same columns, eg, from _key_array), or -1 if there's no match.
+    The matching is done by sorting the keys together rather than with a lookup table, so the keys
+    in extrakeys must be unique. Keys are compared as numbers, so NaNs match NaNs, and 0. matches -0.'''
+    ninput = len(inputkeys)
+    nextra = len(extrakeys)
+    keys = numpy.vstack([extrakeys, inputkeys])
+    # Within equal keys, the entry from extrakeys is sorted first.
+    isinput = numpy.append(numpy.zeros(nextra, dtype = numpy.int64), numpy.ones(ninput, dtype = numpy.int64))
+    order, newkey = _sorted_keys(keys, isinput)
+    # Index of the start of the group of equal keys for each sorted row.
+    groupstart = numpy.maximum.accumulate(numpy.where(newkey, numpy.arange(len(keys)), 0))
+    firstindex = order[groupstart]
+    matched = (isinput[order] == 1) & (firstindex < nextra)
+    matches = numpy.full(ninput, -1, dtype = numpy.int64)
+    matches[order[matched] - nextra] = firstindex[matched]
+    return matches
+
+def _check_single_leaves(tree, *trees) :
+    '''Check that the branches of each of trees that aren't in tree, or in the trees before it,
+    have a single leaf, so they can be copied with _add_branches_like. Raises a ValueError
+    otherwise, before anything is written.'''
+    names = set(br.GetName() for br in tree.GetListOfBranches())
+    for othertree in trees :
+        for branch in othertree.GetListOfBranches() :
+            if branch.GetName() in names :
+                continue
+            names.add(branch.GetName())
+            if branch.GetListOfLeaves().GetEntries() != 1 :
+                raise ValueError('Branch {0!r} of TTree {1!r} has {2} leaves, only branches with a single leaf '
+                                 'can be copied!'.format(branch.GetName(), othertree.GetName(),
+                                                         branch.GetListOfLeaves().GetEntries()))
+
+def _add_branches_like(outputtree, tree) :
+    '''Add branches to outputtree with the same names and types as those in tree that aren't
+    already in outputtree. Returns a list of (new branch, buffer, original branch), where the
+    buffers are numpy arrays of the leaf types (see leaf_dtype). The branches must have a single
+    leaf (see _check_single_leaves).'''
+    outputbranches = tuple(br.GetName() for br in outputtree.GetListOfBranches())
+    newbranches = []
+    for branch in tree.GetListOfBranches() :
+        if branch.GetName() in outputbranches :
+            continue
+        leaf = branch.GetListOfLeaves().At(0)
+        leaflen = leaf.GetLen()
+        if leaf.GetLeafCount() :
+            leaflen = leaf.GetLeafCount().GetMaximum() * leaf.GetLenStatic()
+        vals = numpy.zeros(leaflen, dtype = leaf_dtype(leaf))
+        newbranch = outputtree.Branch(branch.GetName(), vals, branch.GetTitle())
+        newbranches.append((newbranch, vals, branch))
+    return newbranches
+
+def match_trees(inputtree, extratree, outputfile, *branches, **kwargs) :
     '''Add extra branches in extratree to a copy of inputtree, using the values of the branches 
     in 'branches' to match entries between the two. If an entry in inputtree doesn't have a 
-    matching entry in extratree all the extra branches are filled with -999999.'''
+    matching entry in extratree all the extra branches are filled with -999999. The entries are
+    matched by sorting their keys (see match_entries), and the extra branches are copied in chunks
+    of the 'chunksize' keyword (default 100000) entries. The keys of both trees are held in memory
+    while matching, as 8 bytes per element of the key branches (plus one per array branch) per entry.'''
 
+    chunksize = kwargs.get('chunksize', 100000)
+    widths = _key_widths([inputtree, extratree], branches)
     print 'Get entry identifiers from tree', extratree.GetName()
-    # This has the disadvantage of requiring all the identifiers to be in memory.
-    extramap = {identifier(extratree, i, *branches) : i for i in xrange(extratree.GetEntries())}
-    if len(extramap) != extratree.GetEntries() :
+    extrakeys = _key_array(extratree, branches, widths)
+    order, newkey = _sorted_keys(extrakeys)
+    nunique = numpy.count_nonzero(newkey)
+    if nunique != extratree.GetEntries() :
         raise ValueError('Identifiers aren\'t unique! Using branches {0!r} gives {1} unique \
-identifiers out of {2} entries.'.format(branches, len(extramap), extratree.GetEntries()))
+identifiers out of {2} entries.'.format(branches, nunique, extratree.GetEntries()))
+    print 'Get entry identifiers from tree', inputtree.GetName()
+    matches = match_entries(_key_array(inputtree, branches, widths), extrakeys)
+    del extrakeys
+
+    _check_single_leaves(inputtree, extratree)
     if isinstance(outputfile, str) :
         outputfile = ROOT.TFile.Open(outputfile, 'recreate')
     outputfile.cd()
     print 'Copy tree', inputtree.GetName()
     outputtree = inputtree.CopyTree('')
-    inputtreebranches = tuple(br.GetName() for br in inputtree.GetListOfBranches())
-    newbranches = []
     print 'Adding extra branches'
-    for branch in extratree.GetListOfBranches() :
-        if branch.GetName() in inputtreebranches :
-            continue
-        branchtype = branch.GetTitle().split('/')[-1].lower()
-        if branchtype in 'os' :
-            branchtype = 'i'
-        leaf = extratree.GetLeaf(branch.GetName())
-        leaflen = leaf.GetLen()
-        if leaf.GetLeafCount() :
-            leaflen = leaf.GetLeafCount().GetMaximum()
-        try :
-            vals = array(branchtype, [0] * leaflen)
-        except ValueError :
-            print branch.GetTitle()
-            raise
-        newbranch = outputtree.Branch(branch.GetName(), vals, branch.GetTitle())
-        newbranches.append((newbranch, vals, branch, leaf))
-    types = {'i' : int,
-             'f' : float,
-             'd' : float}
-    nunmatched = 0
-    unmatchedids = []
-    for i in xrange(outputtree.GetEntries()) :
-        ident = identifier(inputtree, i, *branches)
-        try :
-            j = extramap[ident]
-            for newbranch, vals, branch, leaf in newbranches :
-                branch.GetEntry(j)
-                for k in xrange(leaf.GetLen()) :
-                    vals[k] = types[vals.typecode](leaf.GetValue(k))
-                newbranch.Fill()
-        except KeyError :
-            nunmatched += 1
-            unmatchedids.append((i, ident))
-            for newbranch, vals, branch, leaf in newbranches :
-                for k in xrange(leaf.GetLen()) :
-                    vals[k] = types[vals.typecode](-999999.)
-                newbranch.Fill()
-    print 'N. unmatched', nunmatched, '/', outputtree.GetEntries()
-    if unmatchedids :
+    newbranches = _add_branches_like(outputtree, extratree)
+
+    unmatched = numpy.flatnonzero(matches < 0)
+    for ifirst in xrange(0, len(matches), chunksize) :
+        chunkmatches = matches[ifirst:ifirst + chunksize]
+        matched = numpy.flatnonzero(chunkmatches >= 0)
+        # Read the matched entries from extratree in entry order.
+        readorder = matched[numpy.argsort(chunkmatches[matched], kind = 'mergesort')]
+        arrays = []
+        for newbranch, vals, branch in newbranches :
+            branchvals = numpy.full((len(chunkmatches), len(vals)), -999999).astype(vals.dtype)
+            branchvals[readorder] = tree_branch_values(extratree, branch.GetName(), len(vals),
+                                                       entries = chunkmatches[readorder])[0]
+            arrays.append(branchvals)
+        fill_tree_from_arrays(outputtree, [vals for newbranch, vals, branch in newbranches], arrays,
+                              branches = [newbranch for newbranch, vals, branch in newbranches])
+    print 'N. unmatched', len(unmatched), '/', outputtree.GetEntries()
+    if len(unmatched) > 0 :
+        unmatchedids = [(i, identifier(inputtree, i, *branches)) for i in unmatched]
         with open('unmatched-ids.txt', 'w') as f :
             f.write(pprint.pformat(unmatchedids) + '\n')
     outputtree.Write()
     outputfile.Close()
 
-def merge_trees(outputfile, tree1, tree2, *trees) :
-    '''Merge the given TTrees into a singla tree with all the branches and write it to the given file.'''
-    outputfile.cd()
+def merge_trees(outputfile, tree1, tree2, *trees, **kwargs) :
+    '''Merge the given TTrees into a single tree with all the branches and write it to the given file.
+    The TTrees must have the same number of entries. tree1 is copied, then the branches of the other
+    TTrees that aren't already in the output are added, copying the values in chunks of the
+    'chunksize' keyword (default 100000) entries. Returns the merged tree.'''
+    chunksize = kwargs.get('chunksize', 100000)
     trees = (tree2,) + trees
+    nentries = tree1.GetEntries()
+    for tree in trees :
+        if tree.GetEntries() != nentries :
+            raise ValueError('TTree {0!r} has {1} entries, but TTree {2!r} has {3}!'\
+                             .format(tree.GetName(), tree.GetEntries(), tree1.GetName(), nentries))
+    _check_single_leaves(tree1, *trees)
+    outputfile.cd()
     outputtree = tree1.CopyTree("")
     for tree in trees :
-        cptree = tree.CopyTree("")
-        for branch in cptree.GetListOfBranches() :
-            branch.SetTree(outputtree)
-            outputtree.GetListOfBranches().Add(branch)
-            outputtree.GetListOfLeaves().Add(branch.GetLeaf(branch.GetName()))
-            cptree.GetListOfBranches().Remove(branch)
+        newbranches = _add_branches_like(outputtree, tree)
+        if not newbranches :
+            continue
+        buffers = [vals for newbranch, vals, branch in newbranches]
+        outbranches = [newbranch for newbranch, vals, branch in newbranches]
+        for ifirst in xrange(0, nentries, chunksize) :
+            entries = numpy.arange(ifirst, min(ifirst + chunksize, nentries), dtype = numpy.int64)
+            arrays = [tree_branch_values(tree, branch.GetName(), len(vals), entries = entries)[0]
+                      for newbranch, vals, branch in newbranches]
+            fill_tree_from_arrays(outputtree, buffers, arrays, branches = outbranches)
     outputtree.Write()
+    return outputtree
 
 def merge_trees_to_file(outputfname, tree1Names, tree2Names, *treeNames) :
     '''Create the file then merge the TTrees into it.'''
@@ -468,6 +736,198 @@ def tree_mean(tree, formula, selection = None, weight = None) :
         err *= (ncand/neff)**.5
     return mean, err
 
+def event_list_entries(evtlist) :
+    '''Get the entry numbers in a TEventList as a numpy array.'''
+    entries = numpy.zeros(evtlist.GetN(), dtype = numpy.int64)
+    if len(entries) > 0 :
+        declare_cpp(_cpphelpers)
+        ROOT.AnalysisUtils.event_list_entries(evtlist, entries)
+    return entries
+
+def tree_entries(tree, selection = None) :
+    '''Get the entry numbers in the TTree as a numpy array, optionally only for entries passing
+    the selection. The selection can either be a string or a TEventList.'''
+    if not selection :
+        return numpy.arange(tree.GetEntries(), dtype = numpy.int64)
+    if isinstance(selection, str) :
+        selection = get_event_list(tree, selection)
+    return event_list_entries(selection)
+
+def _formula_array(tree, formulae) :
+    '''Get the TreeFormulas for the given formulae (strings, NamedFormulas or TreeFormulas) and a
+    TObjArray of their TTreeFormulas. The TreeFormulas need to be kept alive while the
+    TObjArray is in use.'''
+    forms = []
+    for formula in formulae :
+        form = make_treeformula('arrayform', formula, tree, 9)
+        if not isinstance(form, TreeFormula) :
+            raise TypeError('Can only evaluate string formulae or TreeFormulas, got {0!r}'.format(formula))
+        if not form.is_ok() :
+            raise ValueError('Failed to compile formula {0!r} on TTree {1!r}'.format(form.form.GetTitle(),
+                                                                                     tree.GetName()))
+        forms.append(form)
+    formarr = ROOT.TObjArray()
+    for form in forms :
+        formarr.Add(form.form)
+    return forms, formarr
+
+def _eval_formulae(tree, formarr, entries) :
+    '''Evaluate the TTreeFormulas in the TObjArray for the given entries.'''
+    entries = numpy.ascontiguousarray(entries, dtype = numpy.int64)
+    values = numpy.zeros((len(entries), formarr.GetEntriesFast()))
+    if len(entries) == 0 or values.shape[1] == 0 :
+        return values
+    declare_cpp(_cpphelpers)
+    n = ROOT.AnalysisUtils.eval_formulae(tree, formarr, entries, len(entries), values)
+    if n != len(entries) :
+        raise IndexError('Entry {0} is out of range for TTree {1!r}'.format(entries[n], tree.GetName()))
+    return values
+
+def tree_array(tree, formulae, selection = None, entries = None) :
+    '''Evaluate the formulae for entries in the TTree and return the values as a 2D numpy array
+    with one row per entry and one column per formula. The entries used can either be given
+    as a sequence of entry numbers, or are the entries passing the selection (a string or a
+    TEventList), or else all entries. As for TreeFormula, only the first instance of array
+    formulae is used (see tree_array_instances).'''
+    if entries is None :
+        entries = tree_entries(tree, selection)
+    forms, formarr = _formula_array(tree, formulae)
+    return _eval_formulae(tree, formarr, entries)
+
+def tree_array_chunks(tree, formulae, selection = None, entries = None, chunksize = 100000) :
+    '''Iterator over chunks of the TTree, yielding the entry numbers in each chunk and the
+    2D array of the formulae values for those entries. The arguments are as for tree_array.
+    This avoids holding the values for the whole TTree in memory.'''
+    if entries is None :
+        entries = tree_entries(tree, selection)
+    forms, formarr = _formula_array(tree, formulae)
+    for ifirst in xrange(0, len(entries), chunksize) :
+        chunk = entries[ifirst:ifirst + chunksize]
+        yield chunk, _eval_formulae(tree, formarr, chunk)
+
+def tree_array_instances(tree, formula, maxlength, selection = None, entries = None) :
+    '''Evaluate all instances of an array formula for entries in the TTree. Returns a 2D array
+    of shape (number of entries, maxlength), and an array of the number of instances for each
+    entry. Instances beyond maxlength are dropped, and unused elements are zero. The other
+    arguments are as for tree_array.'''
+    if entries is None :
+        entries = tree_entries(tree, selection)
+    entries = numpy.ascontiguousarray(entries, dtype = numpy.int64)
+    (form,), formarr = _formula_array(tree, [formula])
+    values = numpy.zeros((len(entries), maxlength))
+    lengths = numpy.zeros(len(entries), dtype = numpy.int64)
+    if len(entries) == 0 or maxlength == 0 :
+        return values, lengths
+    declare_cpp(_cpphelpers)
+    n = ROOT.AnalysisUtils.eval_formula_instances(tree, form.form, entries, len(entries), maxlength,
+                                                  values, lengths)
+    if n != len(entries) :
+        raise IndexError('Entry {0} is out of range for TTree {1!r}'.format(entries[n], tree.GetName()))
+    return values, lengths
+
+# numpy dtypes of the values of TLeafs, by their type names.
+_leafdtypes = {'Char_t' : numpy.int8, 'UChar_t' : numpy.uint8, 'Short_t' : numpy.int16, 'UShort_t' : numpy.uint16,
+               'Int_t' : numpy.int32, 'UInt_t' : numpy.uint32, 'Long64_t' : numpy.int64, 'ULong64_t' : numpy.uint64,
+               'Long_t' : numpy.int64, 'ULong_t' : numpy.uint64, 'Float_t' : numpy.float32,
+               'Float16_t' : numpy.float32, 'Double_t' : numpy.float64, 'Double32_t' : numpy.float64,
+               'Bool_t' : numpy.bool_}
+
+def leaf_dtype(leaf) :
+    '''Get the numpy dtype of the values of a TLeaf.'''
+    try :
+        return numpy.dtype(_leafdtypes[leaf.GetTypeName()])
+    except KeyError :
+        raise ValueError('Unsupported type {0!r} of leaf {1!r}'.format(leaf.GetTypeName(), leaf.GetName()))
+
+def tree_branch_values(tree, branchname, maxlength, entries = None) :
+    '''Read the values of a branch with a single leaf for the given entries (default all) directly,
+    rather than via TTreeFormula, so they keep the type of the leaf (see leaf_dtype) and, eg, 64-bit
+    integers are exact. Returns a 2D array of shape (number of entries, maxlength), with unused
+    elements zero, and an array of the number of elements for each entry. The branch's address
+    is reset afterwards.'''
+    leaves = tree.GetBranch(branchname).GetListOfLeaves()
+    if leaves.GetEntries() != 1 :
+        raise ValueError('Branch {0!r} of TTree {1!r} has {2} leaves, only branches with a single leaf '
+                         'can be read!'.format(branchname, tree.GetName(), leaves.GetEntries()))
+    dtype = leaf_dtype(leaves.At(0))
+    if entries is None :
+        entries = numpy.arange(tree.GetEntries(), dtype = numpy.int64)
+    entries = numpy.ascontiguousarray(entries, dtype = numpy.int64)
+    values = numpy.zeros((len(entries), maxlength), dtype = dtype)
+    lengths = numpy.zeros(len(entries), dtype = numpy.int64)
+    if len(entries) == 0 or maxlength == 0 :
+        return values, lengths
+    declare_cpp(_cpphelpers)
+    n = ROOT.AnalysisUtils.read_branch_values(tree, branchname, entries, len(entries), maxlength * dtype.itemsize,
+                                              values.ctypes.data, lengths)
+    if n != len(entries) :
+        raise IndexError('Failed to read branch {0!r} of TTree {1!r} for entry {2}: it\'s out of range or has more '
+                         'than {3} elements'.format(branchname, tree.GetName(), entries[n], maxlength))
+    return values, lengths
+
+def tree_ranges(tree, formulae, selection = None, quantile = None, chunksize = 100000) :
+    '''Get the (min, max) of each of the formulae over the TTree in a single pass, optionally only
+    for entries passing the selection. If quantile is given, the quantile and 1 - quantile values
+    are returned instead of the min and max, which requires holding all the values in memory.
+    Formulae with no values in range give (inf, -inf).'''
+    nforms = len(formulae)
+    mins = numpy.full(nforms, numpy.inf)
+    maxs = numpy.full(nforms, -numpy.inf)
+    chunks = []
+    for entries, values in tree_array_chunks(tree, formulae, selection, chunksize = chunksize) :
+        if quantile :
+            chunks.append(values)
+        elif len(values) > 0 :
+            mins = numpy.minimum(mins, values.min(axis = 0))
+            maxs = numpy.maximum(maxs, values.max(axis = 0))
+    if quantile and chunks :
+        values = numpy.concatenate(chunks)
+        if len(values) > 0 :
+            mins, maxs = numpy.percentile(values, [100. * quantile, 100. * (1. - quantile)], axis = 0)
+    return [(float(vmin), float(vmax)) for vmin, vmax in zip(mins, maxs)]
+
+def fill_tree_from_arrays(tree, buffers, arrays, branches = ()) :
+    '''Fill the TTree with values from arrays. 'buffers' are the arrays (array.arrays or numpy
+    arrays) whose addresses are used by the branches being filled, eg, TreeBranchAdder.values, and
+    'arrays' are the corresponding arrays of values, with one row per entry. Each row is copied
+    to the corresponding buffer, then the given branches are filled, or the whole TTree if no
+    branches are given. Returns the number of entries filled.'''
+    nentries = None
+    addresses = []
+    sources = []
+    rowsizes = []
+    keep = []
+    for buf, vals in zip(buffers, arrays) :
+        if isinstance(buf, array) :
+            address, length = buf.buffer_info()
+            dtype = numpy.dtype(buf.typecode)
+        else :
+            address, length, dtype = buf.ctypes.data, buf.size, buf.dtype
+        vals = numpy.ascontiguousarray(vals, dtype = dtype)
+        if vals.ndim == 1 :
+            vals = vals[:, numpy.newaxis]
+        if vals.shape[1] > length :
+            raise ValueError('Rows of length {0} are too long for a buffer of length {1}'.format(vals.shape[1],
+                                                                                                   length))
+        if nentries is None :
+            nentries = len(vals)
+        elif len(vals) != nentries :
+            raise ValueError('Arrays have different numbers of entries: {0} and {1}'.format(nentries, len(vals)))
+        keep.append(vals)
+        addresses.append(address)
+        sources.append(vals.ctypes.data)
+        rowsizes.append(vals.shape[1] * dtype.itemsize)
+    if not nentries :
+        return 0
+    branchlist = ROOT.TObjArray()
+    for branch in branches :
+        branchlist.Add(branch)
+    declare_cpp(_cpphelpers)
+    return ROOT.AnalysisUtils.fill_from_arrays(tree, branchlist, len(addresses),
+                                               numpy.array(addresses, dtype = numpy.int64),
+                                               numpy.array(sources, dtype = numpy.int64),
+                                               numpy.array(rowsizes, dtype = numpy.int64), nentries)
+
 def get_event_list(tree, selection, setlist = False, listname = '') :
     '''Get the TEventList of entries that pass the selection. If setlist = True, the TTree's
     event list is set to this.'''
@@ -487,38 +947,62 @@ def get_event_list(tree, selection, setlist = False, listname = '') :
         tree.SetNotify(notify)
     return evtlist
 
+def make_event_list(entries, listname) :
+    '''Make a TEventList with the given entry numbers.'''
+    declare_cpp(_cpphelpers)
+    entries = numpy.ascontiguousarray(entries, dtype = numpy.int64)
+    evtlist = ROOT.TEventList(listname)
+    if len(entries) > 0 :
+        ROOT.AnalysisUtils.fill_event_list(evtlist, entries, len(entries))
+    return evtlist
+
+def get_unique_entries(tree, seedoffset = 0, checkbranches = ('eventNumber', 'runNumber'), selection = None) :
+    '''Get a sorted array of the entry numbers of one entry per event from the given tree (see
+    get_unique_events). Candidates from the same event don't need to be in consecutive entries.'''
+    entries = tree_entries(tree, selection)
+    checkvals = tree_array(tree, checkbranches, entries = entries)
+    if len(entries) == 0 :
+        return entries
+    # Sort by the check values, keeping candidates in the same event in entry order.
+    order = numpy.lexsort([entries] + [checkvals[:,i] for i in reversed(xrange(checkvals.shape[1]))])
+    checkvals = checkvals[order]
+    entries = entries[order]
+    newevent = numpy.ones(len(entries), dtype = bool)
+    newevent[1:] = numpy.any(checkvals[1:] != checkvals[:-1], axis = 1)
+    starts = numpy.flatnonzero(newevent)
+    counts = numpy.diff(numpy.append(starts, len(entries)))
+    picks = starts.copy()
+    rndm = ROOT.TRandom3()
+    for igroup in numpy.flatnonzero(counts > 1) :
+        start = starts[igroup]
+        rndm.SetSeed(long(''.join(map(lambda v : str(int(v)), checkvals[start]))) + seedoffset)
+        picks[igroup] = start + int(rndm.Rndm()*counts[igroup])
+    return numpy.sort(entries[picks])
+
+def _unique_entries_cache(tree, seedoffset, checkbranches, selection) :
+    '''Function for caching the unique entries of a tree.'''
+    return {'entries' : get_unique_entries(tree, seedoffset, checkbranches, selection)}
+
 def get_unique_events(tree, listname = None, seedoffset = 0, setlist = False,
-                      checkbranches = ('eventNumber', 'runNumber'), selection = None) :
+                      checkbranches = ('eventNumber', 'runNumber'), selection = None, usecache = False) :
     '''Get one entry per event from the given tree. When there's more than one with the same
     event number, events are picked at random using 
-    int(str(eventNumber) + str(runNumber)) + seedoffset as seed. Note that the algorithm
-    assumes that candidates in the same event are in consecutive entries in the TTree.'''
+    int(str(eventNumber) + str(runNumber)) + seedoffset as seed. Candidates from the same event
+    don't need to be in consecutive entries in the TTree. If usecache = True and the tree is a
+    DataChain, the selected entries are cached using a DataCache (if the selection is a string).
+    Note that previous versions skipped the first candidate of every event after the first when
+    picking, and dropped the last event, so the entries picked for most events with more than one
+    candidate are different to those from previous versions, even with the same seeds.'''
 
-    nentries = tree.GetEntries()
-    checker = TreeFormulaList(tree, *checkbranches)
-    rndm = ROOT.TRandom3()
     if not listname :
         listname = tree.GetName() + '_uniqueevtlist_' + random_string()
-    evtlist = ROOT.TEventList(listname)
-    treeloop = tree_loop(tree, selection)
-    while True :
-        try :
-            ievt = treeloop.next()
-            checkvals = checker()
-            nextvals = list(checkvals)
-            evts = []
-            while nextvals == checkvals :
-                evts.append(ievt)
-                ievt = treeloop.next()
-                nextvals = checker()
-            if len(evts) == 1 :
-                evtlist.Enter(evts[0])
-                continue
-            rndm.SetSeed(long(''.join(map(lambda v : str(int(v)), checkvals))) + seedoffset)
-            ival = int(rndm.Rndm()*len(evts))
-            evtlist.Enter(evts[ival])
-        except StopIteration :
-            break
+    if usecache and hasattr(tree, 'get_cache') and not isinstance(selection, ROOT.TEventList) :
+        args = (seedoffset, tuple(checkbranches), selection)
+        name = 'UniqueEntries_' + hashlib.md5(repr(args)).hexdigest()
+        entries = tree.get_cache(name, ['entries'], _unique_entries_cache, args = args).entries
+    else :
+        entries = get_unique_entries(tree, seedoffset, checkbranches, selection)
+    evtlist = make_event_list(entries, listname)
     if setlist :
         tree.SetEventList(evtlist)
     return evtlist
@@ -527,10 +1011,11 @@ class TreeBranchAdder(object) :
     '''Add a branch to a TTree.'''
 
     def __init__(self, tree, name, function, type = 'f', length = 1, maxlength = 1, args = (), kwargs = {},
-                 filllength = True) :
+                 filllength = True, columns = None) :
         '''tree: the TTree to add the branch to.
         name: name of the branch.
         function: must return a list of values for the branch when called. It will be passed *args and **kwargs.
+          If 'columns' is given, it's called in array mode (see array_values).
         type: data type of the branch.
         length: length of the branch. If a string, the branch is variable length and the string is used as
           the name of the length branch.
@@ -538,11 +1023,13 @@ class TreeBranchAdder(object) :
         args: args to be passed to function.
         kwargs: kwrags to be passed to function.
         filllength: whether to fill the length branch or not.
+        columns: list of formulae on the input TTree. If given, the branch is filled in array mode: the function
+          is passed a 2D array of the values of the columns for a chunk of entries, followed by *args and
+          **kwargs, and returns the values of the branch for each entry (see array_values).
         '''
 
         self.tree = tree
         self.name = name
-        self.values = array(type, [0] * maxlength)
         self.type = type
         # Variable length, given the name of the length branch as length variable.
         if isinstance(length, str) and filllength:
@@ -551,16 +1038,24 @@ class TreeBranchAdder(object) :
             self.fill_length = lambda : self.length.fill()
         # Fixed length.
         else :
-            maxlength = max(length, maxlength)
+            # If length is the name of a length branch that's filled elsewhere, maxlength is as given.
+            if not isinstance(length, str) :
+                maxlength = max(length, maxlength)
             self.length = length
             self.set_length = lambda : True
             self.fill_length = lambda : True
         self.maxlength = maxlength
+        # Allocated once maxlength is known, as it can be increased by length.
+        self.values = array(type, [0] * maxlength)
         self.function = function
         self.args = tuple(args)
         self.kwargs = dict(kwargs)
+        self.columns = list(columns) if columns else None
+        self.filllength = filllength
+        # If the length branch is filled by this adder, the leaflist uses its name.
+        lengthname = self.length.name if isinstance(self.length, TreeBranchAdder) else self.length
         self.branch = tree.Branch(self.name, self.values,
-                                  '{0}[{1}]/{2}'.format(self.name, self.length, self.type.upper()))
+                                  '{0}[{1}]/{2}'.format(self.name, lengthname, self.type.upper()))
 
     @staticmethod
     def copy_branch(tree, branchname, treeout, function, args = (), kwargs = {}, filllength = True) :
@@ -590,6 +1085,49 @@ class TreeBranchAdder(object) :
         self.branch.Fill()
         self.fill_length()
 
+    def array_values(self, colvals) :
+        '''Call the function in array mode with the 2D array of the values of the columns for a chunk of
+        entries. For fixed length branches, the function should return a 1D array of values, or a 2D
+        array with one row per entry. For variable length branches whose length branch is filled by this
+        adder, it should return a 2D array of values with one row per entry and an array of the lengths.
+        Returns lists of the buffers of the branches to be filled and the corresponding arrays of
+        values, to be passed to fill_tree_from_arrays.'''
+        vals = self.function(colvals, *self.args, **self.kwargs)
+        if not (isinstance(self.length, TreeBranchAdder) and self.filllength) :
+            vals = numpy.asarray(vals)
+            if vals.ndim > 1 :
+                vals = vals[:, :self.maxlength]
+            return [self.values], [vals]
+        vals, lengths = vals
+        vals = numpy.asarray(vals)
+        if vals.ndim == 1 :
+            vals = vals[:, numpy.newaxis]
+        return [self.values, self.length.values], [vals[:, :self.maxlength],
+                                                   numpy.minimum(lengths, self.maxlength)]
+
+def fill_branch_adders(intree, treeout, adders, selection = None, entries = None, chunksize = 100000) :
+    '''Fill treeout using TreeBranchAdders in array mode (with 'columns' given), in chunks of
+    entries of intree. All the adders' columns are evaluated together. The entries used are
+    as for tree_array. Returns the number of entries filled.'''
+    formulae = []
+    slices = []
+    for adder in adders :
+        if adder.columns is None :
+            raise ValueError('TreeBranchAdder {0!r} isn\'t in array mode!'.format(adder.name))
+        slices.append(slice(len(formulae), len(formulae) + len(adder.columns)))
+        formulae += adder.columns
+    nfilled = 0
+    for chunk, colvals in tree_array_chunks(intree, formulae, selection = selection, entries = entries,
+                                            chunksize = chunksize) :
+        buffers = []
+        arrays = []
+        for adder, colslice in zip(adders, slices) :
+            adderbuffers, adderarrays = adder.array_values(colvals[:, colslice])
+            buffers += adderbuffers
+            arrays += adderarrays
+        nfilled += fill_tree_from_arrays(treeout, buffers, arrays)
+    return nfilled
+
 def search_branches(tree, pattern1, *patterns) :
     '''Return branch names in the given TTree that match any of the given patterns.'''
     patterns = (pattern1,) + patterns
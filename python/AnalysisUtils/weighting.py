@@ -1,10 +1,12 @@
 '''Tools for weighting TTrees.'''
 
 from __future__ import print_function
-import ROOT, os
+import ROOT, os, numpy, multiprocessing
 from AnalysisUtils.selection import AND, OR
 from AnalysisUtils.Silence import Silence
 from AnalysisUtils.fit import normalised_exp_TF1
+from AnalysisUtils.treeutils import tree_entries, tree_array, tree_array_chunks
+from AnalysisUtils.parallel import parallel_map
 
 def efficiency_weight(var):
     '''Get a weight that's 1/var.'''
@@ -55,77 +57,183 @@ def fit_expo(h, opt = 'QS'):
         return None, None
     return expo.GetParameter(1), expo.GetParError(1)
 
+def fill_validation_histos(tree, variables, names, weight = None, chunksize = 100000):
+    '''Fill histos of all the variables for entries in the tree passing its selection in a single pass,
+    using the selection, times the weight if given, as the weight for each entry. 'names' are the names
+    of the histos. Returns a dict of the histos by name, plus the sum of the selection values
+    ('sumselection'), the sum of the selection times the weight ('sumweights') and the number of entries
+    with zero weight ('nzeroweights').'''
+    variables = [tree.variables.get_var(var) for var in variables]
+    selection = tree.get_selection()
+    formulae = [selection if selection else '1', weight if weight else '1'] + [var.formula for var in variables]
+    histos = []
+    for var, name in zip(variables, names):
+        h = tree.variables.histo(var, name = name)
+        h.SetDirectory(None)
+        histos.append(h)
+    vals = {'sumselection' : 0., 'sumweights' : 0., 'nzeroweights' : 0}
+    for entries, values in tree_array_chunks(tree, formulae, selection, chunksize = chunksize):
+        weights = values[:, 0] * values[:, 1]
+        vals['sumselection'] += values[:, 0].sum()
+        vals['sumweights'] += weights.sum()
+        vals['nzeroweights'] += int((values[:, 1] == 0.).sum())
+        for i, h in enumerate(histos):
+            if len(entries) > 0:
+                h.FillN(len(entries), numpy.ascontiguousarray(values[:, i + 2]), weights)
+    for h in histos:
+        vals[h.GetName()] = h
+    return vals
+
+def _ratio_plot(name, hunb, hweighted, var, outputdir, chi2opt):
+    '''Make the ratio plot of the original and weighted histos and save it to the outputdir. If the
+    variable is a decay time, also fit an exponential to both. Returns the TRatioPlot and a dict of
+    the results.'''
+    for h in hunb, hweighted:
+        h.SetLineWidth(3)
+        h.SetStats(False)
+    hunb.SetLineColor(ROOT.kBlack)
+    hweighted.SetLineColor(ROOT.kRed)
+    canv = ROOT.TCanvas(name + '_canv')
+    with Silence():
+        ratio = ROOT.TRatioPlot(hweighted, hunb)
+        ratio.SetH1DrawOpt('E')
+        ratio.Draw()
+    ratio.GetUpperPad().SetLogy()
+    box = chi2box(hunb, hweighted, chi2opt)
+    results = {'chi2text' : box.GetLine(0).GetTitle()}
+    canv.SaveAs(os.path.join(outputdir, name + '_corrected_ratio.pdf'))
+    if 'time' in var.name:
+        unbtau, unbtauerr = fit_expo(hunb)
+        tau, tauerr = fit_expo(hweighted)
+        if None != unbtau and None != tau:
+            results['tau'] = tau
+            results['tauerr'] = tauerr
+            results['delta'] = tau - unbtau
+            results['deltaerr'] = (unbtauerr**2 + tauerr**2)**.5
+    return ratio, results
+
+def _render_ratio_plot(name, hunb, hweighted, var, outputdir, chi2opt):
+    '''Make a ratio plot in a worker process, returning only the results.'''
+    ROOT.gROOT.SetBatch(True)
+    return _ratio_plot(name, hunb, hweighted, var, outputdir, chi2opt)[1]
+
+def _print_ratio_results(name, results):
+    '''Print the results of a ratio plot.'''
+    print(name, results['chi2text'])
+    if 'tau' in results:
+        print('Tau = {0:.3f} +/- {1:.3f} ps, dTau = {2:.1f} +/- {3:.1f} fs ({4:.2f} sigma)'\
+            .format(results['tau'], results['tauerr'], results['delta']*1000., results['deltaerr']*1000.,
+                    results['delta']/results['deltaerr']))
+
 def validate_weighting(originaltree, weightedtree, name, weight, variables, outputdir,
-                       originalname = '', updateoriginal = False, updateweighted = False, chi2opt = 'UW'):
-    '''Compare distributions in originaltree to the weighted distributions in weightedtree.'''
-    zerocache = weightedtree.get_cache(name + '_ZeroWeights',
-                                       ['noriginal', 'nweighted', 'sumweights', 'nzeroweights'],
-                                       count_zero_weights, args = (weight, originaltree),
-                                       update = (updateweighted or updateoriginal), variables = [weight])
-    globalweight = zerocache.noriginal/zerocache.sumweights
-    print('{0}: N. entries with zero weight: {1} ({2:.2f}%)'.format(name, zerocache.nzeroweights,
-                                                                    100.*zerocache.nzeroweights/zerocache.nweighted))
-    selection = weightedtree.get_selection(weight = weight)
-    selection = weightedtree.get_selection(selection = selection, weight = str(globalweight))
+                       originalname = '', updateoriginal = False, updateweighted = False, chi2opt = 'UW',
+                       singlepass = False, nthreads = 1):
+    '''Compare distributions in originaltree to the weighted distributions in weightedtree.
+    If singlepass = True, the histos of all variables and the zero weight statistics are filled in one
+    pass over each tree (and cached together), rather than one TTree::Draw per histo. If nthreads > 1,
+    the plots and fits are made in parallel in separate processes, in which case the TRatioPlots
+    aren't returned, so the returned dict of ratios is empty.'''
+    variables = [weightedtree.variables.get_var(var) for var in variables]
+    originalnames = [originalname + var.name for var in variables]
+    weightednames = [name + '_' + var.name for var in variables]
     caches = {}
-    ratios = {}
-    canv = ROOT.TCanvas()
-    for var in variables:
-        _name = name + '_' + var.name
-        originalcache = originaltree.histo_cache(var, update = updateoriginal, name = originalname + var.name)
+    if singlepass:
+        originalcache = originaltree.get_cache(originalname + 'ValidationHistos',
+                                               originalnames + ['sumselection', 'sumweights', 'nzeroweights'],
+                                               fill_validation_histos, args = (variables, originalnames),
+                                               update = updateoriginal, variables = variables)
+        weightedcache = weightedtree.get_cache(name + '_ValidationHistos',
+                                               weightednames + ['sumselection', 'sumweights', 'nzeroweights'],
+                                               fill_validation_histos, args = (variables, weightednames, weight),
+                                               update = (updateweighted or updateoriginal),
+                                               variables = variables + [weight])
         caches[originalcache.name] = originalcache
-        cache = weightedtree.histo_cache(var, selection = selection, name = _name, update = updateweighted)
-        caches[cache.name] = cache
-        hunb = originalcache.get(0)
-        hweighted = cache.get(0)
-        for h in hunb, hweighted:
-            h.SetLineWidth(3)
-            h.SetStats(False)
-        hunb.SetLineColor(ROOT.kBlack)
-        hweighted.SetLineColor(ROOT.kRed)
-        with Silence():
-            ratio = ROOT.TRatioPlot(hweighted, hunb)
-            ratio.SetH1DrawOpt('E')
-            ratio.Draw()
-        ratio.GetUpperPad().SetLogy()
-        box = chi2box(hunb, hweighted, chi2opt)
-        print(_name, box.GetLine(0).GetTitle())
-        canv.SaveAs(os.path.join(outputdir, _name + '_corrected_ratio.pdf'))
-        if 'time' in var.name:
-            unbtau, unbtauerr = fit_expo(hunb)
-            tau, tauerr = fit_expo(hweighted)
-            delta = tau - unbtau
-            deltaerr = (unbtauerr**2 + tauerr**2)**.5
-            sigma = delta/deltaerr
-            print('Tau = {0:.3f} +/- {1:.3f} ps, dTau = {2:.1f} +/- {3:.1f} fs ({4:.2f} sigma)'\
-                .format(tau, tauerr, delta*1000., deltaerr*1000., sigma))
-        ratios[_name] = ratio
+        caches[weightedcache.name] = weightedcache
+        zerovals = dict(noriginal = originalcache.sumselection, nweighted = weightedcache.sumselection,
+                        sumweights = weightedcache.sumweights, nzeroweights = weightedcache.nzeroweights)
+    else:
+        zerocache = weightedtree.get_cache(name + '_ZeroWeights',
+                                           ['noriginal', 'nweighted', 'sumweights', 'nzeroweights'],
+                                           count_zero_weights, args = (weight, originaltree),
+                                           update = (updateweighted or updateoriginal), variables = [weight])
+        zerovals = dict((attr, getattr(zerocache, attr)) for attr in ('noriginal', 'nweighted', 'sumweights', 
+                                                                      'nzeroweights'))
+    globalweight = zerovals['noriginal']/zerovals['sumweights']
+    print('{0}: N. entries with zero weight: {1} ({2:.2f}%)'.format(name, zerovals['nzeroweights'],
+                                                                    100.*zerovals['nzeroweights']/zerovals['nweighted']))
+    histos = []
+    if singlepass:
+        for var, oname, wname in zip(variables, originalnames, weightednames):
+            hweighted = weightedcache.get(wname).Clone()
+            hweighted.SetDirectory(None)
+            hweighted.Scale(globalweight)
+            histos.append((originalcache.get(oname), hweighted))
+    else:
+        selection = weightedtree.get_selection(weight = weight)
+        selection = weightedtree.get_selection(selection = selection, weight = str(globalweight))
+        for var, oname, wname in zip(variables, originalnames, weightednames):
+            originalcache = originaltree.histo_cache(var, update = updateoriginal, name = oname)
+            caches[originalcache.name] = originalcache
+            cache = weightedtree.histo_cache(var, selection = selection, name = wname, update = updateweighted)
+            caches[cache.name] = cache
+            histos.append((originalcache.get(0), cache.get(0)))
+
+    ratios = {}
+    plotargs = [(weightedname, hunb, hweighted, var, outputdir, chi2opt) \
+                    for weightedname, var, (hunb, hweighted) in zip(weightednames, variables, histos)]
+    if nthreads > 1:
+        results = parallel_map(_render_ratio_plot, plotargs, nthreads = nthreads)
+    else:
+        results = []
+        for args in plotargs:
+            ratio, result = _ratio_plot(*args)
+            ratios[args[0]] = ratio
+            results.append(result)
+    for weightedname, result in zip(weightednames, results):
+        _print_ratio_results(weightedname, result)
     return caches, ratios
 
 def get_weights_and_vals(tree, variables, n = None):
-    '''Get weights (from the selection) and values of the variables from the tree.'''
-    weightvar = tree.selection_functor()
-    varlist = tree.get_functor_list(variables)
-    weights = []
-    vals = []
-    if None == n:
-        for i in tree:
-            weights.append(weightvar())
-            vals.append(vals())
-    else:
-        j = 0
-        for i in tree:
-            weights.append(weightvar())
-            vals.append(varlist())
-            j += 1
-            if j >= n:
-                break
-    return weights, vals
-    
-def gbreweight(weighttree, originaltree, name, variables, n = None):
+    '''Get weights (from the selection) and values of the variables from the tree, for entries
+    passing the selection, optionally only for the first n of them. Returns a 1D array of the
+    weights and a 2D array of the values, with one row per entry.'''
+    selection = tree.get_selection()
+    entries = tree_entries(tree, selection)
+    if None != n:
+        entries = entries[:n]
+    values = tree_array(tree, [selection if selection else '1'] + tree.variable_formulae(variables),
+                        entries = entries)
+    return values[:, 0], values[:, 1:]
+
+def _weights_and_products(values, function):
+    '''Array-mode function for add_weights_friend: the first column of values is the existing weight
+    and the rest are the variables. Returns rows of the new weight and its product with the existing weight.'''
+    weights = numpy.asarray(function(values[:, 1:]), dtype = numpy.float64)
+    return numpy.column_stack([weights, weights * values[:, 0]])
+
+def add_weights_friend(weighttree, name, variables, function, chunksize = 100000, perfile = False,
+                       nthreads = multiprocessing.cpu_count()):
+    '''Add a friend to weighttree with branch named 'name' of length 2: the first element is the weight,
+    the second is the product of that weight with any existing weight used for the weighttree (from the
+    selection). The tree is processed in chunks of chunksize entries: 'function' is called with the 2D
+    array of the values of the variables for the chunk, and should return the array of weights. If 
+    perfile = True, one friend file is written per file of weighttree, using up to nthreads
+    processes in parallel (see DataChain.add_friend_tree).'''
+    selection = weighttree.get_selection()
+    columns = [selection if selection else '1'] + weighttree.variable_formulae(variables)
+    adder = dict(name = name, function = _weights_and_products, length = 2, columns = columns,
+                 args = (function,))
+    # The weights function can change without the input files changing, so always overwrite.
+    return weighttree.add_friend_tree(name, [adder], perfile = perfile, chunksize = chunksize,
+                                      overwrite = True, nthreads = nthreads)
+
+def gbreweight(weighttree, originaltree, name, variables, n = None, chunksize = 100000, perfile = False,
+               nthreads = multiprocessing.cpu_count()):
     '''Use Hep_ml GBReweighter to calculate weights for weighttree to match originaltree in the given variables.
     Adds a friend with branch named 'name' of length 2: the first element is the calculated weight, the second is
-    the product of that weight with any existing weight used for the weighttree (from the selection).'''
+    the product of that weight with any existing weight used for the weighttree (from the selection).
+    The weights are predicted in chunks of chunksize entries; perfile and nthreads are passed to
+    add_weights_friend.'''
     from hep_ml.reweight import GBReweighter
     
     originalweights, originalvals = get_weights_and_vals(originaltree, variables, n)
@@ -135,13 +243,9 @@ def gbreweight(weighttree, originaltree, name, variables, n = None):
     print('Fit GBReweighter', name)
     weighter.fit(original = originalvals, original_weight = originalweights, target = weightedvals,
                  target_weight = weightedweights)
-    weight = weighttree.selection_functor()
-    vals = weighttree.get_functor_list(variables)
-    def get_weight():
-        _w = weighter.predict_weights([vals()])[0]
-        return [_w, _w * weight()]
     print('Add weights for GBReweighter', name)
-    weighttree.add_friend_tree(name, {name : dict(function = get_weight, length = 2)})
+    return add_weights_friend(weighttree, name, variables, weighter.predict_weights, chunksize = chunksize,
+                              perfile = perfile, nthreads = nthreads)
 
 def ratio_histo(weighttree, originaltree, name, variable, variableY = None, variableZ = None):
     '''Get a histogram of the ratio of variables between trees.'''
@@ -165,17 +269,166 @@ def histo_reweight(weighttree, originaltree, name, variable, variableY = None, v
                      variableZ = variableZ)
     return histos
 
-def add_histo_weight(weighttree, hratio, name, variable, variableY = None, variableZ = None, n = None):
-    '''Add a weight from a histogram.'''
+class _AxisArrays(object):
+    '''Copy of the binning of a TAxis as arrays, for vectorised bin lookup.'''
+
+    def __init__(self, axis):
+        self.nbins = axis.GetNbins()
+        self.xmin = axis.GetXmin()
+        self.xmax = axis.GetXmax()
+        xbins = axis.GetXbins()
+        self.edges = numpy.array([xbins[i] for i in xrange(xbins.GetSize())]) if xbins.GetSize() > 0 else None
+        # Take these from the TAxis, including under/overflow bins, so they're exactly the same.
+        allbins = xrange(self.nbins + 2)
+        self.centers = numpy.array([axis.GetBinCenter(i) for i in allbins])
+        self.upedges = numpy.array([axis.GetBinUpEdge(i) for i in allbins])
+        self.widths = numpy.array([axis.GetBinWidth(i) for i in allbins])
+
+    def find_bin(self, x):
+        '''Get the bin numbers of the values, as TAxis::FindFixBin.'''
+        bins = numpy.empty(len(x), dtype = int)
+        under = x < self.xmin
+        over = ~under & ~(x < self.xmax)
+        inrange = ~under & ~over
+        if None is self.edges:
+            bins[inrange] = 1 + (self.nbins * (x[inrange] - self.xmin) / (self.xmax - self.xmin)).astype(int)
+        else:
+            bins[inrange] = numpy.searchsorted(self.edges, x[inrange], side = 'right')
+        bins[under] = 0
+        bins[over] = self.nbins + 1
+        return bins
+
+    def bin_index(self, bins):
+        '''Clip bin numbers to the range of the arrays.'''
+        return numpy.clip(bins, 0, self.nbins + 1)
+
+class HistoInterpolator(object):
+    '''Vectorised lookup of values from a TH1, TH2 or TH3. The bin contents and binning are copied
+    to arrays once, then the values for arrays of coordinates are the same as TH1::Interpolate
+    (or TH1::GetBinContent(TH1::FindFixBin) if interpolate = False) for each set of coordinates.
+    As for TH2/TH3::Interpolate, coordinates outside of the histogram domain give 0, while
+    for TH1 the contents of the first/last bin are used.'''
+
+    def __init__(self, histo, interpolate = True):
+        self.ndim = histo.GetDimension()
+        self.interpolate = interpolate
+        self.axes = [_AxisArrays(axis) for axis in (histo.GetXaxis(), histo.GetYaxis(), histo.GetZaxis())[:self.ndim]]
+        shape = tuple(axis.nbins + 2 for axis in self.axes)
+        contents = numpy.array([histo.GetBinContent(i) for i in xrange(numpy.prod(shape))])
+        # The global bin number is x + (nx + 2) * (y + (ny + 2) * z), so reshape with the
+        # axes in reverse order then transpose, so the contents are indexed as [x, y, z].
+        self.contents = contents.reshape(shape[::-1]).T
+
+    def __call__(self, *values):
+        '''Get the values for arrays of coordinates, one array per dimension.'''
+        if len(values) != self.ndim:
+            raise ValueError('Expected {0} arrays of coordinates, got {1}'.format(self.ndim, len(values)))
+        values = [numpy.asarray(vals, dtype = numpy.float64) for vals in values]
+        if not self.interpolate:
+            return self.contents[tuple(axis.find_bin(vals) for axis, vals in zip(self.axes, values))]
+        return getattr(self, '_interpolate{0}d'.format(self.ndim))(*values)
+
+    def validate(self, histo, *values):
+        '''Check the values for the arrays of coordinates against TH1::Interpolate (or GetBinContent)
+        of the histo. Raises a ValueError if any are different.'''
+        results = self(*values)
+        for i, coords in enumerate(zip(*values)):
+            with Silence():
+                if self.interpolate:
+                    expected = histo.Interpolate(*coords)
+                else:
+                    expected = histo.GetBinContent(histo.FindFixBin(*coords))
+            if not (expected == results[i] or (expected != expected and results[i] != results[i])):
+                raise ValueError('Value for {0!r} is {1!r}, expected {2!r}'.format(coords, results[i], expected))
+        return True
+
+    def _interpolate1d(self, x):
+        '''Same as TH1::Interpolate.'''
+        axis = self.axes[0]
+        contents = self.contents
+        nbins = axis.nbins
+        result = numpy.empty(len(x))
+        below = x <= axis.centers[1]
+        above = ~below & (x >= axis.centers[nbins])
+        result[below] = contents[1]
+        result[above] = contents[nbins]
+        inrange = ~below & ~above
+        x = x[inrange]
+        xbin = axis.find_bin(x)
+        bin0 = axis.bin_index(numpy.where(x <= axis.centers[axis.bin_index(xbin)], xbin - 1, xbin))
+        bin1 = axis.bin_index(bin0 + 1)
+        y0 = contents[bin0]
+        y1 = contents[bin1]
+        x0 = axis.centers[bin0]
+        x1 = axis.centers[bin1]
+        result[inrange] = y0 + (x - x0)*((y1 - y0)/(x1 - x0))
+        return result
+
+    def _interpolate2d(self, x, y):
+        '''Same as TH2::Interpolate.'''
+        xaxis, yaxis = self.axes
+        contents = self.contents
+        result = numpy.zeros(len(x))
+        binx = xaxis.find_bin(x)
+        biny = yaxis.find_bin(y)
+        inrange = (binx >= 1) & (binx <= xaxis.nbins) & (biny >= 1) & (biny <= yaxis.nbins)
+        x, y, binx, biny = x[inrange], y[inrange], binx[inrange], biny[inrange]
+        # Which quadrant of the bin the point is in.
+        right = (xaxis.upedges[binx] - x) <= xaxis.widths[binx]/2
+        upper = (yaxis.upedges[biny] - y) <= yaxis.widths[biny]/2
+        x1 = xaxis.centers[numpy.where(right, binx, binx - 1)]
+        x2 = xaxis.centers[numpy.where(right, binx + 1, binx)]
+        y1 = yaxis.centers[numpy.where(upper, biny, biny - 1)]
+        y2 = yaxis.centers[numpy.where(upper, biny + 1, biny)]
+        binx1 = numpy.maximum(xaxis.find_bin(x1), 1)
+        binx2 = numpy.minimum(xaxis.find_bin(x2), xaxis.nbins)
+        biny1 = numpy.maximum(yaxis.find_bin(y1), 1)
+        biny2 = numpy.minimum(yaxis.find_bin(y2), yaxis.nbins)
+        q11 = contents[binx1, biny1]
+        q12 = contents[binx1, biny2]
+        q21 = contents[binx2, biny1]
+        q22 = contents[binx2, biny2]
+        d = 1.0*(x2 - x1)*(y2 - y1)
+        result[inrange] = 1.0*q11/d*(x2 - x)*(y2 - y) + 1.0*q21/d*(x - x1)*(y2 - y) \
+            + 1.0*q12/d*(x2 - x)*(y - y1) + 1.0*q22/d*(x - x1)*(y - y1)
+        return result
+
+    def _interpolate3d(self, x, y, z):
+        '''Same as TH3::Interpolate.'''
+        contents = self.contents
+        result = numpy.zeros(len(x))
+        lowbins = []
+        for axis, vals in zip(self.axes, (x, y, z)):
+            bins = axis.find_bin(vals)
+            lowbins.append(numpy.where(vals < axis.centers[bins], bins - 1, bins))
+        inrange = numpy.ones(len(x), dtype = bool)
+        for axis, bins in zip(self.axes, lowbins):
+            inrange &= (bins > 0) & (bins + 1 <= axis.nbins)
+        fracs = []
+        for axis, vals, bins in zip(self.axes, (x, y, z), lowbins):
+            vals = vals[inrange]
+            bins = bins[inrange]
+            lowcenters = axis.centers[bins]
+            fracs.append((vals - lowcenters)/(axis.centers[bins + 1] - lowcenters))
+        xd, yd, zd = fracs
+        ubx, uby, ubz = [bins[inrange] for bins in lowbins]
+        obx, oby, obz = ubx + 1, uby + 1, ubz + 1
+        i1 = contents[ubx, uby, ubz] * (1 - zd) + contents[ubx, uby, obz] * zd
+        i2 = contents[ubx, oby, ubz] * (1 - zd) + contents[ubx, oby, obz] * zd
+        j1 = contents[obx, uby, ubz] * (1 - zd) + contents[obx, uby, obz] * zd
+        j2 = contents[obx, oby, ubz] * (1 - zd) + contents[obx, oby, obz] * zd
+        w1 = i1 * (1 - yd) + i2 * yd
+        w2 = j1 * (1 - yd) + j2 * yd
+        result[inrange] = w1 * (1 - xd) + w2 * xd
+        return result
+
+def add_histo_weight(weighttree, hratio, name, variable, variableY = None, variableZ = None, n = None,
+                     interpolate = True, chunksize = 100000, perfile = False, nthreads = multiprocessing.cpu_count()):
+    '''Add a weight from a histogram, using the same values as hratio.Interpolate (or the bin contents
+    if interpolate = False). The weights are calculated for arrays of entries using HistoInterpolator;
+    chunksize, perfile and nthreads are passed to add_weights_friend.'''
     variables = filter(None, [variable, variableY, variableZ])
-    variables = weighttree.get_functor_list(variables)
-    selvar = weighttree.selection_functor()
-    def get_ratio():
-        vals = variables()
-        #bins = [ax.FindBin(v) for v, ax in zip(vals, [hratio.GetXaxis(), hratio.GetYaxis(), hratio.GetZaxis()])]
-        #ratio = hratio.GetBinContent(*bins)
-        with Silence():
-            ratio = hratio.Interpolate(*vals)
-        return [ratio, ratio*selvar()]
-    weighttree.add_friend_tree(name, {name : dict(function = get_ratio, length = 2)})
+    interpolator = HistoInterpolator(hratio, interpolate)
+    add_weights_friend(weighttree, name, variables, lambda vals : interpolator(*vals.T),
+                       chunksize = chunksize, perfile = perfile, nthreads = nthreads)
     return {'success' : True}
@@ -0,0 +1,68 @@
+'''Shared fixtures for the tests. These need ROOT and numpy, and are skipped if they're not available.'''
+
+import os, sys, pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'python'))
+
+def write_tree_file(fname, nentries, seed, treename = 'tree'):
+    '''Write a TTree with float branches x and y, Gaussian distributed, to the given file.'''
+    import ROOT
+    from array import array
+    rndm = ROOT.TRandom3(seed)
+    fout = ROOT.TFile.Open(fname, 'recreate')
+    tree = ROOT.TTree(treename, treename)
+    x = array('f', [0])
+    y = array('f', [0])
+    tree.Branch('x', x, 'x/F')
+    tree.Branch('y', y, 'y/F')
+    for i in xrange(nentries):
+        x[0] = rndm.Gaus(0, 1)
+        y[0] = rndm.Gaus(1, 0.5)
+        tree.Fill()
+    tree.Write()
+    fout.Close()
+    return fname
+
+@pytest.fixture
+def datachain(tmpdir):
+    '''A DataChain of two files of random x & y values in a temporary directory.'''
+    pytest.importorskip('ROOT')
+    pytest.importorskip('numpy')
+    from AnalysisUtils.data import DataChain
+    files = [write_tree_file(str(tmpdir.join('data_{0}.root'.format(i))), 500, i + 1) for i in xrange(2)]
+    return DataChain(name = 'TestData', tree = 'tree', files = files)
+
+def read_branch(fname, treename, branchname):
+    '''Get the values of a branch as a list of lists, one per entry.'''
+    import ROOT
+    fin = ROOT.TFile.Open(fname)
+    tree = fin.Get(treename)
+    vals = []
+    for i in xrange(tree.GetEntries()):
+        tree.GetEntry(i)
+        leaf = tree.GetLeaf(branchname)
+        vals.append([leaf.GetValue(j) for j in xrange(leaf.GetLen())])
+    fin.Close()
+    return vals
+
+def write_selected_tree(datachain, inrange, selection):
+    '''Write a single-file SelectedTree friend for the DataChain, as made by make_roodataset, with
+    branches inrange_all and selection_pass from the given formulae, and return the DataChain
+    rebuilt with it as a friend.'''
+    import ROOT
+    from array import array
+    from AnalysisUtils.treeutils import tree_array
+    values = tree_array(datachain, [inrange, selection])
+    fout = ROOT.TFile.Open(datachain.friend_file_name('SelectedTree', 'SelectedTree', makedir = True), 'recreate')
+    tree = ROOT.TTree('SelectedTree', 'SelectedTree')
+    inrangeall = array('b', [0])
+    selectionpass = array('b', [0])
+    tree.Branch('inrange_all', inrangeall, 'inrange_all/O')
+    tree.Branch('selection_pass', selectionpass, 'selection_pass/O')
+    for inrangeval, selectionval in values:
+        inrangeall[0] = bool(inrangeval)
+        selectionpass[0] = bool(selectionval)
+        tree.Fill()
+    tree.Write()
+    fout.Close()
+    return datachain.clone()
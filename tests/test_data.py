@@ -0,0 +1,25 @@
+'''Tests for AnalysisUtils.data.'''
+
+import os, pytest
+from conftest import read_branch, write_selected_tree
+
+ROOT = pytest.importorskip('ROOT')
+numpy = pytest.importorskip('numpy')
+
+def test_add_friend_arrays_perfile(datachain):
+    nentries = datachain.GetEntries()
+    datachain.add_friend_arrays('n', {'n' : numpy.arange(nentries)}, types = {'n' : 'i'}, perfile = True,
+                                nthreads = 2)
+    values = []
+    for ifile in xrange(datachain.nfiles()):
+        values += read_branch(datachain.friend_file_name('n', 'nTree', ifile), 'nTree', 'n')
+    assert values == [[i] for i in xrange(nentries)]
+
+def test_add_friend_tree_perfile_single_file_friend(datachain):
+    # The SelectedTree has one file, so isn't available per file of the two-file dataset.
+    datachain = write_selected_tree(datachain, 'y < 2', 'x > -1')
+    adder = dict(name = 'sel', function = lambda values : values[:, 0], columns = ['selection_pass'])
+    with pytest.raises(ValueError):
+        datachain.add_friend_tree('sel', [adder], perfile = True, nthreads = 1)
+    assert not any(os.path.exists(datachain.friend_file_name('sel', 'selTree', ifile))
+                   for ifile in xrange(datachain.nfiles()))
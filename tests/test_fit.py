@@ -0,0 +1,101 @@
+'''Tests for AnalysisUtils.fit.'''
+
+import pytest
+from conftest import read_branch, write_selected_tree
+
+ROOT = pytest.importorskip('ROOT')
+numpy = pytest.importorskip('numpy')
+
+from AnalysisUtils.data import DataLibrary
+from AnalysisUtils.fit import add_sideband_subtraction_weights, sideband_subtraction_weight, cached_fit, fit_cache, \
+    pdf_key
+
+@pytest.mark.parametrize('perfile', [False, True])
+def test_add_sideband_subtraction_weights(datachain, perfile):
+    # A two-file dataset with a one-file SelectedTree, as written by make_roodataset.
+    datachain = write_selected_tree(datachain, 'y < 2', 'x > -1.5')
+    datalib = DataLibrary({datachain.name : dict(tree = datachain.tree, files = datachain.files)}, {})
+    x = ROOT.RooRealVar('x', 'x', -5, 5)
+    pdf = ROOT.RooPolynomial('pdf', 'pdf', x)
+    assert add_sideband_subtraction_weights(datalib, datachain.name, 'sbw', 'sbw', pdf, x, -1, 1, 1.5, 4,
+                                            perfile = perfile, nthreads = 2)
+    sidebandweight = sideband_subtraction_weight(pdf, x, -1, 1, 1.5, 4)
+
+    if perfile:
+        fnames = [datachain.friend_file_name('sbw', 'sbw', ifile) for ifile in xrange(datachain.nfiles())]
+    else:
+        fnames = [datachain.friend_file_name('sbw', 'sbw')]
+    weights = []
+    for fname in fnames:
+        weights += read_branch(fname, 'sbw', 'sbw')
+    xvals = []
+    yvals = []
+    for fname in datachain.files:
+        xvals += read_branch(fname, 'tree', 'x')
+        yvals += read_branch(fname, 'tree', 'y')
+    assert len(weights) == len(xvals)
+    for (weight,), (xval,), (yval,) in zip(weights, xvals, yvals):
+        expected = 0.
+        if yval < 2 and xval > -1.5:
+            if -1 <= xval < 1:
+                expected = 1.
+            elif 1.5 <= xval < 4:
+                expected = sidebandweight
+        # The weights are stored as floats.
+        assert weight == pytest.approx(expected, rel = 1e-6)
+
+class GaussModel(object):
+    '''A Gaussian PDF with some generated data.'''
+
+    def __init__(self, seed = 1):
+        self.x = ROOT.RooRealVar('x', 'x', -5, 5)
+        self.mean = ROOT.RooRealVar('mean', 'mean', 0.5, -2, 2)
+        self.sigma = ROOT.RooRealVar('sigma', 'sigma', 1.2, 0.1, 3)
+        self.pdf = ROOT.RooGaussian('gauss', 'gauss', self.x, self.mean, self.sigma)
+        ROOT.RooRandom.randomGenerator().SetSeed(seed)
+        self.data = self.pdf.generate(ROOT.RooArgSet(self.x), 1000)
+
+    def reset(self):
+        '''Set the parameters back to their initial values.'''
+        self.mean.setVal(0.5)
+        self.sigma.setVal(1.2)
+
+    def values(self):
+        return [(var.getVal(), var.getError()) for var in (self.mean, self.sigma)]
+
+def test_cached_fit_round_trip(tmpdir):
+    model = GaussModel()
+    cachedir = str(tmpdir.join('fits'))
+    result = cached_fit(model.pdf, model.data, cachedir)
+    assert result.status() == 0
+    postfit = model.values()
+    ctime = fit_cache(model.pdf, model.data, cachedir).ctime
+
+    # The same fit from the initial values is retrieved from the cache.
+    model.reset()
+    cached = cached_fit(model.pdf, model.data, cachedir)
+    assert model.values() == postfit
+    assert cached.minNll() == result.minNll()
+    model.reset()
+    assert fit_cache(model.pdf, model.data, cachedir).ctime == ctime
+
+    # Starting from the post-fit values (as if they'd been saved in a Workspace) also uses the same cache.
+    cached_fit(model.pdf, model.data, cachedir)
+    assert model.values() == postfit
+    assert fit_cache(model.pdf, model.data, cachedir).ctime == ctime
+    cached_fit(model.pdf, model.data, cachedir)
+    assert model.values() == postfit
+
+def test_pdf_key_server_roles():
+    model = GaussModel()
+    swapped = ROOT.RooGaussian('gauss', 'gauss', model.x, model.sigma, model.mean)
+    assert pdf_key(model.pdf, model.data) != pdf_key(swapped, model.data)
+
+def test_pdf_key_formula():
+    model = GaussModel()
+    args = ROOT.RooArgList(model.mean, model.sigma)
+    form1 = ROOT.RooFormulaVar('width', 'width', 'sigma + 0.1*mean', args)
+    form2 = ROOT.RooFormulaVar('width', 'width', 'sigma - 0.1*mean', args)
+    pdf1 = ROOT.RooGaussian('gauss', 'gauss', model.x, model.mean, form1)
+    pdf2 = ROOT.RooGaussian('gauss', 'gauss', model.x, model.mean, form2)
+    assert pdf_key(pdf1, model.data) != pdf_key(pdf2, model.data)
@@ -0,0 +1,48 @@
+'''Tests for AnalysisUtils.weighting.'''
+
+import pytest
+from conftest import read_branch
+
+ROOT = pytest.importorskip('ROOT')
+numpy = pytest.importorskip('numpy')
+
+from AnalysisUtils.weighting import add_histo_weight, HistoInterpolator
+
+def ratio_histo():
+    '''A small histo of weights to interpolate.'''
+    histo = ROOT.TH1D('hratio', '', 5, -2, 2)
+    histo.SetDirectory(None)
+    for ibin, content in enumerate([0.5, 1., 2., 1.5, 0.8]):
+        histo.SetBinContent(ibin + 1, content)
+    return histo
+
+def check_weights(datachain, fnames, histo):
+    '''Check the weights written to the friend files match TH1::Interpolate for the x values.'''
+    xvals = []
+    for ifile in xrange(datachain.nfiles()):
+        xvals += read_branch(datachain.files[ifile], 'tree', 'x')
+    weights = []
+    for fname in fnames:
+        weights += read_branch(fname, 'wTree', 'w')
+    assert len(weights) == len(xvals)
+    for (x,), (weight, product) in zip(xvals, weights):
+        expected = histo.Interpolate(x)
+        # The weights are stored as floats.
+        assert weight == pytest.approx(expected, rel = 1e-6)
+        assert product == pytest.approx(expected, rel = 1e-6)
+
+def test_histo_interpolator():
+    histo = ratio_histo()
+    values = numpy.linspace(-3, 3, 101)
+    assert HistoInterpolator(histo).validate(histo, values)
+
+def test_add_histo_weight(datachain):
+    histo = ratio_histo()
+    add_histo_weight(datachain, histo, 'w', 'x', nthreads = 1)
+    check_weights(datachain, [datachain.friend_file_name('w', 'wTree')], histo)
+
+def test_add_histo_weight_perfile(datachain):
+    histo = ratio_histo()
+    add_histo_weight(datachain, histo, 'w', 'x', perfile = True, nthreads = 2)
+    check_weights(datachain, [datachain.friend_file_name('w', 'wTree', ifile)
+                              for ifile in xrange(datachain.nfiles())], histo)